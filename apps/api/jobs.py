@@ -0,0 +1,177 @@
+"""
+Summary Jobs Module
+
+This module queues meeting summaries so web workers never wait on the model.
+
+`summarize_meeting` enqueues a `SummaryJob` and returns right away; the
+browser then polls `summary_status` until `run_summary_worker` processes
+have produced the summary:
+- at most one job per meeting is queued or running (a partial unique
+  constraint), so concurrent summarize requests share a single job
+- a job is claimed by a conditional UPDATE from `queued` to `running`, so
+  two workers never run the same job
+- jobs whose worker died are requeued after `SUMMARY_JOB_TIMEOUT_SECONDS`,
+  and failed attempts are retried, up to `MAX_JOB_ATTEMPTS` claims
+"""
+
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F, QuerySet
+from django.utils import timezone
+
+from apps.api.models import SummaryJob
+from apps.director.models import Meeting
+
+MAX_JOB_ATTEMPTS: int = 3  # Claims before a job is marked as failed
+CLAIM_BATCH_SIZE: int = 10  # Queued jobs tried per claim when workers race
+MAX_ERROR_LENGTH: int = 300  # Matches `SummaryJob.error`
+
+
+def get_job_timeout() -> timedelta:
+    """Returns how long a job may run before it is considered abandoned"""
+    return timedelta(seconds=getattr(settings, "SUMMARY_JOB_TIMEOUT_SECONDS", 300))
+
+
+def enqueue_summary_job(meeting: Meeting) -> SummaryJob:
+    """
+    Queues a summary of the meeting unless one is already queued or running.
+
+    Args:
+        meeting: The meeting to summarize
+
+    Returns:
+        The meeting's active job, new or existing
+    """
+    active_job: SummaryJob | None = get_active_summary_job(meeting.id)
+    if active_job:
+        return active_job
+    try:
+        with transaction.atomic():
+            return SummaryJob.objects.create(meeting=meeting)
+    except IntegrityError:
+        # NOTE: A concurrent request queued it first
+        return SummaryJob.objects.get(
+            meeting=meeting, status__in=SummaryJob.ACTIVE_STATUSES
+        )
+
+
+def get_active_summary_job(meeting_id: uuid.UUID) -> SummaryJob | None:
+    """Returns the queued or running job of the meeting, if any"""
+    return SummaryJob.objects.filter(
+        meeting_id=meeting_id, status__in=SummaryJob.ACTIVE_STATUSES
+    ).first()
+
+
+def get_latest_summary_job(meeting_id: uuid.UUID) -> SummaryJob | None:
+    """Returns the most recently queued job of the meeting, if any"""
+    return (
+        SummaryJob.objects.filter(meeting_id=meeting_id).order_by("-created_at").first()
+    )
+
+
+def claim_next_job() -> SummaryJob | None:
+    """
+    Claims the oldest queued job for the calling worker.
+
+    Returns:
+        The job, now `running`; None when the queue is empty
+    """
+    requeue_abandoned_jobs()
+    queued_job_ids: list[uuid.UUID] = list(
+        SummaryJob.objects.filter(status=SummaryJob.Status.QUEUED)
+        .order_by("created_at")
+        .values_list("id", flat=True)[:CLAIM_BATCH_SIZE]
+    )
+    for job_id in queued_job_ids:
+        now = timezone.now()
+        # NOTE: Only one worker's UPDATE matches a job still `queued`
+        claimed: int = SummaryJob.objects.filter(
+            id=job_id, status=SummaryJob.Status.QUEUED
+        ).update(
+            status=SummaryJob.Status.RUNNING,
+            attempts=F("attempts") + 1,
+            started_at=now,
+            updated_at=now,
+        )
+        if claimed:
+            return SummaryJob.objects.select_related("meeting").get(id=job_id)
+    return None
+
+
+def requeue_abandoned_jobs() -> int:
+    """
+    Requeues the running jobs of workers that died, failing exhausted ones.
+
+    Returns:
+        Number of abandoned jobs found
+    """
+    now = timezone.now()
+    abandoned_jobs = SummaryJob.objects.filter(
+        status=SummaryJob.Status.RUNNING, started_at__lt=now - get_job_timeout()
+    )
+    failed_count: int = abandoned_jobs.filter(attempts__gte=MAX_JOB_ATTEMPTS).update(
+        status=SummaryJob.Status.FAILED,
+        error="Summary timed out",
+        finished_at=now,
+        updated_at=now,
+    )
+    requeued_count: int = abandoned_jobs.update(
+        status=SummaryJob.Status.QUEUED, updated_at=now
+    )
+    return failed_count + requeued_count
+
+
+def complete_job(job: SummaryJob) -> bool:
+    """
+    Marks a claimed job as succeeded.
+
+    Returns:
+        False if the job was requeued meanwhile (the claim expired)
+    """
+    now = timezone.now()
+    return bool(
+        _filter_claim(job).update(
+            status=SummaryJob.Status.SUCCEEDED, finished_at=now, updated_at=now
+        )
+    )
+
+
+def fail_job(job: SummaryJob, error: str, retry: bool = True) -> bool:
+    """
+    Requeues a claimed job that failed, or fails it for good.
+
+    Args:
+        job: The claimed job
+        error: What went wrong, shown to the host
+        retry: Whether another attempt may succeed (e.g. a network error)
+
+    Returns:
+        False if the job was requeued meanwhile (the claim expired)
+    """
+    now = timezone.now()
+    if retry and job.attempts < MAX_JOB_ATTEMPTS:
+        return bool(
+            _filter_claim(job).update(
+                status=SummaryJob.Status.QUEUED,
+                error=error[:MAX_ERROR_LENGTH],
+                updated_at=now,
+            )
+        )
+    return bool(
+        _filter_claim(job).update(
+            status=SummaryJob.Status.FAILED,
+            error=error[:MAX_ERROR_LENGTH],
+            finished_at=now,
+            updated_at=now,
+        )
+    )
+
+
+def _filter_claim(job: SummaryJob) -> QuerySet[SummaryJob]:
+    # NOTE: A requeued and reclaimed job has more attempts than this claim
+    return SummaryJob.objects.filter(
+        id=job.id, status=SummaryJob.Status.RUNNING, attempts=job.attempts
+    )
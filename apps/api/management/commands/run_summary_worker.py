@@ -0,0 +1,47 @@
+import signal
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import close_old_connections
+
+from apps.api import jobs
+from apps.api.models import SummaryJob
+from apps.api.summarization import run_summary_job
+
+
+# Usage: python manage.py run_summary_worker (one process per concurrent summary)
+class Command(BaseCommand):
+    help = "Process queued meeting summaries until stopped"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait before checking an empty queue again",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Exit once the queue is empty instead of waiting for new jobs",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.is_stopping: bool = False
+        signal.signal(signal.SIGTERM, self.request_stop)
+        signal.signal(signal.SIGINT, self.request_stop)
+
+        # NOTE: The job in progress is finished before stopping
+        while not self.is_stopping:
+            close_old_connections()
+            job: SummaryJob | None = jobs.claim_next_job()
+            if job:
+                run_summary_job(job)
+                continue
+            if options["burst"]:
+                break
+            time.sleep(options["poll_interval"])
+
+    def request_stop(self, signal_number: int, frame: Any) -> None:
+        self.is_stopping = True
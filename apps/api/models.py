@@ -1,2 +1,47 @@
+import uuid
 
+from django.db import models
+
+from apps.director.models import Meeting
+
+
+# NOTE: SummaryJob queues meeting summaries for `run_summary_worker` (see `jobs.py`)
 # Create your models here.
+class SummaryJob(models.Model):
+    class Status(models.TextChoices):
+        QUEUED = "queued"
+        RUNNING = "running"
+        SUCCEEDED = "succeeded"
+        FAILED = "failed"
+
+    ACTIVE_STATUSES: tuple[str, ...] = (Status.QUEUED, Status.RUNNING)
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    meeting = models.ForeignKey(
+        to=Meeting, on_delete=models.CASCADE, related_name="summary_jobs"
+    )
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.QUEUED
+    )
+    attempts = models.PositiveIntegerField(
+        default=0, help_text="Times a worker claimed the job"
+    )
+    error = models.CharField(max_length=300, blank=True, default="")
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            # NOTE: At most one queued or running summary per meeting
+            models.UniqueConstraint(
+                fields=["meeting"],
+                condition=models.Q(status__in=["queued", "running"]),
+                name="unique_active_summary_job_per_meeting",
+            )
+        ]
+        indexes = [models.Index(fields=["status", "created_at"])]
+
+    def __str__(self) -> str:
+        return f"Summary of {self.meeting_id} ({self.status})"
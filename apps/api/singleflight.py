@@ -0,0 +1,122 @@
+"""
+Single-Flight Module
+
+This module makes concurrent callers share one in-flight computation.
+
+The first caller of a key takes a Redis lock and computes the result; the
+others wait for it instead of computing it again:
+- `singleflight:{key}:lock` is held by the computing caller (SET NX with a
+  timeout, so a crashed caller cannot hold it forever)
+- `singleflight:{key}:done` is the pub/sub channel notified when the lock is
+  released, so waiters wake up as soon as the result is stored
+
+Waiters then load the stored result (e.g. from the cache). If there is none
+(the computation failed), the next waiter takes the lock and tries again.
+"""
+
+import secrets
+import time
+from collections.abc import Callable
+from typing import TypeVar
+
+from django_redis import get_redis_connection
+from redis import Redis
+from redis.exceptions import WatchError
+
+ResultT = TypeVar("ResultT")
+
+WAIT_POLL_SECONDS: float = 1  # Waiters re-check the lock at least this often
+
+
+def get_redis_client() -> Redis:
+    """Returns the client of the Redis server backing the default cache"""
+    # NOTE: django-redis ships without type hints
+    redis_client: Redis = get_redis_connection("default")
+    return redis_client
+
+
+def get_lock_key(key: str) -> str:
+    """Key of the lock held by the computing caller"""
+    return f"singleflight:{key}:lock"
+
+
+def get_done_channel(key: str) -> str:
+    """Channel notified when the computing caller releases the lock"""
+    return f"singleflight:{key}:done"
+
+
+class SingleFlightTimeout(Exception):
+    """Raised when no result was produced in time"""
+
+
+def single_flight(
+    key: str,
+    compute: Callable[[], ResultT],
+    load: Callable[[], ResultT | None],
+    timeout_seconds: float,
+) -> ResultT:
+    """
+    Returns the stored result of a key, computing it at most once at a time.
+
+    Args:
+        key: Identifies the computation, e.g. `summary:{meeting_id}`
+        compute: Produces and stores the result; only run by the lock holder
+        load: Returns the stored result; None if it is not available
+        timeout_seconds: Lock lifetime and maximum wait for another caller
+
+    Returns:
+        The computed or loaded result
+
+    Raises:
+        SingleFlightTimeout: If other callers held the lock for too long
+    """
+    redis_client: Redis = get_redis_client()
+    lock_key: str = get_lock_key(key)
+    deadline: float = time.monotonic() + timeout_seconds
+    while True:
+        token: str = secrets.token_hex(16)
+        if redis_client.set(lock_key, token, nx=True, px=int(timeout_seconds * 1000)):
+            try:
+                # NOTE: The previous holder may have stored it since the caller checked
+                stored_result: ResultT | None = load()
+                return compute() if stored_result is None else stored_result
+            finally:
+                _release(redis_client, key, token)
+
+        _wait_for_release(redis_client, key, deadline)
+        result: ResultT | None = load()
+        if result is not None:
+            return result
+        if time.monotonic() >= deadline:
+            raise SingleFlightTimeout(f"No result for {key} in {timeout_seconds}s")
+
+
+def _release(redis_client: Redis, key: str, token: str) -> None:
+    lock_key: str = get_lock_key(key)
+    # NOTE: Compare-and-delete - the lock may have expired and been taken over
+    with redis_client.pipeline() as pipe:
+        try:
+            pipe.watch(lock_key)
+            if pipe.get(lock_key) in (token, token.encode()):
+                pipe.multi()
+                pipe.delete(lock_key)
+                pipe.execute()
+        except WatchError:
+            pass
+    redis_client.publish(get_done_channel(key), token)
+
+
+def _wait_for_release(redis_client: Redis, key: str, deadline: float) -> None:
+    lock_key: str = get_lock_key(key)
+    pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+    try:
+        pubsub.subscribe(get_done_channel(key))
+        # NOTE: Subscribed before checking, so a release in between is not missed
+        while redis_client.exists(lock_key):
+            remaining_seconds: float = deadline - time.monotonic()
+            if remaining_seconds <= 0:
+                return
+            if pubsub.get_message(timeout=min(remaining_seconds, WAIT_POLL_SECONDS)):
+                return
+    finally:
+        pubsub.close()
@@ -0,0 +1,551 @@
+"""
+Meeting Summarization Module
+
+This module turns the responses of a meeting into its `summarized_meeting`.
+
+The model is only asked to analyze the questions; the metadata (title,
+date, author) is added afterwards to minimize hallucinations. It is called
+through the backend named by `SUMMARY_BACKEND`:
+- `OpenAISummaryBackend` asks GPT-4o mini for a JSON analysis
+- `FakeSummaryBackend` derives a deterministic analysis from the responses,
+  for tests and local development without an API key
+
+Both are `MapReduceSummaryBackend`s: each question (or chunk of
+`RESPONSES_PER_CHUNK` responses) is summarized by its own model call,
+concurrently, then merged, so large meetings never outgrow the context
+window and take about as long as their largest question.
+
+Summaries are produced by `run_summary_worker` processes (see `jobs.py`),
+never inside a web request. Concurrent generations of a meeting share one
+model call (see `singleflight.py`), and saved summaries are cached by
+meeting id so pollers are answered without loading the meeting.
+"""
+
+import logging
+import os
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError
+from django.utils.module_loading import import_string
+from openai import OpenAI
+from openai.types.chat import ChatCompletion
+
+from apps.api import jobs, utils
+from apps.api.models import SummaryJob
+from apps.api.singleflight import single_flight
+from apps.director.models import Meeting
+from apps.meeting import codec
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+SUMMARY_CACHE_TIMEOUT_SECONDS: int = 3600  # Summaries never change once saved
+RESPONSES_PER_CHUNK: int = 100  # Responses summarized by a single model call
+NO_RESPONSES_SUMMARY: str = "No responses were received for this question."
+SYSTEM_PROMPT: str = (
+    "You are a meeting analysis assistant. You analyze questions and responses "
+    "but never generate meeting metadata like titles, dates, or author names."
+)
+
+
+class SummaryError(Exception):
+    """Raised when a meeting cannot be summarized; retrying will not help"""
+
+
+def build_question_prompt(question: str, responses: list[str], is_partial: bool) -> str:
+    """
+    Builds the prompt summarizing the responses of a question.
+
+    Args:
+        question: The question, e.g. "Question 1: How are we doing?"
+        responses: The responses, or one chunk of them
+        is_partial: Whether the responses are only one chunk of the question's
+
+    Returns:
+        The user prompt sent to the model
+    """
+    # ! Summarization PROMPT - only ask AI to analyze questions, not generate metadata
+    scope: str = (
+        "This is only one part of the responses; another step will merge the parts."
+        if is_partial
+        else "These are all the responses to the question."
+    )
+    return f"""
+        Analyze the following meeting question and its responses, then provide a JSON summary of the responses.
+        {scope}
+
+        Format EXACTLY like this (escape all quotes):
+        {{
+        "summary": "[4-5 sentence comprehensive analysis that includes:
+                    - Opening sentence synthesizing the overall theme/consensus
+                    - Specific response perspectives using descriptors ('one participant noted', 'another emphasized')
+                    - Clear identification of agreements, disagreements, or patterns
+                    - Actionable insights or decisions emerging from responses
+                    - Any unresolved questions or conflicting viewpoints]"
+        }}
+
+        Rules:
+        - Lead with overall consensus/theme, then explore different viewpoints
+        - Use descriptors like "one participant suggested", "multiple responses indicated", "another viewpoint emphasized"
+        - Quantify agreement patterns ("three of four responses focused on...")
+        - Use specific numbers and metrics when available
+        - Flag clear disagreements with [DISAGREEMENT] at start of summary
+        - Never invent details not in the source
+
+        Question: {question}
+        Responses:
+        {codec.encode(responses, indent=True)}
+        """
+
+
+def build_merge_prompt(
+    question: str, partial_summaries: list[str], response_count: int
+) -> str:
+    """
+    Builds the prompt merging the summaries of a question's response chunks.
+
+    Args:
+        question: The question
+        partial_summaries: Summary of each chunk of responses
+        response_count: Number of responses across all chunks
+
+    Returns:
+        The user prompt sent to the model
+    """
+    return f"""
+        The {response_count} responses to a meeting question were summarized in parts.
+        Merge the partial summaries below into a single 4-5 sentence analysis of all the responses.
+
+        Format EXACTLY like this (escape all quotes):
+        {{"summary": "[merged analysis]"}}
+
+        Rules:
+        - Lead with overall consensus/theme, then explore different viewpoints
+        - Quantify agreement patterns across all parts
+        - Keep [DISAGREEMENT] at the start if any part flags one
+        - Never invent details not in the partial summaries
+
+        Question: {question}
+        Partial summaries:
+        {codec.encode(partial_summaries, indent=True)}
+        """
+
+
+def build_takeaways_prompt(questions_analysis: list[dict[str, Any]]) -> str:
+    """
+    Builds the prompt drawing the key takeaways from the question summaries.
+
+    Args:
+        questions_analysis: The question, summary and response count of each question
+
+    Returns:
+        The user prompt sent to the model
+    """
+    return f"""
+        Read the following analysis of each meeting question, then provide the key takeaways of the meeting as JSON.
+
+        DO NOT generate meeting metadata (title, date, author) - I will add those separately.
+
+        Format EXACTLY like this (escape all quotes):
+        {{
+        "key_takeaways": [
+            "[Most important decision or consensus with context]",
+            "[Critical unresolved issue requiring follow-up]",
+            "[Strategic insight or pattern identified across responses]",
+            "[Next step or recommendation emerging from discussions]"
+        ]
+        }}
+
+        Rules:
+        - Highlight actionable items and emerging decisions
+        - Identify trends across questions
+        - Never invent details not in the source
+
+        Questions analysis:
+        {codec.encode(questions_analysis, indent=True)}
+        """
+
+
+def get_max_concurrency() -> int:
+    """Returns how many model calls a summary may run at once"""
+    return max(getattr(settings, "SUMMARY_MAX_CONCURRENCY", 4), 1)
+
+
+class SummaryBackend(ABC):
+    """
+    Analyzes the responses of a meeting.
+
+    Backends return the `questions_analysis` and `key_takeaways` of the
+    summary, and raise `SummaryError` when the model's reply is unusable.
+    Other exceptions (e.g. network errors) are retried by the worker.
+    """
+
+    @abstractmethod
+    def analyze(self, question_responses: dict[str, Any]) -> dict[str, Any]:
+        """
+        Args:
+            question_responses: The response texts of each question label
+                (see `utils.format_question_responses`)
+        """
+
+    def analyze_chunks(
+        self, response_chunks: Iterable[utils.ResponseChunk]
+    ) -> dict[str, Any]:
+        """
+        Analyzes a stream of response chunks.
+
+        By default the chunks are collected into the `question_responses`
+        of `analyze`; backends able to summarize as they read override it.
+
+        Args:
+            response_chunks: The chunks of every question, in question order
+                (see `utils.iter_response_chunks`)
+        """
+        question_responses: dict[str, list[str]] = {}
+        for response_chunk in response_chunks:
+            question_responses.setdefault(response_chunk.question, []).extend(
+                response_chunk.responses
+            )
+        return self.analyze(
+            {
+                question: responses or [utils.NO_RESPONSES_PLACEHOLDER]
+                for question, responses in question_responses.items()
+            }
+        )
+
+
+class MapReduceSummaryBackend(SummaryBackend):
+    """
+    Summarizes every question on its own, then the meeting as a whole.
+
+    - map: each chunk of `RESPONSES_PER_CHUNK` responses of each question is
+      summarized by its own model call
+    - reduce: the chunk summaries of a question are merged, and the key
+      takeaways are drawn from the question summaries
+
+    Calls run on at most `SUMMARY_MAX_CONCURRENCY` threads, so prompts stay
+    small and a meeting takes about as long as its largest question.
+    Subclasses implement the three model calls.
+    """
+
+    @abstractmethod
+    def summarize_responses(
+        self, question: str, responses: list[str], is_partial: bool
+    ) -> str:
+        """Summarizes a chunk of responses (see `build_question_prompt`)"""
+
+    @abstractmethod
+    def merge_summaries(
+        self, question: str, partial_summaries: list[str], response_count: int
+    ) -> str:
+        """Merges the chunk summaries of a question (see `build_merge_prompt`)"""
+
+    @abstractmethod
+    def summarize_takeaways(
+        self, questions_analysis: list[dict[str, Any]]
+    ) -> list[str]:
+        """Draws the key takeaways of the meeting (see `build_takeaways_prompt`)"""
+
+    def analyze(self, question_responses: dict[str, Any]) -> dict[str, Any]:
+        return self.analyze_chunks(
+            response_chunk
+            for question, responses in question_responses.items()
+            for response_chunk in utils.chunk_responses(
+                question,
+                [] if responses == [utils.NO_RESPONSES_PLACEHOLDER] else responses,
+                RESPONSES_PER_CHUNK,
+            )
+        )
+
+    def analyze_chunks(
+        self, response_chunks: Iterable[utils.ResponseChunk]
+    ) -> dict[str, Any]:
+        """
+        Analyzes a stream of response chunks as they are read.
+
+        At most twice `SUMMARY_MAX_CONCURRENCY` chunks are held at once, so a
+        meeting streamed from the database never sits in memory as a whole.
+
+        Args:
+            response_chunks: The chunks of every question, in question order
+                (see `utils.iter_response_chunks`)
+
+        Raises:
+            SummaryError: If no question has responses
+        """
+        max_concurrency: int = get_max_concurrency()
+        in_flight_chunks = threading.BoundedSemaphore(max_concurrency * 2)
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        try:
+            chunk_futures: dict[str, list[Future[str]]] = {}
+            response_counts: dict[str, int] = {}
+            for response_chunk in response_chunks:
+                question: str = response_chunk.question
+                futures = chunk_futures.setdefault(question, [])
+                response_counts[question] = response_counts.get(question, 0) + len(
+                    response_chunk.responses
+                )
+                if not response_chunk.responses:
+                    continue
+                # NOTE: Blocks the reader until a call finishes and frees its chunk
+                in_flight_chunks.acquire()
+                future: Future[str] = executor.submit(
+                    self.summarize_responses,
+                    question,
+                    response_chunk.responses,
+                    response_chunk.is_partial,
+                )
+                future.add_done_callback(lambda _: in_flight_chunks.release())
+                futures.append(future)
+            if not any(response_counts.values()):
+                raise SummaryError("The meeting has no responses to summarize")
+
+            # NOTE: Merges are queued once every chunk has been read
+            summary_futures: dict[str, Future[str]] = {}
+            for question, futures in chunk_futures.items():
+                if len(futures) == 1:
+                    summary_futures[question] = futures[0]
+                elif futures:
+                    summary_futures[question] = executor.submit(
+                        self.merge_summaries,
+                        question,
+                        [future.result() for future in futures],
+                        response_counts[question],
+                    )
+
+            questions_analysis: list[dict[str, Any]] = []
+            for question, response_count in response_counts.items():
+                summary_future: Future[str] | None = summary_futures.get(question)
+                questions_analysis.append(
+                    {
+                        "question": question,
+                        "summary": summary_future.result()
+                        if summary_future
+                        else NO_RESPONSES_SUMMARY,
+                        "response_count": response_count,
+                    }
+                )
+        finally:
+            # NOTE: A failed call fails the summary - skip the calls not started yet
+            executor.shutdown(cancel_futures=True)
+        return {
+            "questions_analysis": questions_analysis,
+            "key_takeaways": self.summarize_takeaways(questions_analysis),
+        }
+
+
+class OpenAISummaryBackend(MapReduceSummaryBackend):
+    """Asks GPT-4o mini for each summary and for the takeaways"""
+
+    model: str = "gpt-4o-mini"
+
+    def __init__(self) -> None:
+        # NOTE: The client is thread-safe and shared by every concurrent call
+        self.client: OpenAI = OpenAI(api_key=os.getenv("OPENAI_SECRET_KEY"))
+
+    def summarize_responses(
+        self, question: str, responses: list[str], is_partial: bool
+    ) -> str:
+        return self._complete_summary(
+            build_question_prompt(question, responses, is_partial)
+        )
+
+    def merge_summaries(
+        self, question: str, partial_summaries: list[str], response_count: int
+    ) -> str:
+        return self._complete_summary(
+            build_merge_prompt(question, partial_summaries, response_count)
+        )
+
+    def summarize_takeaways(
+        self, questions_analysis: list[dict[str, Any]]
+    ) -> list[str]:
+        key_takeaways: Any = self._complete(
+            build_takeaways_prompt(questions_analysis)
+        ).get("key_takeaways")
+        if not isinstance(key_takeaways, list):
+            raise SummaryError("The model returned invalid takeaways")
+        return [str(takeaway) for takeaway in key_takeaways]
+
+    def _complete_summary(self, prompt: str) -> str:
+        summary: Any = self._complete(prompt).get("summary")
+        if not isinstance(summary, str) or not summary.strip():
+            raise SummaryError("The model returned an empty summary")
+        return summary
+
+    def _complete(self, prompt: str) -> dict[str, Any]:
+        response: ChatCompletion = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            temperature=0.3,
+            response_format={"type": "json_object"},
+        )
+        response_str: str | None = response.choices[0].message.content
+        if not response_str:
+            raise SummaryError("The model returned an empty summary")
+        try:
+            reply: Any = codec.decode(response_str)
+        except codec.DecodeError as error:
+            raise SummaryError("The model returned an invalid summary") from error
+        if not isinstance(reply, dict):
+            raise SummaryError("The model returned an invalid summary")
+        return reply
+
+
+class FakeSummaryBackend(MapReduceSummaryBackend):
+    """
+    Summarizes without a model: response counts and the first response.
+
+    Each call sleeps `latency_seconds` to stand in for the model round trip.
+    """
+
+    latency_seconds: float = 0
+
+    def summarize_responses(
+        self, question: str, responses: list[str], is_partial: bool
+    ) -> str:
+        time.sleep(self.latency_seconds)
+        return f"{len(responses)} response(s). First: {responses[0]}"
+
+    def merge_summaries(
+        self, question: str, partial_summaries: list[str], response_count: int
+    ) -> str:
+        time.sleep(self.latency_seconds)
+        return f"{response_count} response(s) in {len(partial_summaries)} parts. " + (
+            " ".join(partial_summaries)
+        )
+
+    def summarize_takeaways(
+        self, questions_analysis: list[dict[str, Any]]
+    ) -> list[str]:
+        time.sleep(self.latency_seconds)
+        return [f"{len(questions_analysis)} question(s) were discussed"]
+
+
+_summary_backends: dict[str, SummaryBackend] = {}
+
+
+def get_summary_backend() -> SummaryBackend:
+    """Returns the configured summary backend of this process"""
+    backend_path: str = settings.SUMMARY_BACKEND
+    backend: SummaryBackend | None = _summary_backends.get(backend_path)
+    if backend is None:
+        backend = _summary_backends[backend_path] = import_string(backend_path)()
+    return backend
+
+
+def get_summary_cache_key(meeting_id: uuid.UUID | str) -> str:
+    """Cache key of a meeting's summary"""
+    return f"meeting_summary:{meeting_id}"
+
+
+def get_cached_summary(meeting_id: uuid.UUID | str) -> dict[str, Any] | None:
+    """Returns the cached summary of a meeting; None if it is not cached"""
+    cached_summary: dict[str, Any] | None = cache.get(get_summary_cache_key(meeting_id))
+    return cached_summary
+
+
+def summarize_meeting(meeting_id: uuid.UUID) -> dict[str, Any]:
+    """
+    Returns the summary of a meeting, generating and saving it once.
+
+    Concurrent callers (e.g. a job reclaimed while its first worker is still
+    generating) share a single generation through `single_flight`.
+
+    Args:
+        meeting_id: The UUID of the meeting
+
+    Returns:
+        The meeting's `summarized_meeting`
+
+    Raises:
+        SummaryError: If the meeting has no responses or the reply is unusable
+    """
+    cached_summary: dict[str, Any] | None = get_cached_summary(meeting_id)
+    if cached_summary:
+        return cached_summary
+    return single_flight(
+        f"summary:{meeting_id}",
+        compute=lambda: _generate_summary(meeting_id),
+        load=lambda: get_cached_summary(meeting_id),
+        timeout_seconds=jobs.get_job_timeout().total_seconds(),
+    )
+
+
+def _generate_summary(meeting_id: uuid.UUID) -> dict[str, Any]:
+    meeting_data: dict[str, Any] | None = utils.get_meeting_data(
+        meeting_id=str(meeting_id)
+    )
+    if not meeting_data:
+        raise SummaryError("Meeting not found")
+    meeting: Meeting = meeting_data["meeting"]
+
+    # NOTE: Meetings are to be summarized only once! Always check before u generate a summary
+    if meeting.summarized_meeting and meeting.summarized_meeting != {}:
+        _cache_summary(meeting)
+        saved_summary: dict[str, Any] = meeting.summarized_meeting
+        return saved_summary
+
+    # NOTE: Responses are streamed from the database as the model consumes them
+    ai_analysis: dict[str, Any] = get_summary_backend().analyze_chunks(
+        utils.iter_response_chunks(
+            meeting_data["questions"], meeting_data["responses"], RESPONSES_PER_CHUNK
+        )
+    )
+
+    # NOTE: Manually reconstruct the final summary to minimize ai hallucinations
+    formatted_times: dict[str, str] = utils.format_meeting_time(time=meeting.created_at)
+    summarized_meeting: dict[str, Any] = {
+        "meeting_title": meeting.title,
+        "meeting_description": meeting.description,
+        "date": formatted_times["created_at"],
+        "time_created": formatted_times["time_created"],
+        "author": meeting.director.get_full_name(),
+        "questions_analysis": ai_analysis.get("questions_analysis", []),
+        "key_takeaways": ai_analysis.get("key_takeaways", []),
+    }
+    meeting.summarized_meeting = summarized_meeting
+    try:
+        meeting.save(update_fields=["summarized_meeting", "updated_at"])
+    except IntegrityError as error:
+        raise SummaryError("The summary could not be saved") from error
+    _cache_summary(meeting)
+    return summarized_meeting
+
+
+def _cache_summary(meeting: Meeting) -> None:
+    # NOTE: Stored before the lock is released, so waiters find it
+    cache.set(
+        get_summary_cache_key(meeting.id),
+        meeting.summarized_meeting,
+        SUMMARY_CACHE_TIMEOUT_SECONDS,
+    )
+
+
+def run_summary_job(job: SummaryJob) -> None:
+    """
+    Runs a claimed job and records its outcome.
+
+    Args:
+        job: A job claimed with `jobs.claim_next_job`
+    """
+    try:
+        summarize_meeting(job.meeting_id)
+    except SummaryError as error:
+        jobs.fail_job(job, str(error), retry=False)
+    except Exception:
+        # NOTE: e.g. `OpenAIError` - network and rate limit errors are retried
+        logger.exception("Summary job %s failed", job.id)
+        jobs.fail_job(job, "The summary could not be generated")
+    else:
+        jobs.complete_job(job)
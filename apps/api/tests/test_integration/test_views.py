@@ -0,0 +1,115 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+from django.core.management import call_command
+from django.test import Client
+from django.urls import reverse
+
+from apps.api import summarization, utils
+from apps.api.models import SummaryJob
+from apps.director.models import Meeting, Question
+from apps.meeting.models import Response
+
+
+# ---------- Tests ----------
+# NOTE: The worker closes stale connections between jobs, like in production
+@pytest.mark.django_db(transaction=True)
+def test_summary_is_generated_by_the_worker(
+    client: Client, meeting: Meeting, response: Response
+) -> None:
+    """The request only queues the summary; the worker produces it."""
+    summarize_url = reverse("summarize-meeting", args=[str(meeting.id)])
+    status_url = reverse("summary-status", args=[str(meeting.id)])
+
+    first_reply = client.get(summarize_url).json()
+    assert first_reply == {
+        "type": "pending",
+        "status": SummaryJob.Status.QUEUED,
+        "status_url": status_url,
+    }
+    assert client.get(summarize_url).json()["type"] == "pending"
+    assert SummaryJob.objects.count() == 1
+    assert client.get(status_url).json()["type"] == "pending"
+
+    call_command("run_summary_worker", burst=True)
+
+    assert client.get(status_url).json() == {"type": "success"}
+    assert client.get(summarize_url).json() == {"type": "success"}
+    meeting.refresh_from_db()
+    assert meeting.summarized_meeting["meeting_title"] == meeting.title
+    assert meeting.summarized_meeting["questions_analysis"][0]["response_count"] == 1
+    assert SummaryJob.objects.get().status == SummaryJob.Status.SUCCEEDED
+
+
+@pytest.mark.django_db
+def test_meetings_without_responses_are_not_queued(
+    client: Client, meeting: Meeting
+) -> None:
+    reply = client.get(reverse("summarize-meeting", args=[str(meeting.id)])).json()
+    assert reply == {"type": "error"}
+    assert not SummaryJob.objects.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_unusable_summaries_fail_the_job(
+    client: Client, meeting: Meeting, response: Response
+) -> None:
+    """Jobs that cannot succeed should fail at once with a reason for the host."""
+    client.get(reverse("summarize-meeting", args=[str(meeting.id)]))
+    Response.objects.all().delete()
+
+    call_command("run_summary_worker", burst=True)
+
+    reply = client.get(reverse("summary-status", args=[str(meeting.id)])).json()
+    assert reply == {
+        "type": "error",
+        "message": "The meeting has no responses to summarize",
+    }
+    assert SummaryJob.objects.get().attempts == 1
+
+
+@pytest.mark.django_db
+def test_finished_summaries_are_served_from_the_cache(
+    client: Client,
+    meeting: Meeting,
+    response: Response,
+    django_assert_num_queries: Any,
+) -> None:
+    """Pollers of a summarized meeting should not load it again."""
+    summarization.summarize_meeting(meeting.id)
+    assert summarization.get_cached_summary(meeting.id) == (
+        Meeting.objects.get(id=meeting.id).summarized_meeting
+    )
+
+    with django_assert_num_queries(0):
+        reply = client.get(reverse("summary-status", args=[str(meeting.id)]))
+    assert reply.json() == {"type": "success"}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("export_type", ["pdf", "docx"])
+def test_large_meetings_can_be_exported(
+    client: Client,
+    meeting: Meeting,
+    question: Question,
+    export_type: str,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Questions with hundreds of answers should pass the export validation."""
+    monkeypatch.setattr(utils, "EXPORT_PATH", tmp_path)
+    Response.objects.bulk_create(
+        Response(meeting=meeting, question=question, response_text=f"Answer {n}")
+        for n in range(250)
+    )
+    summarization.summarize_meeting(meeting.id)
+
+    reply = client.post(
+        reverse("export-meeting", args=[str(meeting.id)]),
+        data={"type": export_type},
+        content_type="application/json",
+    ).json()
+
+    assert reply["type"] == "success"
+    assert list(tmp_path.iterdir())
@@ -0,0 +1,73 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from apps.api import jobs
+from apps.api.models import SummaryJob
+from apps.director.models import Meeting
+
+
+# ---------- Tests ----------
+@pytest.mark.django_db
+def test_enqueue_shares_the_active_job_of_a_meeting(meeting: Meeting) -> None:
+    """Concurrent summarize requests should not each pay for a summary."""
+    job = jobs.enqueue_summary_job(meeting)
+    assert jobs.enqueue_summary_job(meeting).id == job.id
+
+    SummaryJob.objects.filter(id=job.id).update(status=SummaryJob.Status.FAILED)
+    assert jobs.enqueue_summary_job(meeting).id != job.id
+
+
+@pytest.mark.django_db
+def test_a_job_is_claimed_by_a_single_worker(meeting: Meeting) -> None:
+    queued_job = jobs.enqueue_summary_job(meeting)
+
+    claimed_job = jobs.claim_next_job()
+    assert claimed_job is not None
+    assert claimed_job.id == queued_job.id
+    assert claimed_job.status == SummaryJob.Status.RUNNING
+    assert claimed_job.attempts == 1
+    assert jobs.claim_next_job() is None
+
+    assert jobs.complete_job(claimed_job)
+    assert SummaryJob.objects.get().status == SummaryJob.Status.SUCCEEDED
+
+
+@pytest.mark.django_db
+def test_abandoned_jobs_are_retried_then_failed(meeting: Meeting) -> None:
+    """Jobs of dead workers should be requeued until attempts run out."""
+    jobs.enqueue_summary_job(meeting)
+    abandoned_at = timezone.now() - jobs.get_job_timeout() - timedelta(seconds=1)
+
+    for attempt in range(1, jobs.MAX_JOB_ATTEMPTS + 1):
+        claimed_job = jobs.claim_next_job()
+        assert claimed_job is not None
+        assert claimed_job.attempts == attempt
+        SummaryJob.objects.filter(id=claimed_job.id).update(started_at=abandoned_at)
+
+    assert jobs.claim_next_job() is None
+    failed_job = SummaryJob.objects.get()
+    assert failed_job.status == SummaryJob.Status.FAILED
+    assert failed_job.error == "Summary timed out"
+
+    # NOTE: The worker that lost its claim must not overwrite the outcome
+    assert claimed_job is not None
+    assert not jobs.complete_job(claimed_job)
+
+
+@pytest.mark.django_db
+def test_failed_attempts_are_retried_unless_final(meeting: Meeting) -> None:
+    jobs.enqueue_summary_job(meeting)
+
+    claimed_job = jobs.claim_next_job()
+    assert claimed_job is not None
+    assert jobs.fail_job(claimed_job, "Connection reset")
+    assert SummaryJob.objects.get().status == SummaryJob.Status.QUEUED
+
+    claimed_job = jobs.claim_next_job()
+    assert claimed_job is not None
+    assert jobs.fail_job(claimed_job, "No responses", retry=False)
+    failed_job = SummaryJob.objects.get()
+    assert failed_job.status == SummaryJob.Status.FAILED
+    assert failed_job.error == "No responses"
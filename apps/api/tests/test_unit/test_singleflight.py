@@ -0,0 +1,66 @@
+import threading
+
+import fakeredis
+import pytest
+
+from apps.api import singleflight
+from apps.api.singleflight import SingleFlightTimeout, single_flight
+
+
+# ---------- Tests ----------
+def test_concurrent_callers_share_one_computation(
+    redis_client: fakeredis.FakeRedis,
+) -> None:
+    """Waiters should be woken with the leader's result instead of recomputing."""
+    stored_results: dict[str, str] = {}
+    compute_calls: list[str] = []
+    leader_started = threading.Event()
+    release_leader = threading.Event()
+
+    def compute() -> str:
+        compute_calls.append(threading.current_thread().name)
+        leader_started.set()
+        release_leader.wait(timeout=5)
+        stored_results["key"] = "summary"
+        return "summary"
+
+    results: list[str] = []
+
+    def call() -> None:
+        results.append(
+            single_flight("key", compute, lambda: stored_results.get("key"), 5)
+        )
+
+    leader = threading.Thread(target=call, name="leader")
+    leader.start()
+    assert leader_started.wait(timeout=5)
+    waiters = [threading.Thread(target=call) for _ in range(3)]
+    for waiter in waiters:
+        waiter.start()
+    release_leader.set()
+    for thread in (leader, *waiters):
+        thread.join(timeout=5)
+
+    assert compute_calls == ["leader"]
+    assert results == ["summary"] * 4
+    assert not redis_client.exists(singleflight.get_lock_key("key"))
+
+
+def test_a_waiter_takes_over_when_the_computation_fails(
+    redis_client: fakeredis.FakeRedis,
+) -> None:
+    # NOTE: Another caller holds the lock and releases it without a result
+    redis_client.set(singleflight.get_lock_key("key"), "other-caller")
+    threading.Timer(
+        0.2, lambda: singleflight._release(redis_client, "key", "other-caller")
+    ).start()
+
+    result = single_flight("key", lambda: "recomputed", lambda: None, 5)
+    assert result == "recomputed"
+
+
+def test_waiters_give_up_after_the_timeout(redis_client: fakeredis.FakeRedis) -> None:
+    redis_client.set(singleflight.get_lock_key("key"), "stuck-caller")
+
+    with pytest.raises(SingleFlightTimeout):
+        single_flight("key", lambda: "never", lambda: None, 0.3)
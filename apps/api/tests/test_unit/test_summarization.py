@@ -0,0 +1,150 @@
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from django.test import override_settings
+
+from apps.api import utils
+from apps.api.summarization import (
+    NO_RESPONSES_SUMMARY,
+    RESPONSES_PER_CHUNK,
+    FakeSummaryBackend,
+    SummaryBackend,
+)
+
+
+class RecordingSummaryBackend(FakeSummaryBackend):
+    """Fake model recording its calls and how many ran at once."""
+
+    latency_seconds = 0.05
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, Any]] = []
+        self.in_flight: int = 0
+        self.max_in_flight: int = 0
+        self.lock = threading.Lock()
+
+    def summarize_responses(
+        self, question: str, responses: list[str], is_partial: bool
+    ) -> str:
+        with self.lock:
+            self.calls.append(("map", (question, len(responses), is_partial)))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return super().summarize_responses(question, responses, is_partial)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def merge_summaries(
+        self, question: str, partial_summaries: list[str], response_count: int
+    ) -> str:
+        with self.lock:
+            self.calls.append(("merge", (question, len(partial_summaries))))
+        return super().merge_summaries(question, partial_summaries, response_count)
+
+
+# ---------- Tests ----------
+def test_large_questions_are_summarized_in_chunks() -> None:
+    """Prompts should stay bounded whatever the number of responses."""
+    backend = RecordingSummaryBackend()
+    response_count: int = RESPONSES_PER_CHUNK * 2 + 50
+    analysis = backend.analyze(
+        {
+            "Question 1: Pricing?": [f"Answer {n}" for n in range(response_count)],
+            "Question 2: Anything else?": [utils.NO_RESPONSES_PLACEHOLDER],
+        }
+    )
+
+    assert sorted(backend.calls) == [
+        ("map", ("Question 1: Pricing?", 50, True)),
+        ("map", ("Question 1: Pricing?", RESPONSES_PER_CHUNK, True)),
+        ("map", ("Question 1: Pricing?", RESPONSES_PER_CHUNK, True)),
+        ("merge", ("Question 1: Pricing?", 3)),
+    ]
+    assert analysis["questions_analysis"] == [
+        {
+            "question": "Question 1: Pricing?",
+            "summary": analysis["questions_analysis"][0]["summary"],
+            "response_count": response_count,
+        },
+        {
+            "question": "Question 2: Anything else?",
+            "summary": NO_RESPONSES_SUMMARY,
+            "response_count": 0,
+        },
+    ]
+    assert analysis["questions_analysis"][0]["summary"].startswith(
+        f"{response_count} response(s) in 3 parts. 100 response(s). First: Answer 0"
+    )
+    assert analysis["key_takeaways"] == ["2 question(s) were discussed"]
+
+
+@override_settings(SUMMARY_MAX_CONCURRENCY=4)
+def test_questions_are_summarized_concurrently_within_the_limit() -> None:
+    """A meeting should take about as long as its slowest question."""
+    backend = RecordingSummaryBackend()
+    question_responses: dict[str, Any] = {
+        f"Question {number}": ["Fine"] for number in range(1, 9)
+    }
+
+    started_at: float = time.perf_counter()
+    analysis = backend.analyze(question_responses)
+    elapsed_seconds: float = time.perf_counter() - started_at
+
+    assert len(analysis["questions_analysis"]) == 8
+    assert backend.max_in_flight == 4
+    # NOTE: Two waves of 4 calls plus the takeaways, instead of 9 sequential calls
+    assert elapsed_seconds < backend.latency_seconds * 6
+
+
+def test_a_failed_call_fails_the_summary() -> None:
+    class FailingSummaryBackend(FakeSummaryBackend):
+        def summarize_responses(
+            self, question: str, responses: list[str], is_partial: bool
+        ) -> str:
+            raise ConnectionError("Model unavailable")
+
+    with pytest.raises(ConnectionError):
+        FailingSummaryBackend().analyze({"Question 1": ["Fine"]})
+
+
+@override_settings(SUMMARY_MAX_CONCURRENCY=2)
+def test_streamed_chunks_are_read_as_calls_finish() -> None:
+    """Only a bounded window of chunks should be read ahead of the model."""
+    backend = RecordingSummaryBackend()
+    read_ahead: list[int] = []
+
+    def iter_chunks() -> Iterator[utils.ResponseChunk]:
+        for n in range(20):
+            with backend.lock:
+                read_ahead.append(n - len(backend.calls))
+            yield utils.ResponseChunk(f"Question {n}", ["Fine"], False)
+
+    analysis = backend.analyze_chunks(iter_chunks())
+
+    assert len(analysis["questions_analysis"]) == 20
+    assert max(read_ahead) <= 2 * 2
+
+
+def test_backends_without_streaming_receive_the_collected_chunks() -> None:
+    """The default `analyze_chunks` should hand whole questions to `analyze`."""
+
+    class WholeMeetingBackend(SummaryBackend):
+        def analyze(self, question_responses: dict[str, Any]) -> dict[str, Any]:
+            return {"questions_analysis": question_responses, "key_takeaways": []}
+
+    analysis = WholeMeetingBackend().analyze_chunks(
+        [
+            utils.ResponseChunk("Question 1", ["Fine", "Good"], True),
+            utils.ResponseChunk("Question 1", ["Great"], True),
+            utils.ResponseChunk("Question 2", [], False),
+        ]
+    )
+    assert analysis["questions_analysis"] == {
+        "Question 1": ["Fine", "Good", "Great"],
+        "Question 2": [utils.NO_RESPONSES_PLACEHOLDER],
+    }
@@ -0,0 +1,71 @@
+from typing import Any
+
+import pytest
+
+from apps.api import summarization, utils
+from apps.director.models import Meeting, Question
+from apps.meeting.models import Response
+
+
+# ---------- Tests ----------
+@pytest.mark.django_db
+def test_responses_are_grouped_by_question(meeting: Meeting) -> None:
+    first_question = Question.objects.create(
+        meeting=meeting, description="Pricing?", position=1
+    )
+    second_question = Question.objects.create(
+        meeting=meeting, description="Anything else?", position=2
+    )
+    rows: list[tuple[int, str]] = [
+        (first_question.id, "Too high"),
+        (first_question.id, "Fair"),
+        (second_question.id + 100, "Answer to another meeting"),
+    ]
+
+    assert utils.format_question_responses(
+        questions=[first_question, second_question], responses=iter(rows)
+    ) == {
+        "Question 1: Pricing?": ["Too high", "Fair"],
+        "Question 2: Anything else?": [utils.NO_RESPONSES_PLACEHOLDER],
+    }
+
+
+@pytest.mark.django_db
+def test_prompt_data_is_loaded_in_constant_queries(
+    meeting: Meeting, django_assert_num_queries: Any
+) -> None:
+    """Thousands of responses should cost one query, not one per response."""
+    questions = [
+        Question.objects.create(meeting=meeting, description=f"Q{n}", position=n)
+        for n in range(1, 4)
+    ]
+    Response.objects.bulk_create(
+        Response(meeting=meeting, question=question, response_text=f"Answer {n}")
+        for question in questions
+        for n in range(500)
+    )
+
+    # NOTE: Meeting and director, questions, streamed responses, summary update
+    with django_assert_num_queries(4):
+        summary = summarization.summarize_meeting(meeting.id)
+
+    assert [
+        question_analysis["response_count"]
+        for question_analysis in summary["questions_analysis"]
+    ] == [500, 500, 500]
+
+
+def test_streamed_responses_are_split_into_chunks() -> None:
+    questions = [
+        utils.QuestionRow(id=7, position=1, description="Pricing?"),
+        utils.QuestionRow(id=3, position=2, description="Anything else?"),
+        utils.QuestionRow(id=5, position=3, description="Next steps?"),
+    ]
+    rows = iter([(7, "A"), (7, "B"), (7, "C"), (5, "D")])
+
+    assert list(utils.iter_response_chunks(questions, rows, chunk_size=2)) == [
+        utils.ResponseChunk("Question 1: Pricing?", ["A", "B"], True),
+        utils.ResponseChunk("Question 1: Pricing?", ["C"], True),
+        utils.ResponseChunk("Question 2: Anything else?", [], False),
+        utils.ResponseChunk("Question 3: Next steps?", ["D"], False),
+    ]
@@ -9,5 +9,10 @@ urlpatterns = [
         view=views.summarize_meeting,
         name="summarize-meeting",
     ),
+    path(
+        "<str:meeting_id>/summarize/status/",
+        view=views.summary_status,
+        name="summary-status",
+    ),
     path("<str:meeting_id>/export/", view=views.export_meeting, name="export-meeting"),
 ]
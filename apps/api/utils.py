@@ -1,15 +1,19 @@
+import itertools
+import operator
 import uuid
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 from zoneinfo import ZoneInfo
 
 from apps.director.models import Meeting, Question
 from apps.meeting.models import Response
 from collaboard import settings
 
-SOFT_MAX_RESPONSES = 200  # Used in validating the AIs provided response count field
+NO_RESPONSES_PLACEHOLDER = "No responses received for this question"
+RESPONSE_ROWS_PER_FETCH = 2000  # Rows fetched per round trip when streaming responses
 
 """
 Summary dict structure:
@@ -237,7 +241,8 @@ def get_summarized_meeting_question_analysis(
                         )
                     return None
                 int_response_count: int = int(str_response_count)
-                if int_response_count < 0 or int_response_count > SOFT_MAX_RESPONSES:
+                # NOTE: Counts are computed by the server, so large meetings are valid
+                if int_response_count < 0:
                     with open("/tmp/debug.log", "a") as f:
                         f.write(
                             f"get_summarized_meeting_question_analysis FAILED - response_count out of range: {int_response_count}\n"
@@ -308,14 +313,45 @@ def get_summarized_meeting_key_takeaways(data: dict[str, Any]) -> list[str] | No
     return key_takeaways
 
 
+class QuestionRow(NamedTuple):
+    """
+    Projection of a Question; duck-types the fields summaries read.
+
+    Attributes:
+        id: The Question id
+        position: Question's index position in the meeting (1-based)
+        description: The question text
+    """
+
+    id: int
+    position: int
+    description: str
+
+
+class ResponseChunk(NamedTuple):
+    """
+    Consecutive responses of one question, in submission order.
+
+    Attributes:
+        question: The question label, e.g. "Question 1: How are we doing?"
+        responses: The response texts; empty for questions without responses
+        is_partial: Whether the question's responses span several chunks
+    """
+
+    question: str
+    responses: list[str]
+    is_partial: bool
+
+
 def get_meeting_data(meeting_id: str) -> dict[str, Any] | None:
     """
     Fetches a meeting object from the database
-    using the provided meeting_id. Then extracts
-    all of its related questions and responses.
+    using the provided meeting_id, along with lazy
+    streams of its questions and responses.
 
-    `Utilizes prefetch_related to additionally retrieve
-    all linked question and response objects to the meeting`
+    Only the fields summaries read are projected, and rows are
+    streamed with `.iterator()` (server-side cursors on PostgreSQL),
+    so memory stays flat however many responses the meeting has.
 
     Returns:
         - dict [str, Any] | None: The meeting info dictionary or None if an error occurs
@@ -324,8 +360,8 @@ def get_meeting_data(meeting_id: str) -> dict[str, Any] | None:
         ```
         {
             "meeting": meeting (Meeting)
-            "questions": [Question]
-            "responses": [Response]
+            "questions": Iterator[QuestionRow]        # Ordered by position
+            "responses": Iterator[tuple[int, str]]    # (question_id, response_text)
         }
         ```
     """
@@ -333,19 +369,17 @@ def get_meeting_data(meeting_id: str) -> dict[str, Any] | None:
         f.write(f"get_meeting_data called with meeting_id: {meeting_id}\n")
 
     try:
-        meeting: Meeting = Meeting.objects.prefetch_related(
-            "questions", "response_set"
-        ).get(id=uuid.UUID(meeting_id))
-        # NOTE: The ignore comments are because the IDE does not recognize the attributes.
-        questions: list[Question] = meeting.questions.all()  # type: ignore
-        responses: list[Response] = meeting.response_set.all()  # type: ignore
-
-        result = {"meeting": meeting, "questions": questions, "responses": responses}
+        meeting: Meeting = Meeting.objects.select_related("director").get(
+            id=uuid.UUID(meeting_id)
+        )
+        result = {
+            "meeting": meeting,
+            "questions": iter_question_rows(meeting.id),
+            "responses": iter_response_rows(meeting.id),
+        }
 
         with open("/tmp/debug.log", "a") as f:
-            f.write(
-                f"get_meeting_data SUCCESS - found meeting: {meeting.title}, questions: {len(questions)}, responses: {len(responses)}\n"
-            )
+            f.write(f"get_meeting_data SUCCESS - found meeting: {meeting.title}\n")
 
         return result
     except (ValueError, Meeting.DoesNotExist) as e:
@@ -354,14 +388,115 @@ def get_meeting_data(meeting_id: str) -> dict[str, Any] | None:
         return None
 
 
+def iter_question_rows(meeting_id: uuid.UUID) -> Iterator[QuestionRow]:
+    """
+    Streams the questions of a meeting, ordered by position.
+
+    Returns:
+        - Iterator[QuestionRow]: `(id, position, description)` rows
+    """
+    question_rows = (
+        Question.objects.filter(meeting_id=meeting_id)
+        .order_by("position")
+        .values_list("id", "position", "description")
+    )
+    for question_row in question_rows.iterator():
+        yield QuestionRow(*question_row)
+
+
+def iter_response_rows(
+    meeting_id: uuid.UUID, chunk_size: int = RESPONSE_ROWS_PER_FETCH
+) -> Iterator[tuple[int, str]]:
+    """
+    Streams the responses of a meeting, grouped by question position.
+
+    Returns:
+        - Iterator[tuple[int, str]]: `(question_id, response_text)` rows, ordered
+          by question position, then submission time
+    """
+    response_rows = (
+        Response.objects.filter(meeting_id=meeting_id)
+        .order_by("question__position", "created_at")
+        .values_list("question_id", "response_text")
+    )
+    yield from response_rows.iterator(chunk_size=chunk_size)
+
+
+def get_question_label(question: Question | QuestionRow) -> str:
+    """Returns the label prompts use for a question, e.g. `Question 1: Pricing?`"""
+    return f"Question {question.position}: {question.description}"
+
+
+def iter_response_chunks(
+    questions: Iterable[QuestionRow],
+    responses: Iterable[tuple[int, str]],
+    chunk_size: int,
+) -> Iterator[ResponseChunk]:
+    """
+    Splits streamed responses into chunks of at most `chunk_size` per question.
+
+    Args:
+        questions: The meeting's questions, ordered by position
+        responses: `(question_id, response_text)` rows in the same question order
+            (see `iter_response_rows`)
+        chunk_size: Maximum number of responses per chunk
+
+    Returns:
+        - Iterator[ResponseChunk]: The chunks of every question in order; a single
+          empty chunk for questions without responses
+    """
+    response_groups = itertools.groupby(responses, key=operator.itemgetter(0))
+    response_group = next(response_groups, None)
+    for question in questions:
+        question_label: str = get_question_label(question)
+        if response_group is None or response_group[0] != question.id:
+            yield ResponseChunk(question_label, [], False)
+            continue
+        yield from chunk_responses(
+            question_label,
+            (response_text for _, response_text in response_group[1]),
+            chunk_size,
+        )
+        response_group = next(response_groups, None)
+
+
+def chunk_responses(
+    question: str, response_texts: Iterable[str], chunk_size: int
+) -> Iterator[ResponseChunk]:
+    """
+    Splits the responses of one question into chunks of at most `chunk_size`.
+
+    Returns:
+        - Iterator[ResponseChunk]: The question's chunks; one empty chunk if it has no responses
+    """
+    response_iterator: Iterator[str] = iter(response_texts)
+    chunk: list[str] = list(itertools.islice(response_iterator, chunk_size))
+    # NOTE: Reads one chunk ahead to know whether the question spans several
+    next_chunk: list[str] = list(itertools.islice(response_iterator, chunk_size))
+    is_partial: bool = bool(next_chunk)
+    yield ResponseChunk(question, chunk, is_partial)
+    while next_chunk:
+        chunk, next_chunk = (
+            next_chunk,
+            list(itertools.islice(response_iterator, chunk_size)),
+        )
+        yield ResponseChunk(question, chunk, is_partial)
+
+
 def format_question_responses(
-    questions: list[Question], responses: list[Response]
+    questions: Iterable[Question | QuestionRow], responses: Iterable[tuple[int, str]]
 ) -> dict[str, Any]:
     """
-    Iterates over both the questions list and the responses list.
+    Groups the responses of a meeting by question in a single pass.
+
     Generates a dictionary of question response combinations
     with the question being the key and a list of it's
-    corresponding responses being the value
+    corresponding responses being the value. Responses are
+    matched by `question_id`, so no Question is fetched per response.
+
+    Args:
+        questions: The meeting's questions, ordered by position
+        responses: `(question_id, response_text)` rows, e.g. `iter_response_rows`
 
     Returns:
         - dict[str, Any]: A dictionary with questions as keys and their responses as values in a list
@@ -374,38 +509,27 @@ def format_question_responses(
         }
         ```
     """
-    with open("/tmp/debug.log", "a") as f:
-        f.write(
-            f"format_question_responses called with {len(questions)} questions, {len(responses)} responses\n"
-        )
+    question_descriptions: dict[int, str] = {
+        question.id: get_question_label(question) for question in questions
+    }
+    responses_by_question: dict[int, list[str]] = {
+        question_id: [] for question_id in question_descriptions
+    }
 
-    # NOTE: This algorithm will be optimized in the future
-    all_questions_descriptions: list[str] = [
-        f"Question {question.position}: {question.description}"
-        for question in questions
-    ]
+    response_count: int = 0
+    for question_id, response_text in responses:
+        question_responses: list[str] | None = responses_by_question.get(question_id)
+        if question_responses is not None:
+            question_responses.append(response_text)
+            response_count += 1
 
     with open("/tmp/debug.log", "a") as f:
         f.write(
-            f"format_question_responses generated questions: {all_questions_descriptions}\n"
+            f"format_question_responses grouped {response_count} responses into {len(question_descriptions)} questions\n"
         )
 
-    all_responses_descriptions: list[list[str]] = []
-    for question in questions:
-        response_descriptions: list[str] = [
-            r.response_text for r in responses if r.question == question
-        ]
-        if not response_descriptions:
-            response_descriptions.append("No responses received for this question")
-        all_responses_descriptions.append(response_descriptions)
-
-    qa_dictionary: dict[str, Any] = {
-        k: v for (k, v) in zip(all_questions_descriptions, all_responses_descriptions)
+    return {
+        question_descriptions[question_id]: question_responses
+        or [NO_RESPONSES_PLACEHOLDER]
+        for question_id, question_responses in responses_by_question.items()
     }
-
-    with open("/tmp/debug.log", "a") as f:
-        f.write(
-            f"format_question_responses returning dictionary with {len(qa_dictionary)} entries\n"
-        )
-
-    return qa_dictionary
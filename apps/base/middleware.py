@@ -0,0 +1,47 @@
+"""
+Session Refresh Middleware Module
+
+Keeps sessions sliding without saving them on every request.
+
+`SESSION_SAVE_EVERY_REQUEST` would write the session (a cache SET plus a
+database UPDATE with `cached_db`) on every page load just to push its
+expiry back. Instead, an active session is re-saved at most once every
+`SESSION_REFRESH_INTERVAL_SECONDS`, which extends its expiry the same way.
+"""
+
+import time
+from collections.abc import Callable
+
+from django.conf import settings
+from django.contrib.auth import SESSION_KEY
+from django.http import HttpRequest, HttpResponse
+
+SESSION_REFRESHED_AT_KEY: str = "_session_refreshed_at"
+
+
+class SessionRefreshMiddleware:
+    """
+    Re-saves signed-in sessions once their last save is older than the interval.
+
+    Must be listed after `SessionMiddleware`.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+        self.refresh_interval: int = getattr(
+            settings, "SESSION_REFRESH_INTERVAL_SECONDS", 300
+        )
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        response: HttpResponse = self.get_response(request)
+        session = getattr(request, "session", None)
+        # NOTE: Sessions saved by this request or without a signed-in user are skipped
+        if session is None or session.modified or not session.get(SESSION_KEY):
+            return response
+
+        now: int = int(time.time())
+        refreshed_at: int = session.get(SESSION_REFRESHED_AT_KEY, 0)
+        if now - refreshed_at >= self.refresh_interval:
+            # NOTE: Marks the session modified; `SessionMiddleware` saves it
+            session[SESSION_REFRESHED_AT_KEY] = now
+        return response
@@ -0,0 +1,48 @@
+import pytest
+from django.contrib.auth.hashers import make_password
+from django.contrib.sessions.backends.cached_db import SessionStore
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory
+
+from apps.base.middleware import SESSION_REFRESHED_AT_KEY, SessionRefreshMiddleware
+from apps.base.models import CustomUser
+
+
+def build_request(session: SessionStore) -> HttpRequest:
+    request = RequestFactory().get("/")
+    request.session = session
+    return request
+
+
+@pytest.mark.django_db
+class TestSessionRefreshMiddleware:
+    """Signed-in sessions slide without being saved on every request."""
+
+    def test_refreshes_signed_in_session_once_per_interval(self) -> None:
+        user = CustomUser.objects.create(
+            email="test@example.com",
+            first_name="John",
+            last_name="Doe",
+            password=make_password("testpass123"),
+        )
+        session = SessionStore()
+        session["_auth_user_id"] = str(user.pk)
+        session.create()
+        middleware = SessionRefreshMiddleware(lambda request: HttpResponse())
+
+        loaded_session = SessionStore(session_key=session.session_key)
+        middleware(build_request(loaded_session))
+        assert loaded_session.modified
+        assert SESSION_REFRESHED_AT_KEY in loaded_session
+        loaded_session.save()
+
+        # NOTE: Within the interval the session is left untouched
+        reloaded_session = SessionStore(session_key=session.session_key)
+        middleware(build_request(reloaded_session))
+        assert not reloaded_session.modified
+
+    def test_ignores_anonymous_sessions(self) -> None:
+        session = SessionStore()
+        SessionRefreshMiddleware(lambda request: HttpResponse())(build_request(session))
+        assert not session.modified
+        assert session.is_empty()
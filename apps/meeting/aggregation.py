@@ -0,0 +1,303 @@
+"""
+Answer Aggregation Module
+
+This module keeps live per-question insight into the answers of running
+meetings, so hosts see what participants say without querying `Response`.
+
+Accepted answers are buffered per meeting and question by the worker that
+received them. Every `MEETING_ANSWER_INSIGHTS_INTERVAL_SECONDS`, the buffers
+of every meeting are folded into Redis and the updated aggregates are read
+back in the same pipeline:
+- `meeting:{access_code}:answers:counts` is a hash of answer counts by
+  question index
+- `meeting:{access_code}:answers:{question_index}:terms` is a sorted set of
+  terms scored by the number of answers mentioning them
+- `meeting:{access_code}:answers:{question_index}:recent` is a list of the
+  latest answers, newest first
+
+Each meeting with new answers then gets one `answer_insights` snapshot per
+interval, whatever the number of answers, e.g.:
+
+    {"type": "answer_insights", "questions": [{"question_index": 0,
+     "answer_count": 37, "top_terms": [["pricing", 12], ...],
+     "recent_answers": ["The pricing page is confusing", ...]}]}
+"""
+
+import asyncio
+import logging
+import re
+from collections import Counter
+from typing import Any
+
+from channels.layers import BaseChannelLayer
+from django.conf import settings
+from redis.asyncio import Redis
+
+from apps.meeting import store, utils
+from apps.meeting.constants import (
+    MEETING_KEY_TIMEOUT_SECONDS,
+    GroupPrefixes,
+    MessageTypes,
+)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+MAX_QUESTIONS: int = 20  # Matches `MeetingSession.current_question_index`
+TOP_TERMS_COUNT: int = 10  # Terms sent to the host per question
+RECENT_ANSWERS_COUNT: int = 5  # Latest answers sent to the host per question
+
+# NOTE: Words of at least three letters; digits and punctuation are ignored
+TERM_PATTERN: re.Pattern[str] = re.compile(r"[^\W\d_]{3,}")
+STOP_WORDS: frozenset[str] = frozenset(
+    {
+        "and", "are", "but", "can", "for", "from", "had", "has", "have", "its",
+        "just", "not", "our", "that", "the", "their", "them", "there", "they",
+        "this", "was", "were", "what", "when", "which", "with", "would", "you",
+        "your",
+    }
+)  # fmt: skip
+
+
+def get_answer_insights_interval() -> float:
+    """Returns the snapshot interval in seconds; 0 disables answer insights"""
+    return getattr(settings, "MEETING_ANSWER_INSIGHTS_INTERVAL_SECONDS", 0)
+
+
+def get_answer_counts_key(meeting_access_code: str) -> str:
+    """Key of the hash counting the answers of each question"""
+    return f"meeting:{meeting_access_code}:answers:counts"
+
+
+def get_answer_terms_key(meeting_access_code: str, question_index: int) -> str:
+    """Key of the sorted set of term frequencies of a question"""
+    return f"meeting:{meeting_access_code}:answers:{question_index}:terms"
+
+
+def get_recent_answers_key(meeting_access_code: str, question_index: int) -> str:
+    """Key of the list of latest answers of a question"""
+    return f"meeting:{meeting_access_code}:answers:{question_index}:recent"
+
+
+def extract_terms(answer_text: str) -> set[str]:
+    """
+    Returns the distinct terms of an answer.
+
+    Args:
+        answer_text: The answer submitted by a participant
+
+    Returns:
+        Lowercase words of at least three letters, stop words excluded
+    """
+    return {
+        term
+        for term in TERM_PATTERN.findall(answer_text.lower())
+        if term not in STOP_WORDS
+    }
+
+
+class QuestionAnswers:
+    """Answers of a single question waiting for the next snapshot"""
+
+    __slots__ = ("answer_count", "term_counts", "recent_answers")
+
+    def __init__(self) -> None:
+        self.answer_count: int = 0
+        self.term_counts: Counter[str] = Counter()
+        self.recent_answers: list[str] = []
+
+
+class AnswerAggregator:
+    """
+    Folds accepted answers into per-question aggregates and snapshots them.
+
+    A single timer task per process flushes the answers of every meeting:
+    one Redis pipeline and one group send per meeting and interval.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[str, dict[int, QuestionAnswers]] = {}
+        self._flush_timer: asyncio.Task[None] | None = None
+
+    def is_enabled(self) -> bool:
+        return get_answer_insights_interval() > 0
+
+    def add_answer(
+        self, meeting_access_code: str, question_index: int, answer_text: str
+    ) -> None:
+        """
+        Buffers an answer accepted for a question of the meeting.
+
+        Args:
+            meeting_access_code: The unique access code of the meeting
+            question_index: Position of the question in the meeting (0-based)
+            answer_text: The validated answer
+        """
+        question_answers: QuestionAnswers = self._get_question_answers(
+            meeting_access_code, question_index
+        )
+        question_answers.answer_count += 1
+        question_answers.term_counts.update(extract_terms(answer_text))
+        # NOTE: Only the newest answers survive `LTRIM` anyway
+        question_answers.recent_answers.append(answer_text)
+        del question_answers.recent_answers[:-RECENT_ANSWERS_COUNT]
+
+    def discard(self, meeting_access_code: str) -> None:
+        """Drops the buffered answers of a meeting that ended"""
+        self._pending.pop(meeting_access_code, None)
+
+    async def flush(self) -> None:
+        """Folds the buffered answers into Redis and sends one snapshot per meeting"""
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        # NOTE: Reads queued after the writes see them - one round trip per shard
+        question_insights_by_meeting: dict[str, list[dict[str, Any]]] = {}
+        for redis_client, access_codes in store.group_by_client(pending).items():
+            read_offsets: list[tuple[str, int, int]] = []
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for meeting_access_code in access_codes:
+                    for question_index, question_answers in pending[
+                        meeting_access_code
+                    ].items():
+                        _queue_fold(
+                            pipe, meeting_access_code, question_index, question_answers
+                        )
+                        read_offsets.append(
+                            (meeting_access_code, question_index, len(pipe))
+                        )
+                        _queue_read(pipe, meeting_access_code, question_index)
+                results: list[Any] = await pipe.execute()
+            for meeting_access_code, question_index, offset in read_offsets:
+                question_insights_by_meeting.setdefault(meeting_access_code, []).append(
+                    _build_question_insight(
+                        question_index, *results[offset : offset + 3]
+                    )
+                )
+
+        channel_layer: BaseChannelLayer = utils.get_meeting_channel_layer()
+        for (
+            meeting_access_code,
+            question_insights,
+        ) in question_insights_by_meeting.items():
+            await channel_layer.group_send(
+                f"{GroupPrefixes.HOST}{meeting_access_code}",
+                {"type": MessageTypes.ANSWER_INSIGHTS, "questions": question_insights},
+            )
+
+    def _get_question_answers(
+        self, meeting_access_code: str, question_index: int
+    ) -> QuestionAnswers:
+        questions = self._pending.setdefault(meeting_access_code, {})
+        question_answers = questions.get(question_index)
+        if question_answers is None:
+            question_answers = questions[question_index] = QuestionAnswers()
+        if (
+            self._flush_timer is None
+            or self._flush_timer.done()
+            or self._flush_timer.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._flush_timer = asyncio.create_task(self._flush_after_interval())
+        return question_answers
+
+    async def _flush_after_interval(self) -> None:
+        await asyncio.sleep(get_answer_insights_interval())
+        # NOTE: Answers arriving during the flush start the next window
+        self._flush_timer = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Answer insights flush failed")
+
+
+def _queue_fold(
+    pipe: Any,
+    meeting_access_code: str,
+    question_index: int,
+    question_answers: QuestionAnswers,
+) -> None:
+    counts_key: str = get_answer_counts_key(meeting_access_code)
+    terms_key: str = get_answer_terms_key(meeting_access_code, question_index)
+    recent_key: str = get_recent_answers_key(meeting_access_code, question_index)
+    pipe.hincrby(counts_key, question_index, question_answers.answer_count)
+    pipe.lpush(recent_key, *question_answers.recent_answers)
+    pipe.ltrim(recent_key, 0, RECENT_ANSWERS_COUNT - 1)
+    for term, term_count in question_answers.term_counts.items():
+        pipe.zincrby(terms_key, term_count, term)
+    for key in (counts_key, terms_key, recent_key):
+        pipe.expire(key, MEETING_KEY_TIMEOUT_SECONDS)
+
+
+def _queue_read(pipe: Any, meeting_access_code: str, question_index: int) -> None:
+    pipe.hget(get_answer_counts_key(meeting_access_code), question_index)
+    pipe.zrevrange(
+        get_answer_terms_key(meeting_access_code, question_index),
+        0,
+        TOP_TERMS_COUNT - 1,
+        withscores=True,
+    )
+    pipe.lrange(
+        get_recent_answers_key(meeting_access_code, question_index),
+        0,
+        RECENT_ANSWERS_COUNT - 1,
+    )
+
+
+def _build_question_insight(
+    question_index: int,
+    answer_count: str | None,
+    top_terms: list[tuple[str, float]],
+    recent_answers: list[str],
+) -> dict[str, Any]:
+    return {
+        "question_index": question_index,
+        "answer_count": int(answer_count or 0),
+        "top_terms": [[term, int(term_count)] for term, term_count in top_terms],
+        "recent_answers": recent_answers,
+    }
+
+
+async def get_answer_insights(
+    meeting_access_code: str, question_indexes: list[int]
+) -> list[dict[str, Any]]:
+    """
+    Reads the aggregates of several questions with a single round trip.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+        question_indexes: Positions of the questions in the meeting
+
+    Returns:
+        The insight of each question that received answers
+    """
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for question_index in question_indexes:
+            _queue_read(pipe, meeting_access_code, question_index)
+        results: list[Any] = await pipe.execute()
+    question_insights: list[dict[str, Any]] = []
+    for position, question_index in enumerate(question_indexes):
+        question_insight: dict[str, Any] = _build_question_insight(
+            question_index, *results[position * 3 : position * 3 + 3]
+        )
+        if question_insight["answer_count"]:
+            question_insights.append(question_insight)
+    return question_insights
+
+
+async def clear_answer_insights(meeting_access_code: str) -> None:
+    """
+    Deletes the aggregates of a meeting that ended.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+    """
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    keys: list[str] = [get_answer_counts_key(meeting_access_code)]
+    for question_index in range(MAX_QUESTIONS):
+        keys.append(get_answer_terms_key(meeting_access_code, question_index))
+        keys.append(get_recent_answers_key(meeting_access_code, question_index))
+    await redis_client.delete(*keys)
+
+
+# NOTE: Shared by every participant consumer in this process
+answer_insights = AnswerAggregator()
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class MeetingConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.meeting"
+
+    def ready(self) -> None:
+        from apps.meeting.instrumentation import install_query_timer
+
+        install_query_timer()
@@ -5,11 +5,19 @@ This class acts as the parent of both
 consumer classes in `consumers.py`
 """
 
-import json
+import time
 from typing import Any
 
+from channels.exceptions import StopConsumer
 from channels.generic.websocket import AsyncWebsocketConsumer
 
+from apps.meeting import codec
+from apps.meeting.instrumentation import (
+    Instrumentation,
+    current_meeting,
+    get_instrumentation,
+)
+
 
 class BaseMeetingConsumer(AsyncWebsocketConsumer):
     """Base class for meeting consumers with shared functionality"""
@@ -23,16 +31,92 @@ class BaseMeetingConsumer(AsyncWebsocketConsumer):
         super().__init__(*args, **kwargs)
         self.group_name: str = ""  # Filled manually in `consumers.py`
         self.access_code: str = ""  # Filled manually in `consumers.py`
+        self.is_binary_protocol: bool = False  # Negotiated in `_accept`
 
     """
     Below are the instance methods 
     for THIS class
     """
 
+    async def dispatch(self, message: dict[str, Any]) -> None:
+        """
+        Dispatches a message to its handler, reporting the handler's duration.
+
+        Client frames are left to the `@instrumented` frame handlers
+        so each one is only counted once.
+
+        The meeting's access code is exposed through `current_meeting`
+        so nested handlers, group sends and queries are attributed to it.
+        """
+        instrumentation: Instrumentation | None = get_instrumentation()
+        if instrumentation is None:
+            await super().dispatch(message)
+            return
+
+        meeting_access_code: str = getattr(self, "meeting_access_code", "")
+        context_token = current_meeting.set(meeting_access_code)
+        if message["type"] == "websocket.receive":
+            # NOTE: Client frames are routed to `@instrumented` handlers,
+            # which report themselves under their own name
+            try:
+                await super().dispatch(message)
+            finally:
+                current_meeting.reset(context_token)
+            return
+
+        started_at: float = time.perf_counter()
+        failed: bool = False
+        try:
+            await super().dispatch(message)
+        except StopConsumer:
+            raise
+        except Exception:
+            failed = True
+            raise
+        finally:
+            instrumentation.handler_finished(
+                handler=message["type"],
+                meeting_access_code=getattr(
+                    self, "meeting_access_code", meeting_access_code
+                ),
+                duration=time.perf_counter() - started_at,
+                failed=failed,
+            )
+            current_meeting.reset(context_token)
+
     def _get_url_route(self) -> dict[str, Any] | None:
         """Get URL route from scope"""
         return self.scope.get("url_route")
 
+    async def _accept(self) -> None:
+        """
+        Accepts the connection with the subprotocol offered by the client.
+
+        Clients offering `collaboard.msgpack.v1` exchange binary MessagePack
+        frames; every other client keeps the JSON text protocol.
+        """
+        subprotocol: str | None = codec.negotiate_subprotocol(
+            self.scope.get("subprotocols", [])
+        )
+        self.is_binary_protocol = subprotocol == codec.MSGPACK_SUBPROTOCOL
+        await self.accept(subprotocol=subprotocol)
+
+    def _decode_frame(
+        self,
+        text_data: str | None,
+        bytes_data: bytes | None,
+        schemas: dict[str, codec.FrameSchema],
+    ) -> dict[str, Any]:
+        """
+        Decodes and validates a client frame of either protocol.
+
+        Raises:
+            codec.DecodeError: If the frame is malformed or unexpected
+        """
+        if bytes_data is not None:
+            return codec.decode_binary_frame(bytes_data, schemas)
+        return codec.decode_frame(text_data or "", schemas)
+
     async def _close_with_log(self, message: str, code: int = 1000) -> None:
         """Close connection with logging"""
         print(message)
@@ -41,9 +125,48 @@ class BaseMeetingConsumer(AsyncWebsocketConsumer):
     async def _send_json(self, data: dict[str, Any]) -> None:
         """
         Send JSON data to client
-        `Automatically converts data to JSON format`
+        `Automatically converts data to JSON or MessagePack (see `codec`)`
+        """
+        if self.is_binary_protocol:
+            await self.send(bytes_data=codec.encode_binary(data))
+            return
+        await self.send(text_data=codec.encode(data))
+
+    async def _group_send(self, group: str, message: dict[str, Any]) -> None:
+        """
+        Send a message to a channel layer group
+        `Reports the send duration to the instrumentation backend`
+        """
+        instrumentation: Instrumentation | None = get_instrumentation()
+        if instrumentation is None:
+            await self.channel_layer.group_send(group, message)
+            return
+
+        started_at: float = time.perf_counter()
+        try:
+            await self.channel_layer.group_send(group, message)
+        finally:
+            instrumentation.group_send_finished(
+                meeting_access_code=current_meeting.get(),
+                duration=time.perf_counter() - started_at,
+            )
+
+    @staticmethod
+    def _get_question_reference(event: dict[str, Any]) -> dict[str, Any]:
+        """
+        Extracts the question reference carried by a message.
+
+        Index addressing (`question_index`, 0-based position) is preferred;
+        the full `question` text is only kept for legacy clients.
+        Returns an empty dict if the message references no question.
         """
-        await self.send(text_data=json.dumps(data))
+        question_index = event.get("question_index")
+        if isinstance(question_index, int) and not isinstance(question_index, bool):
+            return {"question_index": question_index}
+        question_text = event.get("question")
+        if isinstance(question_text, str) and question_text:
+            return {"question": question_text}
+        return {}
 
     async def disconnect(self, code: int) -> None:
         """Clean up on disconnect"""
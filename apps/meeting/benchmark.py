@@ -0,0 +1,469 @@
+"""
+Meeting Benchmark Module
+
+This module drives the meeting consumers in-process to measure how many
+participants a single worker can serve.
+
+One `HostMeetingConsumer` and N `ParticipantMeetingConsumer`s are connected
+through `WebsocketCommunicator` and run a full meeting:
+join -> start_meeting -> (submit_answer burst -> next_question)* -> end_meeting
+
+The report contains p50/p99 latencies per message type, the frames per
+second handled by the worker, the average frame size and the database
+queries per answer. Participants use the JSON text protocol, or the binary
+`collaboard.msgpack.v1` protocol when `binary_protocol` is set. It is
+used as a regression baseline for hot-path changes (see `bench_meeting`).
+
+Running one benchmark per process at once (`WorkerScalingReport`) measures
+how the meeting flow scales with the number of workers.
+"""
+
+import asyncio
+import time
+import uuid
+from collections import defaultdict
+from importlib import import_module
+from typing import Any, NamedTuple
+
+import msgpack
+from asgiref.sync import sync_to_async
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.db import connections
+from django.urls import get_resolver
+
+from apps.base.models import CustomUser
+from apps.director.models import Meeting, Question
+from apps.director.views import generate_access_code
+from apps.meeting import codec
+from apps.meeting.constants import MessageTypes
+from apps.meeting.ingestion import response_queue
+from apps.meeting.routing import websocket_urlpatterns
+
+RECEIVE_TIMEOUT_SECONDS: float = 10  # A frame slower than this fails the benchmark
+
+
+class LatencySummary(NamedTuple):
+    """
+    Latency distribution of one message type.
+
+    Attributes:
+        message_type: The measured message type
+        samples: Number of measured messages
+        p50_ms: Median latency in milliseconds
+        p99_ms: 99th percentile latency in milliseconds
+    """
+
+    message_type: str
+    samples: int
+    p50_ms: float
+    p99_ms: float
+
+
+class BenchmarkReport(NamedTuple):
+    """
+    Results of a benchmark run.
+
+    Attributes:
+        participant_count: Number of connected participants
+        latencies: Latency distribution per message type
+        frame_count: WebSocket frames sent and received by all clients
+        byte_count: Payload bytes of those frames
+        elapsed_seconds: Wall-clock duration of the meeting
+        answer_count: Number of answers submitted
+        answer_query_count: Database queries issued while handling answers
+    """
+
+    participant_count: int
+    latencies: list[LatencySummary]
+    frame_count: int
+    byte_count: int
+    elapsed_seconds: float
+    answer_count: int
+    answer_query_count: int
+
+    @property
+    def frames_per_second(self) -> float:
+        return self.frame_count / self.elapsed_seconds if self.elapsed_seconds else 0
+
+    @property
+    def bytes_per_frame(self) -> float:
+        return self.byte_count / self.frame_count if self.frame_count else 0
+
+    @property
+    def queries_per_answer(self) -> float:
+        return self.answer_query_count / self.answer_count if self.answer_count else 0
+
+
+class WorkerScalingReport(NamedTuple):
+    """
+    Results of one benchmark per worker process, run concurrently.
+
+    Each worker serves a whole meeting, like production workers behind
+    sticky meeting routing, so the aggregate throughput shows how the
+    meeting flow scales with the number of processes.
+
+    Attributes:
+        reports: Report of the meeting run by each worker
+    """
+
+    reports: list[BenchmarkReport]
+
+    @property
+    def worker_count(self) -> int:
+        return len(self.reports)
+
+    @property
+    def participant_count(self) -> int:
+        return sum(report.participant_count for report in self.reports)
+
+    @property
+    def frames_per_second(self) -> float:
+        # NOTE: Conservative - assumes the slowest meeting overlapped all others
+        elapsed_seconds: float = max(
+            (report.elapsed_seconds for report in self.reports), default=0
+        )
+        frame_count: int = sum(report.frame_count for report in self.reports)
+        return frame_count / elapsed_seconds if elapsed_seconds else 0
+
+    def get_p99_ms(self, message_type: str) -> float:
+        """Returns the worst p99 latency of a message type across workers"""
+        return max(
+            (
+                latency.p99_ms
+                for report in self.reports
+                for latency in report.latencies
+                if latency.message_type == message_type
+            ),
+            default=0,
+        )
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """
+    Returns the nearest-rank percentile of the samples.
+
+    Args:
+        samples: The measured values
+        fraction: The percentile as a fraction (e.g. 0.99)
+    """
+    if not samples:
+        return 0.0
+    ordered_samples: list[float] = sorted(samples)
+    rank: int = max(int(round(fraction * len(ordered_samples))) - 1, 0)
+    return ordered_samples[min(rank, len(ordered_samples) - 1)]
+
+
+class QueryCounter:
+    """
+    Counts the queries executed on every database connection it is installed on.
+
+    Installed as a Django execute wrapper, so it also sees the queries of
+    `database_sync_to_async` helpers running in the worker thread.
+    """
+
+    def __init__(self) -> None:
+        self.query_count: int = 0
+
+    def __call__(
+        self, execute: Any, sql: str, params: Any, many: bool, context: Any
+    ) -> Any:
+        self.query_count += 1
+        return execute(sql, params, many, context)
+
+    def install(self) -> None:
+        """Installs the counter on the connections of the calling thread"""
+        for connection in connections.all():
+            if self not in connection.execute_wrappers:
+                connection.execute_wrappers.append(self)
+
+    def uninstall(self) -> None:
+        """Removes the counter from the connections of the calling thread"""
+        for connection in connections.all():
+            if self in connection.execute_wrappers:
+                connection.execute_wrappers.remove(self)
+
+
+class MeetingBenchmark:
+    """
+    Runs one meeting with a host and N participants and measures it.
+
+    Args:
+        participant_count: Number of participants joining the meeting
+        question_count: Number of questions presented
+        answers_per_question: Answers each participant submits per question
+        binary_protocol: Whether participants negotiate `collaboard.msgpack.v1`
+    """
+
+    def __init__(
+        self,
+        participant_count: int,
+        question_count: int,
+        answers_per_question: int,
+        binary_protocol: bool = False,
+    ):
+        self.participant_count: int = participant_count
+        self.question_count: int = question_count
+        self.answers_per_question: int = answers_per_question
+        self.binary_protocol: bool = binary_protocol
+        # NOTE: channels-stubs only accept channels' own URL pattern types
+        self.application = URLRouter(websocket_urlpatterns)  # type: ignore[arg-type]
+        self.latency_samples: defaultdict[str, list[float]] = defaultdict(list)
+        self.frame_count: int = 0
+        self.byte_count: int = 0
+        self.query_counter = QueryCounter()
+
+    async def run(self) -> BenchmarkReport:
+        """Creates a throwaway meeting, runs it and deletes it afterwards"""
+        # NOTE: Import the URLconf up front; the first `reverse` would skew end_meeting
+        await sync_to_async(lambda: get_resolver().url_patterns)()
+        user, meeting, session_key = await sync_to_async(self._create_meeting)()
+        await sync_to_async(self.query_counter.install)()
+        try:
+            return await self._run_meeting(meeting, session_key)
+        finally:
+            await sync_to_async(self.query_counter.uninstall)()
+            await user.adelete()
+
+    def _create_meeting(self) -> tuple[CustomUser, Meeting, str]:
+        benchmark_id: str = uuid.uuid4().hex[:12]
+        user: CustomUser = CustomUser.objects.create(
+            email=f"bench-{benchmark_id}@collaboard.invalid",
+            first_name="Bench",
+            last_name="Host",
+            password=make_password(None),
+        )
+        meeting: Meeting = Meeting.objects.create(
+            access_code=generate_access_code(),
+            director=user,
+            title="Benchmark",
+            description="Load test meeting",
+            duration=60,
+        )
+        Question.objects.bulk_create(
+            Question(
+                meeting=meeting, description=f"Question {position}", position=position
+            )
+            for position in range(1, self.question_count + 1)
+        )
+
+        # NOTE: Use the configured engine so host authentication reads the cache
+        session = import_module(settings.SESSION_ENGINE).SessionStore()
+        session["_auth_user_id"] = str(user.pk)
+        session.create()
+        return user, meeting, str(session.session_key)
+
+    async def _run_meeting(self, meeting: Meeting, session_key: str) -> BenchmarkReport:
+        started_at: float = time.perf_counter()
+
+        # NOTE: Host connects and opens the meeting for joins
+        host = WebsocketCommunicator(
+            self.application, f"/ws/meeting/{meeting.id}/host/"
+        )
+        await host.connect()
+        await self._send(
+            host, {"type": MessageTypes.AUTHENTICATE, "session_id": session_key}
+        )
+        await self._receive_until(host, MessageTypes.ROSTER)
+
+        # NOTE: Join storm
+        participants: list[WebsocketCommunicator] = list(
+            await asyncio.gather(
+                *(
+                    self._join(meeting, f"Participant {number}")
+                    for number in range(self.participant_count)
+                )
+            )
+        )
+        await self._receive_host_events(
+            host, MessageTypes.PARTICIPANT_JOINED, "joined", len(participants)
+        )
+
+        answer_count: int = 0
+        answer_query_count: int = 0
+        for question_index in range(self.question_count):
+            # NOTE: Questions are fanned out to every participant
+            question_message_type: str = (
+                MessageTypes.START_MEETING
+                if question_index == 0
+                else MessageTypes.NEXT_QUESTION
+            )
+            await self._broadcast(
+                host,
+                participants,
+                {"type": question_message_type, "question_index": question_index},
+            )
+
+            # NOTE: Every participant answers; the host is notified of each answer
+            queries_before: int = self.query_counter.query_count
+            for _ in range(self.answers_per_question):
+                await self._answer_burst(host, participants, question_index)
+                answer_count += len(participants)
+            await response_queue.flush()
+            answer_query_count += self.query_counter.query_count - queries_before
+
+        await self._broadcast(host, participants, {"type": MessageTypes.END_MEETING})
+        await self._receive_until(host, MessageTypes.END_MEETING)
+        elapsed_seconds: float = time.perf_counter() - started_at
+
+        await asyncio.gather(
+            host.disconnect(),
+            *(participant.disconnect() for participant in participants),
+        )
+        return BenchmarkReport(
+            participant_count=self.participant_count,
+            latencies=[
+                LatencySummary(
+                    message_type=message_type,
+                    samples=len(samples),
+                    p50_ms=percentile(samples, 0.5) * 1000,
+                    p99_ms=percentile(samples, 0.99) * 1000,
+                )
+                for message_type, samples in self.latency_samples.items()
+            ],
+            frame_count=self.frame_count,
+            byte_count=self.byte_count,
+            elapsed_seconds=elapsed_seconds,
+            answer_count=answer_count,
+            answer_query_count=answer_query_count,
+        )
+
+    async def _join(self, meeting: Meeting, name: str) -> WebsocketCommunicator:
+        """Measures the time from the join request to the question list"""
+        participant = WebsocketCommunicator(
+            self.application,
+            f"/ws/meeting/{meeting.access_code}/participant/",
+            subprotocols=[codec.MSGPACK_SUBPROTOCOL] if self.binary_protocol else None,
+        )
+        await participant.connect()
+        sent_at: float = time.perf_counter()
+        await self._send(
+            participant,
+            {"type": MessageTypes.PARTICIPANT_JOINED, "name": name},
+            binary=self.binary_protocol,
+        )
+        await self._receive_until(participant, MessageTypes.QUESTIONS)
+        self.latency_samples[MessageTypes.PARTICIPANT_JOINED].append(
+            time.perf_counter() - sent_at
+        )
+        return participant
+
+    async def _broadcast(
+        self,
+        host: WebsocketCommunicator,
+        participants: list[WebsocketCommunicator],
+        message: dict[str, Any],
+    ) -> None:
+        """Measures the time from a host message to its delivery to each participant"""
+        sent_at: float = time.perf_counter()
+        await self._send(host, message)
+
+        async def receive_broadcast(participant: WebsocketCommunicator) -> None:
+            await self._receive_until(participant, message["type"])
+            self.latency_samples[message["type"]].append(time.perf_counter() - sent_at)
+
+        await asyncio.gather(
+            *(receive_broadcast(participant) for participant in participants)
+        )
+
+    async def _answer_burst(
+        self,
+        host: WebsocketCommunicator,
+        participants: list[WebsocketCommunicator],
+        question_index: int,
+    ) -> None:
+        """
+        Measures the time from each answer to the host's notification.
+
+        Notifications are anonymous, so the i-th notification is paired
+        with the i-th submitted answer.
+        """
+        sent_times: list[float] = []
+        for number, participant in enumerate(participants):
+            sent_times.append(time.perf_counter())
+            await self._send(
+                participant,
+                {
+                    "type": MessageTypes.SUBMIT_ANSWER,
+                    "answer": f"Answer {number}",
+                    "question_index": question_index,
+                },
+                binary=self.binary_protocol,
+            )
+        arrival_times: list[float] = await self._receive_host_events(
+            host, MessageTypes.ANSWER_SUBMITTED, "answers", len(sent_times)
+        )
+        self.latency_samples[MessageTypes.SUBMIT_ANSWER].extend(
+            arrived_at - sent_at
+            for sent_at, arrived_at in zip(sent_times, arrival_times)
+        )
+
+    async def _receive_host_events(
+        self,
+        host: WebsocketCommunicator,
+        message_type: str,
+        update_field: str,
+        event_count: int,
+    ) -> list[float]:
+        """
+        Returns the arrival time of each host notification of the given kind.
+
+        Notifications arrive one per frame, or batched in `host_update`
+        deltas when the host update coalescer is enabled.
+        """
+        arrival_times: list[float] = []
+        while len(arrival_times) < event_count:
+            message: dict[str, Any] = await self._receive(host)
+            if message["type"] == message_type:
+                batched_event_count: int = 1
+            elif message["type"] == MessageTypes.HOST_UPDATE:
+                update_value: int | list[Any] = message[update_field]
+                batched_event_count = (
+                    update_value if isinstance(update_value, int) else len(update_value)
+                )
+            else:
+                continue
+            arrival_times.extend([time.perf_counter()] * batched_event_count)
+        return arrival_times
+
+    async def _send(
+        self,
+        communicator: WebsocketCommunicator,
+        message: dict[str, Any],
+        binary: bool = False,
+    ) -> None:
+        self.frame_count += 1
+        if binary:
+            encoded_frame: bytes = codec.encode_binary(message)
+            self.byte_count += len(encoded_frame)
+            await communicator.send_to(bytes_data=encoded_frame)
+            return
+        text_frame: str = codec.encode(message)
+        self.byte_count += len(text_frame.encode())
+        await communicator.send_to(text_data=text_frame)
+
+    async def _receive(self, communicator: WebsocketCommunicator) -> dict[str, Any]:
+        """Receives and decodes the next frame of either protocol"""
+        frame: str | bytes = await communicator.receive_from(
+            timeout=RECEIVE_TIMEOUT_SECONDS
+        )
+        self.frame_count += 1
+        if isinstance(frame, bytes):
+            self.byte_count += len(frame)
+            message: dict[str, Any] = msgpack.unpackb(frame)
+            message["type"] = codec.BINARY_MESSAGE_TYPES[message["type"]]
+            return message
+        self.byte_count += len(frame.encode())
+        decoded_message: dict[str, Any] = codec.decode(frame)
+        return decoded_message
+
+    async def _receive_until(
+        self, communicator: WebsocketCommunicator, message_type: str
+    ) -> dict[str, Any]:
+        """Skips unrelated frames until a message of the given type arrives"""
+        while True:
+            message: dict[str, Any] = await self._receive(communicator)
+            if message["type"] == message_type:
+                return message
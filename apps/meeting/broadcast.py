@@ -0,0 +1,147 @@
+"""
+Meeting Broadcast Module
+
+This module fans question frames out to participants with one encode per push.
+
+A `group_send` to the `PARTICIPANT` group delivers one channel layer message
+per participant, each dispatched through a consumer handler that re-encodes
+the frame. Instead, every worker owns a single `MeetingBroadcaster` channel
+that joins a `meeting_fanout_{access_code}` group while it serves at least one
+participant of the meeting:
+- the host encodes the frame once per protocol (`build_broadcast_message`)
+- the channel layer delivers one message per worker instead of per participant
+- each worker writes the pre-encoded text to its local participant sockets
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+from channels.generic.websocket import AsyncWebsocketConsumer
+from channels.layers import BaseChannelLayer
+
+from apps.meeting import codec, utils
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+BROADCAST_MESSAGE_TYPE: str = "meeting.broadcast"
+FANOUT_GROUP_PREFIX: str = "meeting_fanout_"
+
+
+def get_fanout_group_name(meeting_access_code: str) -> str:
+    """Name of the group joined by every worker serving the meeting's participants"""
+    return f"{FANOUT_GROUP_PREFIX}{meeting_access_code}"
+
+
+def build_broadcast_message(
+    meeting_access_code: str, frame: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Encodes a participant frame once for every worker and participant.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+        frame: The WebSocket frame sent to every participant
+
+    Returns:
+        The channel layer message to send to the meeting's fan-out group
+    """
+    return {
+        "type": BROADCAST_MESSAGE_TYPE,
+        "meeting": meeting_access_code,
+        "text": codec.encode(frame),
+        "bytes": codec.encode_binary(frame),
+    }
+
+
+class MeetingBroadcaster:
+    """
+    Delivers fan-out messages to the participants connected to this process.
+
+    A single receive loop serves every meeting; participants subscribe
+    when they join and unsubscribe when they disconnect.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: dict[str, set[AsyncWebsocketConsumer]] = {}
+        self._channel_name: str | None = None
+        self._startup_task: asyncio.Task[str] | None = None
+        self._receive_task: asyncio.Task[None] | None = None
+
+    async def subscribe(
+        self, meeting_access_code: str, consumer: AsyncWebsocketConsumer
+    ) -> None:
+        """Starts delivering the meeting's broadcasts to the participant"""
+        channel_name: str = await self._ensure_receiving()
+        meeting_subscribers = self._subscribers.get(meeting_access_code)
+        if meeting_subscribers is None:
+            meeting_subscribers = self._subscribers[meeting_access_code] = set()
+            meeting_subscribers.add(consumer)
+            # NOTE: The first local participant makes this worker a group member
+            await utils.get_meeting_channel_layer().group_add(
+                get_fanout_group_name(meeting_access_code), channel_name
+            )
+        else:
+            meeting_subscribers.add(consumer)
+
+    async def unsubscribe(
+        self, meeting_access_code: str, consumer: AsyncWebsocketConsumer
+    ) -> None:
+        """Stops delivering the meeting's broadcasts to the participant"""
+        meeting_subscribers = self._subscribers.get(meeting_access_code)
+        if meeting_subscribers is None:
+            return
+        meeting_subscribers.discard(consumer)
+        if not meeting_subscribers and self._channel_name:
+            del self._subscribers[meeting_access_code]
+            await utils.get_meeting_channel_layer().group_discard(
+                get_fanout_group_name(meeting_access_code), self._channel_name
+            )
+
+    async def deliver(self, message: dict[str, Any]) -> None:
+        """Writes a pre-encoded broadcast to every local participant of the meeting"""
+        for consumer in list(self._subscribers.get(message["meeting"], ())):
+            try:
+                if getattr(consumer, "is_binary_protocol", False):
+                    await consumer.send(bytes_data=message["bytes"])
+                else:
+                    await consumer.send(text_data=message["text"])
+            except Exception:
+                # NOTE: The socket closed before it could unsubscribe
+                logger.exception("Broadcast delivery failed")
+
+    async def _ensure_receiving(self) -> str:
+        """Returns this worker's broadcast channel, starting the receive loop once"""
+        if (
+            self._startup_task is None
+            or self._startup_task.get_loop() is not asyncio.get_running_loop()
+            or (self._receive_task is not None and self._receive_task.done())
+        ):
+            # NOTE: Subscriptions of a previous event loop can no longer be served
+            self._subscribers.clear()
+            self._receive_task = None
+            self._startup_task = asyncio.create_task(self._start())
+        # NOTE: Concurrent first joins share a single startup
+        return await asyncio.shield(self._startup_task)
+
+    async def _start(self) -> str:
+        self._channel_name = await utils.get_meeting_channel_layer().new_channel()
+        self._receive_task = asyncio.create_task(self._run(self._channel_name))
+        return self._channel_name
+
+    async def _run(self, channel_name: str) -> None:
+        channel_layer: BaseChannelLayer = utils.get_meeting_channel_layer()
+        while True:
+            try:
+                message: dict[str, Any] = await channel_layer.receive(channel_name)
+            except Exception:
+                # NOTE: Keep the subscriptions; the channel layer may come back
+                logger.exception("Broadcast receive failed")
+                await asyncio.sleep(1)
+                continue
+            if message.get("type") == BROADCAST_MESSAGE_TYPE:
+                await self.deliver(message)
+
+
+# NOTE: Shared by every participant consumer in this process
+meeting_broadcaster = MeetingBroadcaster()
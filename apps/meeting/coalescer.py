@@ -0,0 +1,128 @@
+"""
+Host Update Coalescer Module
+
+This module batches the notifications participants send to their host.
+
+Without coalescing every answer, join and leave is a separate group send
+to the `HOST` group and a separate frame to the host browser. With
+`MEETING_HOST_UPDATE_INTERVAL_SECONDS` > 0, the events of every meeting
+served by this process are aggregated and sent as one `host_update` delta
+per meeting and interval, e.g.:
+
+    {"type": "host_update", "answers": 37, "joined": [...], "left": [...],
+     "participant_count": 412}
+"""
+
+import asyncio
+import logging
+
+from channels.layers import BaseChannelLayer
+from django.conf import settings
+
+from apps.meeting import utils
+from apps.meeting.constants import GroupPrefixes, MessageTypes
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def get_host_update_interval() -> float:
+    """Returns the coalescing window in seconds; 0 sends every event immediately"""
+    return getattr(settings, "MEETING_HOST_UPDATE_INTERVAL_SECONDS", 0)
+
+
+class HostUpdateBatch:
+    """Events of a single meeting waiting for the next delta"""
+
+    __slots__ = ("answer_count", "joined_names", "left_names", "participant_count")
+
+    def __init__(self) -> None:
+        self.answer_count: int = 0
+        # NOTE: Dicts keep insertion order, so the host sees names in join order
+        self.joined_names: dict[str, None] = {}
+        self.left_names: dict[str, None] = {}
+        self.participant_count: int | None = None
+
+
+class HostUpdateCoalescer:
+    """
+    Aggregates host notifications into periodic deltas.
+
+    A single timer task per process flushes the batches of every meeting.
+    A participant that joins and leaves within one window cancels out.
+    """
+
+    def __init__(self) -> None:
+        self._batches: dict[str, HostUpdateBatch] = {}
+        self._flush_timer: asyncio.Task[None] | None = None
+
+    def is_enabled(self) -> bool:
+        return get_host_update_interval() > 0
+
+    def add_answer(self, meeting_access_code: str) -> None:
+        """Counts an answer accepted for the meeting"""
+        self._get_batch(meeting_access_code).answer_count += 1
+
+    def add_join(
+        self, meeting_access_code: str, display_name: str, participant_count: int
+    ) -> None:
+        """Records a participant that joined the meeting"""
+        batch: HostUpdateBatch = self._get_batch(meeting_access_code)
+        if display_name in batch.left_names:
+            # NOTE: Left and came back within the window - the host saw no change
+            del batch.left_names[display_name]
+        else:
+            batch.joined_names[display_name] = None
+        batch.participant_count = participant_count
+
+    def add_leave(
+        self, meeting_access_code: str, display_name: str, participant_count: int
+    ) -> None:
+        """Records a participant that left the meeting"""
+        batch: HostUpdateBatch = self._get_batch(meeting_access_code)
+        if display_name in batch.joined_names:
+            # NOTE: Joined and left within the window - the host never needs to know
+            del batch.joined_names[display_name]
+        else:
+            batch.left_names[display_name] = None
+        batch.participant_count = participant_count
+
+    async def flush(self) -> None:
+        """Sends one delta per meeting with pending events"""
+        batches, self._batches = self._batches, {}
+        channel_layer: BaseChannelLayer = utils.get_meeting_channel_layer()
+        for meeting_access_code, batch in batches.items():
+            await channel_layer.group_send(
+                f"{GroupPrefixes.HOST}{meeting_access_code}",
+                {
+                    "type": MessageTypes.HOST_UPDATE,
+                    "answers": batch.answer_count,
+                    "joined": list(batch.joined_names),
+                    "left": list(batch.left_names),
+                    "participant_count": batch.participant_count,
+                },
+            )
+
+    def _get_batch(self, meeting_access_code: str) -> HostUpdateBatch:
+        batch = self._batches.get(meeting_access_code)
+        if batch is None:
+            batch = self._batches[meeting_access_code] = HostUpdateBatch()
+        if (
+            self._flush_timer is None
+            or self._flush_timer.done()
+            or self._flush_timer.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._flush_timer = asyncio.create_task(self._flush_after_interval())
+        return batch
+
+    async def _flush_after_interval(self) -> None:
+        await asyncio.sleep(get_host_update_interval())
+        # NOTE: Events arriving during the flush start the next window
+        self._flush_timer = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Host update flush failed")
+
+
+# NOTE: Shared by every participant consumer in this process
+host_updates = HostUpdateCoalescer()
@@ -0,0 +1,277 @@
+"""
+Meeting Codec Module
+
+This module encodes and decodes the JSON exchanged with meeting clients.
+
+The fastest available backend is picked once at import time:
+- `orjson` when installed
+- `msgspec` when installed
+- the standard library `json` module otherwise
+
+Frames received by the consumers are decoded and validated in a single
+`decode_frame` call against the schema table of the receiving consumer
+(`HOST_FRAMES` / `PARTICIPANT_FRAMES`), so malformed frames, unknown
+message types and fields of the wrong type are rejected before any
+handler runs.
+
+Clients may negotiate the `collaboard.msgpack.v1` WebSocket subprotocol
+instead of plain JSON text frames. Its frames are binary MessagePack maps
+whose `type` is the small integer of `BINARY_MESSAGE_TYPE_CODES`, which
+roughly halves the size of the frames fanned out to large meetings.
+"""
+
+import json
+from collections.abc import Iterable
+from typing import Any, Callable, NamedTuple
+
+import msgpack
+
+from apps.meeting.constants import MAX_PARTICIPANT_NAME_LENGTH, MessageTypes
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - depends on the environment
+    msgspec = None
+
+
+JSON_SUBPROTOCOL: str = "collaboard.json.v1"
+MSGPACK_SUBPROTOCOL: str = "collaboard.msgpack.v1"
+SUBPROTOCOLS: tuple[str, ...] = (MSGPACK_SUBPROTOCOL, JSON_SUBPROTOCOL)
+
+# ! Codes are part of the wire format: append new types, never renumber
+# ! Must match `MessageTypeCodes` in `static/meeting/meeting_codec.js`
+BINARY_MESSAGE_TYPE_CODES: dict[str, int] = {
+    MessageTypes.START_MEETING: 1,
+    MessageTypes.END_MEETING: 2,
+    MessageTypes.NEXT_QUESTION: 3,
+    MessageTypes.PARTICIPANT_JOINED: 4,
+    MessageTypes.PARTICIPANT_LEFT: 5,
+    MessageTypes.ROSTER: 6,
+    MessageTypes.HOST_UPDATE: 7,
+    MessageTypes.QUESTIONS: 8,
+    MessageTypes.SUBMIT_ANSWER: 9,
+    MessageTypes.ANSWER_SUBMITTED: 10,
+    MessageTypes.SUBMIT_ERROR: 11,
+    MessageTypes.INVALID_ANSWER: 12,
+    MessageTypes.UPDATE_NAME: 13,
+    MessageTypes.AUTHENTICATE: 14,
+    MessageTypes.SESSION_TOKEN: 15,
+    MessageTypes.ANSWER_INSIGHTS: 16,
+}
+BINARY_MESSAGE_TYPES: dict[int, str] = {
+    code: message_type for message_type, code in BINARY_MESSAGE_TYPE_CODES.items()
+}
+
+
+class DecodeError(ValueError):
+    """Raised when data cannot be decoded or is not a valid meeting frame"""
+
+
+class FrameSchema(NamedTuple):
+    """
+    Fields accepted in a client frame of one message type.
+
+    Attributes:
+        fields: Expected type of each field; every field is optional
+        max_lengths: Maximum length of the string fields that are bounded
+    """
+
+    fields: dict[str, type | tuple[type, ...]] = {}
+    max_lengths: dict[str, int] = {}
+
+
+QUESTION_REFERENCE_FIELDS: dict[str, type | tuple[type, ...]] = {
+    "question_index": int,
+    "question": str,
+}
+
+# NOTE: Frames a host browser may send to `HostMeetingConsumer`
+HOST_FRAMES: dict[str, FrameSchema] = {
+    MessageTypes.AUTHENTICATE: FrameSchema(fields={"session_id": str}),
+    MessageTypes.START_MEETING: FrameSchema(fields=QUESTION_REFERENCE_FIELDS),
+    MessageTypes.NEXT_QUESTION: FrameSchema(fields=QUESTION_REFERENCE_FIELDS),
+    MessageTypes.END_MEETING: FrameSchema(),
+}
+
+# NOTE: Frames a participant browser may send to `ParticipantMeetingConsumer`
+PARTICIPANT_FRAMES: dict[str, FrameSchema] = {
+    MessageTypes.PARTICIPANT_JOINED: FrameSchema(
+        fields={"name": str, "token": str},
+        max_lengths={"name": MAX_PARTICIPANT_NAME_LENGTH},
+    ),
+    MessageTypes.SUBMIT_ANSWER: FrameSchema(
+        fields={"answer": str, **QUESTION_REFERENCE_FIELDS}
+    ),
+}
+
+
+def _select_backend() -> tuple[
+    str,
+    Callable[[Any], str],
+    Callable[[str | bytes], Any],
+    tuple[type[Exception], ...],
+]:
+    if orjson is not None:
+        return (
+            "orjson",
+            lambda data: orjson.dumps(data).decode(),
+            orjson.loads,
+            (orjson.JSONDecodeError,),
+        )
+    if msgspec is not None:
+        json_encoder = msgspec.json.Encoder()
+        json_decoder = msgspec.json.Decoder()
+        return (
+            "msgspec",
+            lambda data: json_encoder.encode(data).decode(),
+            json_decoder.decode,
+            (msgspec.DecodeError,),
+        )
+    return (
+        "json",
+        lambda data: json.dumps(data, separators=(",", ":")),
+        json.loads,
+        (json.JSONDecodeError, UnicodeDecodeError),
+    )
+
+
+BACKEND_NAME, _encode, _decode, _DECODE_ERRORS = _select_backend()
+
+
+def encode(data: Any, indent: bool = False) -> str:
+    """
+    Encodes data to a JSON string.
+
+    Args:
+        data: JSON-serializable data
+        indent: Whether to indent the output by two spaces (for humans)
+
+    Returns:
+        The JSON document
+    """
+    if indent:
+        # NOTE: Readability over speed; only used outside the socket hot path
+        return json.dumps(data, indent=2)
+    return _encode(data)
+
+
+def decode(data: str | bytes) -> Any:
+    """
+    Decodes a JSON document.
+
+    Args:
+        data: The JSON document
+
+    Returns:
+        The decoded data
+
+    Raises:
+        DecodeError: If the data is not valid JSON
+    """
+    try:
+        return _decode(data)
+    except _DECODE_ERRORS as error:
+        raise DecodeError(str(error)) from error
+
+
+def decode_frame(data: str | bytes, schemas: dict[str, FrameSchema]) -> dict[str, Any]:
+    """
+    Decodes a client frame and validates it against the consumer's schemas.
+
+    Args:
+        data: The raw WebSocket frame
+        schemas: Accepted frames of the receiving consumer, by message type
+
+    Returns:
+        The decoded frame, guaranteed to match the schema of its `type`
+
+    Raises:
+        DecodeError: If the frame is not valid JSON or matches no schema
+    """
+    return _validate_frame(decode(data), schemas)
+
+
+def negotiate_subprotocol(requested_subprotocols: Iterable[str]) -> str | None:
+    """
+    Picks the WebSocket subprotocol of a connection.
+
+    Args:
+        requested_subprotocols: Subprotocols offered by the client, by preference
+
+    Returns:
+        The first supported subprotocol; None for clients that offer none
+    """
+    for subprotocol in requested_subprotocols:
+        if subprotocol in SUBPROTOCOLS:
+            return subprotocol
+    return None
+
+
+def encode_binary(frame: dict[str, Any]) -> bytes:
+    """
+    Encodes a frame for the `collaboard.msgpack.v1` subprotocol.
+
+    Args:
+        frame: The WebSocket frame; its `type` is replaced by its integer code
+
+    Returns:
+        The MessagePack document
+    """
+    message_type: Any = frame.get("type")
+    if message_type in BINARY_MESSAGE_TYPE_CODES:
+        frame = {**frame, "type": BINARY_MESSAGE_TYPE_CODES[message_type]}
+    encoded_frame: bytes = msgpack.packb(frame, use_bin_type=True)
+    return encoded_frame
+
+
+def decode_binary_frame(data: bytes, schemas: dict[str, FrameSchema]) -> dict[str, Any]:
+    """
+    Decodes a `collaboard.msgpack.v1` client frame and validates it.
+
+    Args:
+        data: The raw binary WebSocket frame
+        schemas: Accepted frames of the receiving consumer, by message type
+
+    Returns:
+        The decoded frame with its `type` restored to the message type name
+
+    Raises:
+        DecodeError: If the frame is not valid MessagePack or matches no schema
+    """
+    try:
+        frame: Any = msgpack.unpackb(data, raw=False)
+    except (ValueError, msgpack.UnpackException) as error:
+        raise DecodeError(str(error)) from error
+    if isinstance(frame, dict) and isinstance(frame.get("type"), int):
+        frame["type"] = BINARY_MESSAGE_TYPES.get(frame["type"])
+    return _validate_frame(frame, schemas)
+
+
+def _validate_frame(frame: Any, schemas: dict[str, FrameSchema]) -> dict[str, Any]:
+    if not isinstance(frame, dict):
+        raise DecodeError("Frame is not a JSON object")
+    message_type: Any = frame.get("type")
+    schema: FrameSchema | None = (
+        schemas.get(message_type) if isinstance(message_type, str) else None
+    )
+    if schema is None:
+        raise DecodeError(f"Unknown message type: {message_type!r}")
+
+    for field_name, field_type in schema.fields.items():
+        field_value: Any = frame.get(field_name)
+        if field_value is None:
+            continue
+        # NOTE: `bool` is an `int` subclass, but `true` is never a valid index
+        if not isinstance(field_value, field_type) or (
+            isinstance(field_value, bool) and field_type is not bool
+        ):
+            raise DecodeError(f"Invalid field {field_name!r} in {message_type}")
+    for field_name, max_length in schema.max_lengths.items():
+        if len(frame.get(field_name) or "") > max_length:
+            raise DecodeError(f"Field {field_name!r} too long in {message_type}")
+    return frame
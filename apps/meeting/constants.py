@@ -5,6 +5,13 @@ Meeting-related constants and enums
 
 from enum import Enum
 
+MAX_MEETING_DURATION_SECONDS: int = 3600  # Meetings last at most one hour
+# NOTE: Redis keys of a meeting also outlive its lobby, before the timer starts
+MEETING_KEY_TIMEOUT_SECONDS: int = 2 * MAX_MEETING_DURATION_SECONDS
+
+# NOTE: Registry suffixes like "(12)" must still fit `ParticipantSession.name`
+MAX_PARTICIPANT_NAME_LENGTH: int = 30  # Also enforced by the join form
+
 
 class MessageTypes:
     """
@@ -18,6 +25,8 @@ class MessageTypes:
     NEXT_QUESTION = "next_question"
     PARTICIPANT_JOINED = "participant_joined"
     PARTICIPANT_LEFT = "participant_left"
+    ROSTER = "roster"
+    HOST_UPDATE = "host_update"
     QUESTIONS = "questions"
     SUBMIT_ANSWER = "submit_answer"
     ANSWER_SUBMITTED = "answer_submitted"
@@ -25,6 +34,8 @@ class MessageTypes:
     INVALID_ANSWER = "invalid_answer"
     UPDATE_NAME = "update_name"
     AUTHENTICATE = "authenticate"
+    SESSION_TOKEN = "session_token"
+    ANSWER_INSIGHTS = "answer_insights"
 
 
 class GroupPrefixes:
@@ -1,17 +1,34 @@
-import asyncio
-import json
 import uuid
 from typing import Any
 
-from django.core.cache import cache
 from django.urls import reverse
 
 from apps.base.models import CustomUser
-from apps.director.models import Meeting, Question
-from apps.meeting import utils
+from apps.meeting import (
+    aggregation,
+    codec,
+    lifecycle,
+    presence,
+    reconnect,
+    registry,
+    utils,
+)
 from apps.meeting.base import BaseMeetingConsumer
+from apps.meeting.broadcast import (
+    build_broadcast_message,
+    get_fanout_group_name,
+    meeting_broadcaster,
+)
+from apps.meeting.coalescer import host_updates
 from apps.meeting.constants import CloseCodes, GroupPrefixes, MessageTypes
-from apps.meeting.models import Response
+from apps.meeting.context import (
+    MeetingContext,
+    forget_meeting_context,
+    get_meeting_context,
+)
+from apps.meeting.ingestion import response_queue
+from apps.meeting.instrumentation import instrumented
+from apps.meeting.presence import presence_heartbeat
 
 
 class HostMeetingConsumer(BaseMeetingConsumer):
@@ -41,8 +58,10 @@ class HostMeetingConsumer(BaseMeetingConsumer):
             )
             return
 
-        await self.accept()
+        await self._accept()
         self.authenticated = False
+        lifecycle.meeting_end_poller.start()
+
         self.meeting_uuid: uuid.UUID = url_route_data["kwargs"]["meeting_id"]
 
     async def disconnect(self, code: int) -> None:
@@ -52,23 +71,30 @@ class HostMeetingConsumer(BaseMeetingConsumer):
         Args:
             close_code: WebSocket close code indicating disconnection reason
         """
-        # NOTE: Remove host from channel group if access code exists
-        if hasattr(self, "meeting_access_code") and self.meeting_access_code:
-            await self.channel_layer.group_discard(
-                f"{GroupPrefixes.HOST}{self.meeting_access_code}", self.channel_name
-            )
+        # NOTE: Nothing to clean up if the host never loaded the meeting
+        if not getattr(self, "meeting_access_code", None):
+            return
+
+        # NOTE: Remove host from channel group
+        await self.channel_layer.group_discard(
+            f"{GroupPrefixes.HOST}{self.meeting_access_code}", self.channel_name
+        )
+
+        # NOTE: A started meeting keeps running and ends on its deadline,
+        # NOTE: so the host can reconnect without interrupting participants
+        if await lifecycle.is_meeting_started(self.meeting_access_code):
+            return
 
         # NOTE: Notify all participants that meeting has ended
-        await self.channel_layer.group_send(
+        await self._group_send(
             group=f"{GroupPrefixes.PARTICIPANT}{self.meeting_access_code}",
             message={"type": MessageTypes.END_MEETING},
         )
 
-        # NOTE: Clean up all meeting-related cache entries
-        await cache.adelete(
-            key=f"{GroupPrefixes.MEETING_LOCKED}{self.meeting_access_code}"
-        )
-        await cache.adelete(key=utils.get_username_cache_key(self.meeting_access_code))
+        # NOTE: Clean up all meeting-related cache entries (the lock included)
+        forget_meeting_context(self.meeting_access_code)
+        await registry.close_registry(self.meeting_access_code)
+        await presence.clear_presence(self.meeting_access_code)
 
     async def receive(
         self, text_data: str | None = None, bytes_data: bytes | None = None
@@ -78,13 +104,15 @@ class HostMeetingConsumer(BaseMeetingConsumer):
 
         Args:
             text_data: JSON string containing message data
-            bytes_data: Binary data (not used in this implementation)
+            bytes_data: MessagePack frame of `collaboard.msgpack.v1` clients
         """
-        if not text_data:
+        if not text_data and not bytes_data:
             return
 
         try:
-            parsed_message_data: dict[str, Any] = json.loads(text_data)
+            parsed_message_data: dict[str, Any] = self._decode_frame(
+                text_data, bytes_data, codec.HOST_FRAMES
+            )
             message_type_identifier: str = parsed_message_data["type"]
 
             # NOTE: Route message to appropriate handler based on type
@@ -98,9 +126,11 @@ class HostMeetingConsumer(BaseMeetingConsumer):
                     await self.handle_next_question(event=parsed_message_data)
                 case MessageTypes.END_MEETING:
                     await self.handle_end_meeting(event=parsed_message_data)
-        except json.JSONDecodeError:
+        except codec.DecodeError:
+            # NOTE: Malformed or unexpected frames never reach a handler
             pass
 
+    @instrumented
     async def authenticate(self, event: dict[str, Any]) -> None:
         sessionid: str | None = event.get("session_id", None)
         if not sessionid:
@@ -124,11 +154,10 @@ class HostMeetingConsumer(BaseMeetingConsumer):
 
         # NOTE: Initialize meeting-specific attributes
         self.meeting_access_code: str = meeting_data_bundle.access_code
-        self.allocated_meeting_duration_seconds: int = (
+        self.allocated_meeting_duration_minutes: int = (
             meeting_data_bundle.meeting.duration
         )
-        self.active_participant_count: int = 0
-        self.total_responses_count: int = 0
+        self.total_question_count: int = len(meeting_data_bundle.questions)
 
         # NOTE: Ensure meeting has questions before proceeding
         if not meeting_data_bundle.questions:
@@ -138,13 +167,6 @@ class HostMeetingConsumer(BaseMeetingConsumer):
             )
             return
 
-        # NOTE: Initialize meeting lock status in cache (prevents late joins)
-        await cache.aset(
-            key=f"{GroupPrefixes.MEETING_LOCKED}{self.meeting_access_code}",
-            value=False,
-            timeout=3600,
-        )
-
         # NOTE: Add host to dedicated channel group for real-time communication
         self.host_channel_group_name: str = (
             f"{GroupPrefixes.HOST}{self.meeting_access_code}"
@@ -159,21 +181,59 @@ class HostMeetingConsumer(BaseMeetingConsumer):
         ]
 
         # NOTE: Send initial meeting data to host frontend
+        initial_meeting_data: dict[str, Any] = {
+            "type": MessageTypes.START_MEETING,
+            "questions": question_descriptions_list,
+            "access_code": self.meeting_access_code,
+        }
+        # NOTE: A host reconnecting to a running meeting resumes where it left off
+        live_state: lifecycle.LiveMeetingState | None = await lifecycle.get_live_state(
+            self.meeting_access_code
+        )
+        if live_state:
+            initial_meeting_data["current_question_index"] = (
+                live_state.current_question_index
+            )
+            initial_meeting_data["remaining_seconds"] = (
+                live_state.get_remaining_seconds()
+            )
+            lifecycle.meeting_checkpointer.track(self.meeting_access_code)
+        await self._send_json(data=initial_meeting_data)
+
+        # NOTE: Allow participants to claim display names
+        await registry.open_registry(self.meeting_access_code)
+
+        # NOTE: Rebuild the participant list from the shared presence store
+        connected_participant_names: list[str] = await presence.get_roster(
+            self.meeting_access_code
+        )
         await self._send_json(
             data={
-                "type": MessageTypes.START_MEETING,
-                "questions": question_descriptions_list,
-                "access_code": self.meeting_access_code,
+                "type": MessageTypes.ROSTER,
+                "participants": [
+                    {"name": participant_name, "status": "Connected"}
+                    for participant_name in connected_participant_names
+                ],
+                "participant_count": len(connected_participant_names),
             }
         )
 
-        self.total_questions_presented: int = 1
-
-        # NOTE: Initialize participant username tracking cache
-        await cache.aset(
-            key=utils.get_username_cache_key(self.meeting_access_code), value=[]
-        )
+        # NOTE: Answers given before a reconnect are summarized from Redis
+        if live_state:
+            question_insights: list[
+                dict[str, Any]
+            ] = await aggregation.get_answer_insights(
+                self.meeting_access_code, list(range(self.total_question_count))
+            )
+            if question_insights:
+                await self._send_json(
+                    data={
+                        "type": MessageTypes.ANSWER_INSIGHTS,
+                        "questions": question_insights,
+                    }
+                )
 
+    @instrumented
     async def handle_start_meeting(self, event: dict[str, Any]) -> None:
         """
         Initiates the meeting session.
@@ -184,108 +244,79 @@ class HostMeetingConsumer(BaseMeetingConsumer):
             event: Message event containing meeting start data
         """
         # NOTE: Lock meeting to prevent additional participants from joining
-        await cache.aset(
-            key=f"{GroupPrefixes.MEETING_LOCKED}{self.meeting_access_code}", value=True
-        )
+        await registry.lock_registry(self.meeting_access_code)
 
-        # NOTE: Create background task to auto-end meeting after duration limit
-        self.meeting_auto_end_timer = asyncio.create_task(
-            self._auto_end_meeting_after_duration(
-                self.allocated_meeting_duration_seconds
-            )
+        # NOTE: Register the auto-end deadline in the shared deadline set
+        first_question_reference: dict[str, Any] | None = (
+            self._get_valid_question_reference(event)
         )
-
-        # NOTE: Create background task to track actual meeting duration
-        self.meeting_duration_tracking_timer = asyncio.create_task(
-            utils.meeting_duration_counter()
+        await lifecycle.start_meeting(
+            meeting_access_code=self.meeting_access_code,
+            duration_seconds=self.allocated_meeting_duration_minutes * 60,
+            current_question=first_question_reference,
+            meeting_id=self.meeting_uuid,
         )
 
         # NOTE: Distribute first question to all connected participants
-        first_question_text: str = event.get("question", "")
-        if first_question_text:
-            await self.channel_layer.group_send(
-                group=f"{GroupPrefixes.PARTICIPANT}{self.meeting_access_code}",
-                message={
-                    "type": MessageTypes.START_MEETING,
-                    "question": first_question_text,
-                },
+        if first_question_reference:
+            await self._broadcast_to_participants(
+                frame={"type": MessageTypes.START_MEETING, **first_question_reference}
             )
 
-    async def _auto_end_meeting_after_duration(self, duration_minutes: int) -> None:
+    async def _broadcast_to_participants(self, frame: dict[str, Any]) -> None:
         """
-        Automatically ends meeting after specified duration.
+        Sends a frame to every participant, encoding it only once.
 
         Args:
-            duration_minutes: Maximum meeting duration in minutes
+            frame: The WebSocket frame sent to every participant
+        """
+        await self._group_send(
+            group=get_fanout_group_name(self.meeting_access_code),
+            message=build_broadcast_message(self.meeting_access_code, frame),
+        )
 
-        Note:
-            This is a background task that can be cancelled if meeting ends early.
+    def _get_valid_question_reference(
+        self, event: dict[str, Any]
+    ) -> dict[str, Any] | None:
         """
-        try:
-            # NOTE: Convert minutes to seconds for asyncio.sleep
-            await asyncio.sleep(duration_minutes * 60)
-            await self.handle_end_meeting({"type": MessageTypes.END_MEETING})
-        except asyncio.CancelledError:
-            # NOTE: Task was cancelled intentionally (meeting ended early)
-            pass
+        Returns the question reference of a host message if it is valid.
+
+        Participants already hold the question list, so indexed
+        references are broadcast as-is instead of the full text.
+        """
+        question_reference: dict[str, Any] = self._get_question_reference(event)
+        question_index: int | None = question_reference.get("question_index")
+        if question_index is not None and not (
+            0 <= question_index < self.total_question_count
+        ):
+            return None
+        return question_reference or None
 
+    @instrumented
     async def handle_end_meeting(self, event: dict[str, Any]) -> None:
         """
-        Terminates the meeting session and performs cleanup.
+        Terminates the meeting session at the host's request.
 
-        Cancels timers, updates meeting statistics, and notifies all participants.
+        Statistics are persisted and every consumer is notified by
+        `lifecycle.end_meeting`; the host is closed by `end_meeting`.
 
         Args:
             event: Message event containing meeting end data
         """
-        # NOTE: Cancel auto-end timer if still active
-        if (
-            hasattr(self, "meeting_auto_end_timer")
-            and self.meeting_auto_end_timer
-            and not self.meeting_auto_end_timer.done()
-        ):
-            self.meeting_auto_end_timer.cancel()
-            try:
-                await self.meeting_auto_end_timer
-            except asyncio.CancelledError:
-                pass
-
-        # NOTE: Cancel duration tracking timer and capture final duration
-        if (
-            hasattr(self, "meeting_duration_tracking_timer")
-            and self.meeting_duration_tracking_timer
-        ):
-            self.meeting_duration_tracking_timer.cancel()
-            try:
-                actual_duration_seconds: int = (
-                    await self.meeting_duration_tracking_timer
-                )
-                self.allocated_meeting_duration_seconds = actual_duration_seconds
-            except asyncio.CancelledError:
-                pass
-
-        # NOTE: Persist meeting statistics to database
-        await utils.set_meeting_duration_seconds_field(
-            meeting_access_code=self.meeting_access_code,
-            duration_seconds=self.allocated_meeting_duration_seconds,
-        )
-        await utils.set_participant_count(
-            meeting_access_code=self.meeting_access_code,
-            participant_count=self.active_participant_count,
-        )
-        await utils.set_total_questions_asked(
-            meeting_access_code=self.meeting_access_code,
-            questions_presented_count=self.total_questions_presented,
-        )
+        # NOTE: The deadline may already have been claimed by a worker's scheduler
+        if await lifecycle.is_meeting_started(
+            self.meeting_access_code
+        ) and not await lifecycle.claim_meeting_end(self.meeting_access_code):
+            return
+        await lifecycle.end_meeting(self.meeting_access_code)
 
-        # NOTE: Update the user's model with the new meeting stats
-        if self.authenticated and self.user:
-            self.user.meetings_created_count += 1
-            self.user.total_participants_count += self.active_participant_count
-            self.user.total_responses_count += self.total_responses_count
-            await self.user.asave()
+    async def end_meeting(self, event: dict[str, Any]) -> None:
+        """
+        Redirects the host to the meeting summary once the meeting has ended.
 
-        # NOTE: Send meeting completion notification to host frontend
+        Args:
+            event: Message event broadcast by `lifecycle.end_meeting`
+        """
         await self._send_json(
             data={
                 "type": MessageTypes.END_MEETING,
@@ -297,15 +328,9 @@ class HostMeetingConsumer(BaseMeetingConsumer):
                 }",
             }
         )
-
-        # NOTE: Notify all participants that meeting has ended
-        await self.channel_layer.group_send(
-            group=f"{GroupPrefixes.PARTICIPANT}{self.meeting_access_code}",
-            message={"type": MessageTypes.END_MEETING},
-        )
-
         await self._close_with_log(message="Meeting successfully terminated")
 
+    @instrumented
     async def handle_next_question(self, event: dict[str, Any]) -> None:
         """
         Distributes the next question to all participants.
@@ -313,16 +338,16 @@ class HostMeetingConsumer(BaseMeetingConsumer):
         Args:
             event: Message event containing next question data
         """
-        next_question_text: str = event.get("question", "")
-        if next_question_text:
-            await self.channel_layer.group_send(
-                group=f"{GroupPrefixes.PARTICIPANT}{self.meeting_access_code}",
-                message={
-                    "type": MessageTypes.NEXT_QUESTION,
-                    "question": next_question_text,
-                },
+        next_question_reference: dict[str, Any] | None = (
+            self._get_valid_question_reference(event)
+        )
+        if next_question_reference:
+            await self._broadcast_to_participants(
+                frame={"type": MessageTypes.NEXT_QUESTION, **next_question_reference}
             )
-        self.total_questions_presented += 1
+        await lifecycle.record_question_presented(
+            self.meeting_access_code, current_question=next_question_reference
+        )
 
     async def answer_submitted(self, event: dict[str, Any]) -> None:
         """
@@ -331,14 +356,14 @@ class HostMeetingConsumer(BaseMeetingConsumer):
         Args:
             event: Message event containing answer submission data
         """
-        self.total_responses_count += 1
         await self._send_json(data={"type": MessageTypes.ANSWER_SUBMITTED})
 
     async def participant_joined(self, event: dict[str, Any]) -> None:
         """
         Handles participant joining the meeting.
 
-        Updates participant count and notifies host frontend.
+        Forwards the participant and the live count (from the presence store)
+        to the host frontend.
 
         Args:
             event: Message event containing participant join data
@@ -347,7 +372,6 @@ class HostMeetingConsumer(BaseMeetingConsumer):
         participant_display_name = event.get("participant_name")
 
         if participant_channel_name and participant_display_name:
-            self.active_participant_count += 1
             await self._send_json(
                 data={
                     "type": MessageTypes.PARTICIPANT_JOINED,
@@ -355,9 +379,44 @@ class HostMeetingConsumer(BaseMeetingConsumer):
                         "name": participant_display_name,
                         "status": "Connected",
                     },
+                    "participant_count": event.get("participant_count"),
                 }
             )
 
+    async def host_update(self, event: dict[str, Any]) -> None:
+        """
+        Forwards a batch of answers, joins and leaves to the host frontend.
+
+        Args:
+            event: Delta aggregated by the `host_updates` coalescer
+        """
+        await self._send_json(
+            data={
+                "type": MessageTypes.HOST_UPDATE,
+                "answers": event.get("answers", 0),
+                "joined": [
+                    {"name": participant_name, "status": "Connected"}
+                    for participant_name in event.get("joined", [])
+                ],
+                "left": event.get("left", []),
+                "participant_count": event.get("participant_count"),
+            }
+        )
+
+    async def answer_insights(self, event: dict[str, Any]) -> None:
+        """
+        Forwards the live aggregates of answered questions to the host frontend.
+
+        Args:
+            event: Snapshot sent by the `answer_insights` aggregator
+        """
+        await self._send_json(
+            data={
+                "type": MessageTypes.ANSWER_INSIGHTS,
+                "questions": event.get("questions", []),
+            }
+        )
+
     async def participant_left(self, event: dict[str, Any]) -> None:
         """
         Handles participant leaving the meeting.
@@ -371,6 +430,7 @@ class HostMeetingConsumer(BaseMeetingConsumer):
                 data={
                     "type": MessageTypes.PARTICIPANT_LEFT,
                     "name": departing_participant_name,
+                    "participant_count": event.get("participant_count"),
                 }
             )
 
@@ -381,6 +441,7 @@ class ParticipantMeetingConsumer(BaseMeetingConsumer):
 
     Handles participant-specific operations including:
     - Joining meetings with unique username assignment
+    - Resuming the previous session after a dropped connection
     - Receiving questions from host
     - Submitting answers to questions
     - Graceful disconnection handling
@@ -390,7 +451,8 @@ class ParticipantMeetingConsumer(BaseMeetingConsumer):
         """
         Establishes WebSocket connection for meeting participant.
 
-        Validates meeting availability and prevents joining locked meetings.
+        Validates meeting availability. Locked meetings are enforced once the
+        join frame arrives, since only it carries a reconnect token.
         """
         # NOTE: Validate URL routing accessibility
         url_route_data: dict[str, Any] | None = self._get_url_route()
@@ -402,17 +464,17 @@ class ParticipantMeetingConsumer(BaseMeetingConsumer):
             return
 
         # NOTE: Accept connection immediately for participant
-        await self.accept()
+        await self._accept()
+        lifecycle.meeting_end_poller.start()
 
         self.meeting_access_code: str = url_route_data["kwargs"]["access_code"]
+        self.meeting_context: MeetingContext | None = None
+        self.participant_display_name: str = ""
+        self.participant_session_id: int | None = None
+        self.has_meeting_ended: bool = False
 
-        # ! CRITICAL: Immediately reject connection if meeting is already locked
-        is_meeting_locked = await cache.aget(
-            key=f"{GroupPrefixes.MEETING_LOCKED}{self.meeting_access_code}"
-        )
-        if is_meeting_locked:
-            await self.close(code=4401, reason="meeting_locked")
-            return
+        self.reconnect_token: str = ""
+        self.resumed_participant: reconnect.ResumedParticipant | None = None
 
         # NOTE: Initialize channel group identifiers
         self.participant_channel_group_name: str = (
@@ -429,15 +491,27 @@ class ParticipantMeetingConsumer(BaseMeetingConsumer):
         Args:
             code: WebSocket close code indicating disconnection reason
         """
-        # NOTE: Notify host that participant has left
-        if hasattr(self, "host_channel_group_name") and self.host_channel_group_name:
-            await self.channel_layer.group_send(
-                group=self.host_channel_group_name,
-                message={
-                    "type": MessageTypes.PARTICIPANT_LEFT,
-                    "name": self.participant_display_name,
-                },
+        # NOTE: Notify host that participant has left and release their name
+        if getattr(self, "participant_display_name", ""):
+            presence_heartbeat.untrack(
+                self.meeting_access_code, self.participant_display_name
             )
+            if self.has_meeting_ended:
+                # NOTE: The meeting's presence and names were already cleared
+                pass
+            elif self.reconnect_token:
+                # NOTE: Dropped connections may come back within the grace window
+                reconnect.defer_departure(
+                    meeting_access_code=self.meeting_access_code,
+                    token=self.reconnect_token,
+                    display_name=self.participant_display_name,
+                    channel_name=self.channel_name,
+                )
+            else:
+                await reconnect.leave_meeting(
+                    meeting_access_code=self.meeting_access_code,
+                    display_name=self.participant_display_name,
+                )
 
         # NOTE: Remove participant from channel group
         if (
@@ -447,6 +521,7 @@ class ParticipantMeetingConsumer(BaseMeetingConsumer):
             await self.channel_layer.group_discard(
                 self.participant_channel_group_name, self.channel_name
             )
+            await meeting_broadcaster.unsubscribe(self.meeting_access_code, self)
 
     async def receive(
         self, text_data: str | None = None, bytes_data: bytes | None = None
@@ -456,13 +531,15 @@ class ParticipantMeetingConsumer(BaseMeetingConsumer):
 
         Args:
             text_data: JSON string containing message data
-            bytes_data: Binary data (not used in this implementation)
+            bytes_data: MessagePack frame of `collaboard.msgpack.v1` clients
         """
-        if not text_data:
+        if not text_data and not bytes_data:
             return
 
         try:
-            parsed_message_data: dict[str, Any] = json.loads(text_data)
+            parsed_message_data: dict[str, Any] = self._decode_frame(
+                text_data, bytes_data, codec.PARTICIPANT_FRAMES
+            )
             message_type_identifier: str = parsed_message_data["type"]
 
             # NOTE: Route message to appropriate handler based on type
@@ -472,22 +549,10 @@ class ParticipantMeetingConsumer(BaseMeetingConsumer):
                     await self.handle_participant_joined(event=parsed_message_data)
                 case MessageTypes.SUBMIT_ANSWER:
                     await self.handle_submit_answer(event=parsed_message_data)
-        except json.JSONDecodeError:
-            # ! JSON parsing failed - consider logging this in production
+        except codec.DecodeError:
+            # ! Malformed or unexpected frame - consider logging this in production
             pass
 
-    async def start_meeting(self, event: dict[str, Any]) -> None:
-        """
-        Handles meeting start notification from host.
-
-        Args:
-            event: Message event containing meeting start data and first question
-        """
-        first_question_text = event.get("question", "")
-        await self._send_json(
-            data={"type": MessageTypes.START_MEETING, "question": first_question_text}
-        )
-
     async def end_meeting(self, event: dict[str, Any]) -> None:
         """
         Handles meeting end notification from host.
@@ -495,60 +560,90 @@ class ParticipantMeetingConsumer(BaseMeetingConsumer):
         Args:
             event: Message event containing meeting end data
         """
+        # NOTE: Persist answers still buffered in this process
+        await response_queue.flush()
+        forget_meeting_context(self.meeting_access_code)
+        self.has_meeting_ended = True
+
         # NOTE: Provide redirect URL for frontend navigation
         await self._send_json(
             data={"type": MessageTypes.END_MEETING, "url": f"{reverse('post-meeting')}"}
         )
         await self.close()
 
-    async def next_question(self, event: dict[str, Any]) -> None:
+    @instrumented
+    async def handle_participant_joined(self, event: dict[str, Any]) -> None:
         """
-        Handles next question distribution from host.
+        Processes participant joining the meeting.
+
+        A participant sending the reconnect token of a dropped session resumes
+        it, even in a locked meeting; everyone else joins as a new participant.
 
         Args:
-            event: Message event containing next question data
+            event: Message event containing participant join data
         """
-        next_question_text = event.get("question", "")
-        await self._send_json(
-            data={"type": MessageTypes.NEXT_QUESTION, "question": next_question_text}
-        )
+        # NOTE: The token travels in the frame, never in the URL, to keep it out of logs
+        requested_token: str | None = event.get("token", None)
+        if requested_token:
+            self.resumed_participant = await reconnect.find_participant_session(
+                meeting_access_code=self.meeting_access_code, token=requested_token
+            )
+            if self.resumed_participant:
+                self.reconnect_token = requested_token
+                await self.resume_participant(event)
+                return
+        await self.join_participant(event)
 
-    async def handle_participant_joined(self, event: dict[str, Any]) -> None:
+    async def join_participant(self, event: dict[str, Any]) -> None:
         """
-        Processes participant joining the meeting.
+        Joins the participant as a new member of the meeting.
 
         Handles username uniqueness, updates participant lists, and notifies host.
 
         Args:
             event: Message event containing participant join data
         """
+        # ! CRITICAL: Locked meetings only take back participants that dropped
+        if await registry.is_registry_locked(self.meeting_access_code):
+            await self.close(code=4401, reason="meeting_locked")
+            return
+
         requested_username: str | None = event.get("name", None)
         if not requested_username:
             # ! This should never happen but provides safety check
             await self._close_with_log(message="Participant username not provided")
             return
 
-        # NOTE: Retrieve current participant usernames from cache
-        existing_usernames_list: list[str] | None = await cache.aget(
-            key=utils.get_username_cache_key(self.meeting_access_code)
+        # NOTE: Claim a unique display name (atomic across workers)
+        assigned_display_name: str | None = await registry.register_participant(
+            meeting_access_code=self.meeting_access_code,
+            requested_name=requested_username,
         )
-        if existing_usernames_list is None:
+        if assigned_display_name is None:
             await self._close_with_log(
                 message="Participant joined before host established meeting", code=4004
             )
             return
+        self.participant_display_name = assigned_display_name
 
-        # NOTE: Handle username conflicts by appending number suffix
-        username_conflict_count: int = sum(
-            existing_name == requested_username
-            or existing_name.startswith(f"{requested_username}(")
-            for existing_name in existing_usernames_list
-        )
-        self.participant_display_name: str = ""
-        if username_conflict_count > 0:
-            self.participant_display_name = (
-                f"{requested_username}({username_conflict_count})"
+        # NOTE: Load (or reuse) the process-wide lookup data for this meeting
+        self.meeting_context = await get_meeting_context(self.meeting_access_code)
+        if not self.meeting_context:
+            await self._close_with_log(
+                code=CloseCodes.NO_QUESTIONS.code,
+                message=CloseCodes.NO_QUESTIONS.message,
             )
+            return
+
+        # NOTE: Questions are sent once; later messages reference them by index
+        await self._send_json(
+            data={
+                "type": MessageTypes.QUESTIONS,
+                "questions": list(self.meeting_context.descriptions),
+            }
+        )
+
+        if self.participant_display_name != requested_username:
             # NOTE: Inform frontend of modified username
             await self._send_json(
                 data={
@@ -556,84 +651,185 @@ class ParticipantMeetingConsumer(BaseMeetingConsumer):
                     "name": self.participant_display_name,
                 }
             )
-        else:
-            self.participant_display_name = requested_username
 
-        # NOTE: Update cached username list with new participant
-        existing_usernames_list.append(self.participant_display_name)
-        await cache.aset(
-            key=utils.get_username_cache_key(self.meeting_access_code),
-            value=existing_usernames_list,
-            timeout=3600,  # ? Consider making cache timeout configurable
+        # NOTE: Lets the participant resume this session if its connection drops
+        # NOTE: Sent before joining the groups, so it precedes every meeting frame
+        (
+            self.reconnect_token,
+            self.participant_session_id,
+        ) = await reconnect.create_participant_session(
+            meeting_access_code=self.meeting_access_code,
+            meeting_id=self.meeting_context.meeting_id,
+            display_name=self.participant_display_name,
+            channel_name=self.channel_name,
+        )
+        await self._send_json(
+            data={"type": MessageTypes.SESSION_TOKEN, "token": self.reconnect_token}
         )
 
         # NOTE: Add participant to channel group for message broadcasting
         await self.channel_layer.group_add(
             group=self.participant_channel_group_name, channel=self.channel_name
         )
+        # NOTE: Question frames arrive pre-encoded through this worker's broadcaster
+        await meeting_broadcaster.subscribe(self.meeting_access_code, self)
+
+        # NOTE: Record presence; this worker keeps the entry alive while connected
+        live_participant_count: int = await presence.mark_present(
+            meeting_access_code=self.meeting_access_code,
+            display_name=self.participant_display_name,
+        )
+        presence_heartbeat.track(
+            self.meeting_access_code, self.participant_display_name
+        )
+
+        # NOTE: Notify host of new participant (batched into the next host update)
+        if host_updates.is_enabled():
+            host_updates.add_join(
+                meeting_access_code=self.meeting_access_code,
+                display_name=self.participant_display_name,
+                participant_count=live_participant_count,
+            )
+        else:
+            await self._group_send(
+                group=self.host_channel_group_name,
+                message={
+                    "type": MessageTypes.PARTICIPANT_JOINED,
+                    "participant_name": self.participant_display_name,
+                    "participant_channel": self.channel_name,
+                    "participant_count": live_participant_count,
+                },
+            )
+
+    async def resume_participant(self, event: dict[str, Any]) -> None:
+        """
+        Restores the session of a participant reconnecting with its token.
+
+        The participant keeps its display name and receives the current
+        question; the host is not notified since it never saw a departure.
+
+        Args:
+            event: Message event containing participant join data
+        """
+        resumed_participant: reconnect.ResumedParticipant | None = (
+            self.resumed_participant
+        )
+        if not resumed_participant:
+            return
+        if not await reconnect.resume_participant_session(
+            meeting_access_code=self.meeting_access_code,
+            token=self.reconnect_token,
+            channel_name=self.channel_name,
+        ):
+            # NOTE: The grace window ran out meanwhile - the participant joins anew
+            self.resumed_participant = None
+            self.reconnect_token = ""
+            await self.join_participant(event)
+            return
+        self.participant_display_name = resumed_participant.display_name
+        self.participant_session_id = resumed_participant.participant_session_id
+
+        self.meeting_context = await get_meeting_context(self.meeting_access_code)
+        if not self.meeting_context:
+            await self._close_with_log(
+                code=CloseCodes.NO_QUESTIONS.code,
+                message=CloseCodes.NO_QUESTIONS.message,
+            )
+            return
+        await self._send_json(
+            data={
+                "type": MessageTypes.QUESTIONS,
+                "questions": list(self.meeting_context.descriptions),
+            }
+        )
+        if self.participant_display_name != event.get("name"):
+            await self._send_json(
+                data={
+                    "type": MessageTypes.UPDATE_NAME,
+                    "name": self.participant_display_name,
+                }
+            )
 
-        # NOTE: Notify host of new participant
-        await self.channel_layer.group_send(
-            group=self.host_channel_group_name,
-            message={
-                "type": MessageTypes.PARTICIPANT_JOINED,
-                "participant_name": self.participant_display_name,
-                "participant_channel": self.channel_name,
-            },
+        await self.channel_layer.group_add(
+            group=self.participant_channel_group_name, channel=self.channel_name
+        )
+        await meeting_broadcaster.subscribe(self.meeting_access_code, self)
+        await presence.mark_returned(
+            meeting_access_code=self.meeting_access_code,
+            display_name=self.participant_display_name,
+        )
+        presence_heartbeat.track(
+            self.meeting_access_code, self.participant_display_name
         )
 
+        # NOTE: Bring the participant back to the question being answered
+        if resumed_participant.current_question:
+            await self._send_json(
+                data={
+                    "type": MessageTypes.START_MEETING,
+                    **resumed_participant.current_question,
+                    "remaining_seconds": resumed_participant.remaining_seconds,
+                }
+            )
+
+    @instrumented
     async def handle_submit_answer(self, event: dict[str, Any]) -> None:
         """
         Processes answer submission from participant.
 
-        Validates answer data, creates response record, and notifies host.
+        Validates answer data, queues the response for batch insertion,
+        and notifies host.
 
         Args:
             event: Message event containing answer submission data
         """
-        # NOTE: Extract answer and question data from event
+        # NOTE: Extract answer and question reference from event
         submitted_answer_text: str | None = event.get("answer", None)
-        associated_question_description: str | None = event.get("question", None)
+        question_reference: dict[str, Any] = self._get_question_reference(event)
 
-        if not submitted_answer_text or not associated_question_description:
+        if not submitted_answer_text or not question_reference:
             await self._send_json(data={"type": MessageTypes.SUBMIT_ERROR})
             return
 
-        # NOTE: Retrieve meeting object for answer association
-        meeting_instance: Meeting | None = await utils.get_meeting_by_access_code(
-            access_code=self.meeting_access_code
-        )
-        if not meeting_instance:
+        # NOTE: Resolve the question from the cached meeting context (no DB reads)
+        if not self.meeting_context:
             # ! This should never happen in normal operation
             await self._send_json(data={"type": MessageTypes.SUBMIT_ERROR})
             return
-
-        # NOTE: Retrieve question object for answer association
-        question_instance: Question | None = await utils.get_question(
-            question_description=associated_question_description,
-            meeting_instance=meeting_instance,
+        question_id: int | None = self.meeting_context.resolve_question_id(
+            question_index=question_reference.get("question_index"),
+            description=question_reference.get("question"),
         )
-        if not question_instance:
-            # ! This should never happen in normal operation
+        if question_id is None:
             await self._send_json(data={"type": MessageTypes.SUBMIT_ERROR})
             return
 
-        # NOTE: Create response model instance
-        response_instance: Response | None = await utils.create_response_model(
-            meeting_instance=meeting_instance,
-            question_instance=question_instance,
-            participant_response_text=submitted_answer_text,
+        # NOTE: Validate in memory and queue for the next batch insert
+        is_answer_accepted: bool = response_queue.submit(
+            meeting_id=self.meeting_context.meeting_id,
+            question_id=question_id,
+            response_text=submitted_answer_text,
+            participant_session_id=self.participant_session_id,
         )
-        if not response_instance:
+        if not is_answer_accepted:
             # NOTE: Answer validation failed (invalid content)
             await self._send_json(data={"type": MessageTypes.INVALID_ANSWER})
             return
-
-        # NOTE: Persist response to database
-        await response_instance.asave()
+        await lifecycle.record_response(self.meeting_access_code)
+        if aggregation.answer_insights.is_enabled():
+            aggregation.answer_insights.add_answer(
+                meeting_access_code=self.meeting_access_code,
+                question_index=self.meeting_context.ordered_question_ids.index(
+                    question_id
+                ),
+                answer_text=submitted_answer_text,
+            )
 
         # NOTE: Notify host that valid answer was submitted
-        await self.channel_layer.group_send(
+        if host_updates.is_enabled():
+            host_updates.add_answer(self.meeting_access_code)
+            return
+        await self._group_send(
             group=f"{GroupPrefixes.HOST}{self.meeting_access_code}",
             message={"type": MessageTypes.ANSWER_SUBMITTED},
         )
@@ -0,0 +1,139 @@
+"""
+Meeting Context Module
+
+This module provides a per-process cache of the immutable data
+participant consumers need to resolve answer submissions.
+
+Once the host calls `prepare_meeting_data`, the question set of a meeting
+is fixed, so the meeting id and its question ids are loaded once per
+process and shared by every participant connected to that meeting.
+Submissions are then resolved with dictionary lookups instead of queries.
+"""
+
+import asyncio
+import uuid
+from typing import NamedTuple
+
+from channels.db import database_sync_to_async
+
+from apps.director.models import Question
+
+
+class MeetingContext(NamedTuple):
+    """
+    Immutable lookup data for a meeting that is currently running.
+
+    Attributes:
+        meeting_id: The UUID of the Meeting
+        question_ids: Maps each question description to its Question id
+        ordered_question_ids: Question ids ordered by position (index addressing)
+        descriptions: Question descriptions ordered by position
+    """
+
+    meeting_id: uuid.UUID
+    question_ids: dict[str, int]
+    ordered_question_ids: tuple[int, ...]
+    descriptions: tuple[str, ...]
+
+    def resolve_question_id(
+        self, question_index: int | None = None, description: str | None = None
+    ) -> int | None:
+        """
+        Resolves a submitted question reference to its Question id.
+
+        The index (0-based position) is preferred; the description
+        is only used by clients still on the text protocol.
+
+        Returns:
+            The Question id if the reference is valid; None otherwise
+        """
+        if question_index is not None:
+            if 0 <= question_index < len(self.ordered_question_ids):
+                return self.ordered_question_ids[question_index]
+            return None
+        if description is not None:
+            return self.question_ids.get(description)
+        return None
+
+
+@database_sync_to_async
+def load_meeting_context(access_code: str) -> MeetingContext | None:
+    """
+    Loads the meeting context for the provided access code in a single query.
+
+    Args:
+        access_code: The unique access code of the meeting
+
+    Returns:
+        MeetingContext if the meeting exists and has questions; None otherwise
+    """
+    question_rows = (
+        Question.objects.filter(meeting__access_code=access_code)
+        .order_by("position")
+        .values_list("meeting_id", "id", "description")
+    )
+
+    meeting_id: uuid.UUID | None = None
+    question_ids: dict[str, int] = {}
+    ordered_question_ids: list[int] = []
+    descriptions: list[str] = []
+    for row_meeting_id, question_id, description in question_rows:
+        meeting_id = row_meeting_id
+        question_ids[description] = question_id
+        ordered_question_ids.append(question_id)
+        descriptions.append(description)
+
+    if meeting_id is None:
+        return None
+    return MeetingContext(
+        meeting_id=meeting_id,
+        question_ids=question_ids,
+        ordered_question_ids=tuple(ordered_question_ids),
+        descriptions=tuple(descriptions),
+    )
+
+
+# NOTE: Shared by every consumer in this process, keyed by access code
+_meeting_contexts: dict[str, MeetingContext] = {}
+_pending_context_loads: dict[str, asyncio.Task[MeetingContext | None]] = {}
+
+
+async def get_meeting_context(access_code: str) -> MeetingContext | None:
+    """
+    Returns the cached meeting context, loading it on first use.
+
+    Concurrent callers (e.g. a join storm) share a single in-flight load.
+
+    Args:
+        access_code: The unique access code of the meeting
+
+    Returns:
+        MeetingContext if the meeting exists and has questions; None otherwise
+    """
+    cached_context: MeetingContext | None = _meeting_contexts.get(access_code)
+    if cached_context:
+        return cached_context
+
+    load_task = _pending_context_loads.get(access_code)
+    if load_task is None:
+        load_task = asyncio.ensure_future(load_meeting_context(access_code))
+        _pending_context_loads[access_code] = load_task
+    try:
+        loaded_context: MeetingContext | None = await asyncio.shield(load_task)
+    finally:
+        if load_task.done():
+            _pending_context_loads.pop(access_code, None)
+
+    if loaded_context:
+        _meeting_contexts[access_code] = loaded_context
+    return loaded_context
+
+
+def forget_meeting_context(access_code: str) -> None:
+    """
+    Evicts the cached context once the meeting has ended.
+
+    Args:
+        access_code: The unique access code of the meeting
+    """
+    _meeting_contexts.pop(access_code, None)
@@ -0,0 +1,237 @@
+"""
+Response Ingestion Module
+
+This module provides the write-behind pipeline used by
+`ParticipantMeetingConsumer.handle_submit_answer`.
+
+Answers are validated in memory, accepted immediately and
+persisted in batches, so an answer burst costs one INSERT
+per batch instead of one per participant.
+
+Batches are flushed when either:
+- `RESPONSE_BATCH_SIZE` answers are pending
+- `RESPONSE_FLUSH_INTERVAL_SECONDS` have passed since the first pending answer
+- The meeting ends (`flush()` is awaited by the consumers)
+
+A batch whose insert fails is retried one answer at a time, so a single
+bad row (e.g. its question was deleted) only loses that answer. Lost
+answers are logged and counted by the instrumentation backend.
+
+Written answers are added to the `total_responses` of their participant
+session in the same transaction.
+"""
+
+import asyncio
+import logging
+import uuid
+from collections import Counter, defaultdict
+
+from channels.db import database_sync_to_async
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, transaction
+from django.db.models import F
+
+from apps.meeting.instrumentation import Instrumentation, get_instrumentation
+from apps.meeting.models import ParticipantSession, Response
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+RESPONSE_BATCH_SIZE: int = 100  # Pending answers that trigger an immediate flush
+RESPONSE_FLUSH_INTERVAL_SECONDS: float = 0.5  # Max time an answer waits in memory
+
+# NOTE: Foreign keys are excluded from in-memory validation because
+# NOTE: Django validates them with an existence query per field
+IN_MEMORY_VALIDATION_EXCLUDES: list[str] = [
+    "meeting",
+    "question",
+    "participant_session",
+]
+
+
+def _count_participant_responses(responses: list[Response]) -> None:
+    """
+    Adds written responses to the `total_responses` of their participant sessions.
+
+    Sessions are grouped by their number of new responses, so a batch costs
+    one UPDATE per distinct count (usually one) instead of one per participant.
+    """
+    response_counts: Counter[int] = Counter(
+        response.participant_session_id
+        for response in responses
+        if response.participant_session_id is not None
+    )
+    participant_session_ids_by_count: defaultdict[int, list[int]] = defaultdict(list)
+    for participant_session_id, response_count in response_counts.items():
+        participant_session_ids_by_count[response_count].append(participant_session_id)
+    for response_count, session_ids in participant_session_ids_by_count.items():
+        ParticipantSession.objects.filter(id__in=session_ids).update(
+            total_responses=F("total_responses") + response_count
+        )
+
+
+@database_sync_to_async
+def _bulk_insert_responses(responses: list[Response]) -> None:
+    """
+    Persists the provided responses with a single `bulk_create` query.
+    """
+    with transaction.atomic():
+        Response.objects.bulk_create(responses, batch_size=RESPONSE_BATCH_SIZE)
+        _count_participant_responses(responses)
+
+
+@database_sync_to_async
+def _insert_responses_one_by_one(responses: list[Response]) -> int:
+    """
+    Persists the provided responses with one query each, skipping the failing ones.
+
+    Returns:
+        Number of responses written
+    """
+    written_count: int = 0
+    for response in responses:
+        try:
+            # NOTE: A savepoint per row, so one failure never aborts the others
+            with transaction.atomic():
+                response.save(force_insert=True)
+                _count_participant_responses([response])
+            written_count += 1
+        except DatabaseError as error:
+            logger.warning(
+                "Dropped response to question %s: %s", response.question_id, error
+            )
+    return written_count
+
+
+class ResponseIngestionQueue:
+    """
+    Per-process buffer of validated `Response` instances awaiting insertion.
+
+    The queue is only touched from the event loop, so swapping the
+    pending list is atomic and no lock is required.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = RESPONSE_BATCH_SIZE,
+        flush_interval: float = RESPONSE_FLUSH_INTERVAL_SECONDS,
+    ):
+        self.batch_size: int = batch_size
+        self.flush_interval: float = flush_interval
+        self._pending: list[Response] = []
+        self._flush_timer: asyncio.Task[None] | None = None
+        self._inflight_flushes: set[asyncio.Task[int]] = set()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def build_response(
+        self,
+        meeting_id: uuid.UUID,
+        question_id: int,
+        response_text: str,
+        participant_session_id: int | None = None,
+    ) -> Response | None:
+        """
+        Creates and validates a new Response instance without touching the database.
+
+        Returns:
+            Valid Response instance ready for queueing; None if validation fails
+        """
+        new_response_instance = Response(
+            meeting_id=meeting_id,
+            question_id=question_id,
+            participant_session_id=participant_session_id,
+            response_text=response_text,
+        )
+        try:
+            # NOTE: Validates blank/max_length constraints, skips DB backed checks
+            new_response_instance.clean_fields(exclude=IN_MEMORY_VALIDATION_EXCLUDES)
+            return new_response_instance
+        except ValidationError:
+            return None
+
+    def submit(
+        self,
+        meeting_id: uuid.UUID,
+        question_id: int,
+        response_text: str,
+        participant_session_id: int | None = None,
+    ) -> bool:
+        """
+        Validates an answer and queues it for the next batch insert.
+
+        Returns:
+            True if the answer was accepted; False if validation failed
+        """
+        response_instance: Response | None = self.build_response(
+            meeting_id=meeting_id,
+            question_id=question_id,
+            response_text=response_text,
+            participant_session_id=participant_session_id,
+        )
+        if not response_instance:
+            return False
+
+        self._pending.append(response_instance)
+        if len(self._pending) >= self.batch_size:
+            self._start_flush()
+        elif self._flush_timer is None or self._flush_timer.done():
+            self._flush_timer = asyncio.create_task(self._flush_after_interval())
+        return True
+
+    async def flush(self) -> int:
+        """
+        Persists every pending answer and waits for in-flight batches.
+
+        ! CRITICAL: Must be awaited when a meeting ends so that no
+        answer is left in memory after the meeting is finalized.
+
+        Returns:
+            Number of answers written by this call
+        """
+        if self._flush_timer and not self._flush_timer.done():
+            self._flush_timer.cancel()
+        flush_task: asyncio.Task[int] = self._start_flush()
+        if self._inflight_flushes:
+            await asyncio.gather(*self._inflight_flushes, return_exceptions=True)
+        return flush_task.result() if not flush_task.cancelled() else 0
+
+    def _start_flush(self) -> asyncio.Task[int]:
+        """Hands the pending batch over to a background insert task"""
+        batch, self._pending = self._pending, []
+        flush_task: asyncio.Task[int] = asyncio.create_task(self._write_batch(batch))
+        self._inflight_flushes.add(flush_task)
+        flush_task.add_done_callback(self._inflight_flushes.discard)
+        return flush_task
+
+    async def _flush_after_interval(self) -> None:
+        """Background task flushing whatever is pending after the time window"""
+        await asyncio.sleep(self.flush_interval)
+        if self._pending:
+            self._start_flush()
+
+    async def _write_batch(self, batch: list[Response]) -> int:
+        if not batch:
+            return 0
+        try:
+            await _bulk_insert_responses(batch)
+            return len(batch)
+        except DatabaseError as error:
+            # NOTE: Usually a meeting/question was deleted - keep the other answers
+            logger.warning(
+                "Batch insert of %d responses failed, retrying one by one: %s",
+                len(batch),
+                error,
+            )
+        written_count: int = await _insert_responses_one_by_one(batch)
+        dropped_count: int = len(batch) - written_count
+        if dropped_count:
+            logger.error("Dropped %d of %d responses", dropped_count, len(batch))
+            instrumentation: Instrumentation | None = get_instrumentation()
+            if instrumentation is not None:
+                instrumentation.responses_dropped(dropped_count)
+        return written_count
+
+
+# NOTE: Shared by every consumer in this process
+response_queue = ResponseIngestionQueue()
@@ -0,0 +1,338 @@
+"""
+Meeting Instrumentation Module
+
+This module measures where time goes while the meeting consumers run.
+
+Every message dispatched to a consumer, every `handle_*` handler, every
+channel layer group send and every database query issued on behalf of a
+meeting is reported to the backend named by `MEETING_INSTRUMENTATION_BACKEND`
+(None disables instrumentation). The default `InMemoryInstrumentation` keeps
+per-process histograms and counters, rendered in the Prometheus text format
+by the staff-only metrics view; each daphne worker exposes its own metrics.
+
+Database time is attributed to a meeting through the `current_meeting`
+context variable, which asgiref copies into `database_sync_to_async` threads.
+"""
+
+import bisect
+import functools
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from typing import Any
+
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.utils.module_loading import import_string
+
+HISTOGRAM_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+MAX_TRACKED_MEETINGS: int = 100  # Per-meeting series kept for the latest meetings
+
+# NOTE: Access code of the meeting whose consumer is currently running
+current_meeting: ContextVar[str] = ContextVar("current_meeting", default="")
+
+
+class Histogram:
+    """Cumulative latency histogram using the fixed `HISTOGRAM_BUCKETS`"""
+
+    __slots__ = ("bucket_counts", "count", "total")
+
+    def __init__(self) -> None:
+        self.bucket_counts: list[int] = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        self.count: int = 0
+        self.total: float = 0.0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect.bisect_left(HISTOGRAM_BUCKETS, value)] += 1
+        self.count += 1
+        self.total += value
+
+
+class MeetingTotals:
+    """Time spent on behalf of a single meeting"""
+
+    __slots__ = (
+        "message_count",
+        "handler_seconds",
+        "group_send_seconds",
+        "query_count",
+        "query_seconds",
+    )
+
+    def __init__(self) -> None:
+        self.message_count: int = 0
+        self.handler_seconds: float = 0.0
+        self.group_send_seconds: float = 0.0
+        self.query_count: int = 0
+        self.query_seconds: float = 0.0
+
+
+class Instrumentation:
+    """
+    Interface of instrumentation backends.
+
+    Subclass it and point `MEETING_INSTRUMENTATION_BACKEND` at the subclass
+    to export the measurements elsewhere (e.g. StatsD, OpenTelemetry).
+    """
+
+    def handler_finished(
+        self, handler: str, meeting_access_code: str, duration: float, failed: bool
+    ) -> None:
+        """Called after a consumer handler or dispatched message completes"""
+
+    def group_send_finished(self, meeting_access_code: str, duration: float) -> None:
+        """Called after a channel layer group send completes"""
+
+    def query_finished(self, meeting_access_code: str, duration: float) -> None:
+        """Called after a database query of a meeting completes"""
+
+    def responses_dropped(self, count: int) -> None:
+        """Called when submitted answers could not be persisted"""
+
+    def render(self) -> str:
+        """Returns the metrics in the Prometheus text exposition format"""
+        return ""
+
+
+class InMemoryInstrumentation(Instrumentation):
+    """
+    Keeps the measurements of this process in memory.
+
+    Handler, group send and query latencies are global histograms;
+    per-meeting totals are kept for the `MAX_TRACKED_MEETINGS` latest meetings.
+    """
+
+    def __init__(self) -> None:
+        # NOTE: Queries are reported from database threads
+        self._lock = threading.Lock()
+        self._handler_histograms: defaultdict[str, Histogram] = defaultdict(Histogram)
+        self._handler_errors: defaultdict[str, int] = defaultdict(int)
+        self._group_send_histogram = Histogram()
+        self._query_histogram = Histogram()
+        self._meeting_totals: OrderedDict[str, MeetingTotals] = OrderedDict()
+        self._dropped_response_count: int = 0
+
+    def _get_meeting_totals(self, meeting_access_code: str) -> MeetingTotals | None:
+        if not meeting_access_code:
+            return None
+        meeting_totals = self._meeting_totals.get(meeting_access_code)
+        if meeting_totals is None:
+            meeting_totals = self._meeting_totals[meeting_access_code] = MeetingTotals()
+            if len(self._meeting_totals) > MAX_TRACKED_MEETINGS:
+                self._meeting_totals.popitem(last=False)
+        else:
+            self._meeting_totals.move_to_end(meeting_access_code)
+        return meeting_totals
+
+    def handler_finished(
+        self, handler: str, meeting_access_code: str, duration: float, failed: bool
+    ) -> None:
+        with self._lock:
+            self._handler_histograms[handler].observe(duration)
+            if failed:
+                self._handler_errors[handler] += 1
+            meeting_totals = self._get_meeting_totals(meeting_access_code)
+            if meeting_totals:
+                meeting_totals.message_count += 1
+                meeting_totals.handler_seconds += duration
+
+    def group_send_finished(self, meeting_access_code: str, duration: float) -> None:
+        with self._lock:
+            self._group_send_histogram.observe(duration)
+            meeting_totals = self._get_meeting_totals(meeting_access_code)
+            if meeting_totals:
+                meeting_totals.group_send_seconds += duration
+
+    def query_finished(self, meeting_access_code: str, duration: float) -> None:
+        with self._lock:
+            self._query_histogram.observe(duration)
+            meeting_totals = self._get_meeting_totals(meeting_access_code)
+            if meeting_totals:
+                meeting_totals.query_count += 1
+                meeting_totals.query_seconds += duration
+
+    def responses_dropped(self, count: int) -> None:
+        with self._lock:
+            self._dropped_response_count += count
+
+    def render(self) -> str:
+        lines: list[str] = []
+        with self._lock:
+            _render_histogram(
+                lines,
+                "collaboard_meeting_handler_seconds",
+                "Duration of meeting consumer handlers",
+                {
+                    f'handler="{handler}"': histogram
+                    for handler, histogram in sorted(self._handler_histograms.items())
+                },
+            )
+            _render_counter(
+                lines,
+                "collaboard_meeting_handler_errors_total",
+                "Meeting consumer handlers that raised",
+                {
+                    f'handler="{handler}"': error_count
+                    for handler, error_count in sorted(self._handler_errors.items())
+                },
+            )
+            _render_histogram(
+                lines,
+                "collaboard_meeting_group_send_seconds",
+                "Duration of channel layer group sends",
+                {"": self._group_send_histogram},
+            )
+            _render_histogram(
+                lines,
+                "collaboard_meeting_query_seconds",
+                "Duration of database queries issued by meetings",
+                {"": self._query_histogram},
+            )
+            _render_counter(
+                lines,
+                "collaboard_meeting_responses_dropped_total",
+                "Submitted answers that could not be persisted",
+                {"": self._dropped_response_count},
+            )
+            for field, help_text in (
+                ("message_count", "Messages handled per meeting"),
+                ("handler_seconds", "Handler time per meeting"),
+                ("group_send_seconds", "Channel layer send time per meeting"),
+                ("query_count", "Database queries per meeting"),
+                ("query_seconds", "Database time per meeting"),
+            ):
+                _render_counter(
+                    lines,
+                    f"collaboard_meeting_{field}_total",
+                    help_text,
+                    {
+                        f'meeting="{meeting_access_code}"': getattr(totals, field)
+                        for meeting_access_code, totals in self._meeting_totals.items()
+                    },
+                )
+        return "\n".join(lines) + "\n"
+
+
+def _render_histogram(
+    lines: list[str], name: str, help_text: str, series: dict[str, Histogram]
+) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for labels, histogram in series.items():
+        label_prefix: str = f"{labels}," if labels else ""
+        cumulative_count: int = 0
+        for upper_bound, bucket_count in zip(
+            (*HISTOGRAM_BUCKETS, "+Inf"), histogram.bucket_counts
+        ):
+            cumulative_count += bucket_count
+            lines.append(
+                f'{name}_bucket{{{label_prefix}le="{upper_bound}"}} {cumulative_count}'
+            )
+        label_suffix: str = f"{{{labels}}}" if labels else ""
+        lines.append(f"{name}_sum{label_suffix} {histogram.total}")
+        lines.append(f"{name}_count{label_suffix} {histogram.count}")
+
+
+def _render_counter(
+    lines: list[str], name: str, help_text: str, series: dict[str, float]
+) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} counter")
+    for labels, value in series.items():
+        label_suffix: str = f"{{{labels}}}" if labels else ""
+        lines.append(f"{name}{label_suffix} {value}")
+
+
+_instrumentation_backends: dict[str, Instrumentation] = {}
+
+
+def get_instrumentation() -> Instrumentation | None:
+    """
+    Returns the configured instrumentation backend of this process.
+
+    Returns:
+        The backend instance; None if `MEETING_INSTRUMENTATION_BACKEND` is unset
+    """
+    backend_path: str | None = getattr(
+        settings, "MEETING_INSTRUMENTATION_BACKEND", None
+    )
+    if not backend_path:
+        return None
+    backend = _instrumentation_backends.get(backend_path)
+    if backend is None:
+        backend = _instrumentation_backends[backend_path] = import_string(
+            backend_path
+        )()
+    return backend
+
+
+def instrumented(
+    handler: Callable[..., Awaitable[None]],
+) -> Callable[..., Awaitable[None]]:
+    """
+    Decorates a consumer handler to report its duration and failures.
+    """
+
+    @functools.wraps(handler)
+    async def instrumented_handler(consumer: Any, *args: Any, **kwargs: Any) -> None:
+        instrumentation: Instrumentation | None = get_instrumentation()
+        if instrumentation is None:
+            return await handler(consumer, *args, **kwargs)
+
+        started_at: float = time.perf_counter()
+        failed: bool = False
+        try:
+            return await handler(consumer, *args, **kwargs)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            instrumentation.handler_finished(
+                handler=handler.__name__,
+                meeting_access_code=current_meeting.get(),
+                duration=time.perf_counter() - started_at,
+                failed=failed,
+            )
+
+    return instrumented_handler
+
+
+def _time_query(execute: Any, sql: str, params: Any, many: bool, context: Any) -> Any:
+    meeting_access_code: str = current_meeting.get()
+    instrumentation: Instrumentation | None = get_instrumentation()
+    if not meeting_access_code or instrumentation is None:
+        return execute(sql, params, many, context)
+
+    started_at: float = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        instrumentation.query_finished(
+            meeting_access_code, time.perf_counter() - started_at
+        )
+
+
+def _install_query_timer(sender: Any, connection: Any, **kwargs: Any) -> None:
+    if _time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_time_query)
+
+
+def install_query_timer() -> None:
+    """Times the queries of every database connection opened by this process"""
+    connection_created.connect(
+        _install_query_timer, dispatch_uid="meeting_instrumentation_query_timer"
+    )
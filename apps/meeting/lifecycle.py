@@ -0,0 +1,527 @@
+"""
+Meeting Lifecycle Module
+
+This module starts and ends meetings independently of the host's socket.
+
+Running meetings are tracked in Redis so that any daphne worker can end them:
+- `meeting:deadlines` is a sorted set of access codes scored by the epoch
+  at which the meeting must end (on the first shard, shared by every meeting)
+- `meeting:{access_code}:state` is a hash of the running meeting's statistics
+  (start and end epochs, questions presented, responses submitted) and the
+  JSON reference of the question currently presented
+
+The worker that started a meeting fires its deadline on time through the
+process-wide `meeting_deadlines` scheduler. Every worker also polls the
+sorted set, so the deadlines of crashed or restarted workers still fire.
+Removing an access code from the sorted set (ZREM) claims the end of its
+meeting, so a meeting is finalized exactly once even when workers race.
+
+The state hash is the live record of a running meeting: reconnecting hosts
+and participants are synced from it with a single HGETALL instead of
+waiting for the next broadcast. The worker serving a meeting's host
+checkpoints it to `MeetingSession` every `MEETING_CHECKPOINT_INTERVAL_SECONDS`,
+which `get_live_state` falls back to if the hash is lost. The checkpoint is
+removed when the meeting ends, so only running meetings have one.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from channels.db import database_sync_to_async
+from channels.layers import BaseChannelLayer
+from redis.asyncio import Redis
+
+from apps.meeting import aggregation, codec, presence, registry, store, utils
+from apps.meeting.constants import (
+    MAX_MEETING_DURATION_SECONDS,
+    MEETING_KEY_TIMEOUT_SECONDS,
+    GroupPrefixes,
+    MessageTypes,
+)
+from apps.meeting.context import forget_meeting_context
+from apps.meeting.ingestion import response_queue
+from apps.meeting.models import MeetingSession
+from apps.meeting.timers import meeting_deadlines
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+MEETING_DEADLINES_KEY: str = "meeting:deadlines"
+DEADLINE_POLL_INTERVAL_SECONDS: int = 5  # Fallback for deadlines of other workers
+EXPIRED_MEETINGS_BATCH_SIZE: int = 100  # Max meetings ended per poll
+MEETING_CHECKPOINT_INTERVAL_SECONDS: int = 10  # Max live state lost with Redis
+
+
+class LiveMeetingState(NamedTuple):
+    """
+    Live state of a running meeting, replayed to reconnecting clients.
+
+    Attributes:
+        started_at: Epoch at which the meeting started
+        ends_at: Epoch at which the meeting is ended automatically
+        questions_presented: Number of questions presented so far
+        current_question: Reference of the question being presented, if any
+    """
+
+    started_at: float
+    ends_at: float
+    questions_presented: int
+    current_question: dict[str, Any] | None
+
+    @property
+    def current_question_index(self) -> int:
+        """Index of the question being presented"""
+        question_index: Any = (self.current_question or {}).get("question_index")
+        if isinstance(question_index, int):
+            return question_index
+        # NOTE: Hosts referencing questions by text present them in order
+        return max(self.questions_presented - 1, 0)
+
+    def get_elapsed_seconds(self) -> int:
+        """Seconds since the meeting started"""
+        return max(int(time.time() - self.started_at), 0)
+
+    def get_remaining_seconds(self) -> int:
+        """Seconds until the meeting is ended automatically"""
+        return max(int(self.ends_at - time.time()), 0)
+
+
+def get_meeting_state_key(meeting_access_code: str) -> str:
+    """Key of the hash storing the statistics of a running meeting"""
+    return f"meeting:{meeting_access_code}:state"
+
+
+def parse_meeting_state(meeting_state: dict[str, str]) -> LiveMeetingState | None:
+    """
+    Builds the live state of a meeting from its state hash.
+
+    Args:
+        meeting_state: Fields of `meeting:{access_code}:state` (HGETALL)
+
+    Returns:
+        The live state; None if the meeting is not running
+    """
+    started_at: str | None = meeting_state.get("started_at")
+    if not started_at:
+        return None
+    current_question: str | None = meeting_state.get("current_question")
+    return LiveMeetingState(
+        started_at=float(started_at),
+        ends_at=float(meeting_state.get("ends_at", started_at)),
+        questions_presented=int(meeting_state.get("questions_presented", 1)),
+        current_question=codec.decode(current_question) if current_question else None,
+    )
+
+
+async def get_live_state(meeting_access_code: str) -> LiveMeetingState | None:
+    """
+    Returns the live state of a running meeting.
+
+    Read from Redis with a single round trip; the last `MeetingSession`
+    checkpoint is only queried when the state hash is missing.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+
+    Returns:
+        The live state; None if the meeting is not running
+    """
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    # NOTE: redis-py types hash commands as returning either a value or an awaitable
+    meeting_state: dict[str, str] = await redis_client.hgetall(  # type: ignore[misc]
+        get_meeting_state_key(meeting_access_code)
+    )
+    live_state: LiveMeetingState | None = parse_meeting_state(meeting_state)
+    if live_state:
+        return live_state
+    return await _load_meeting_checkpoint(meeting_access_code)
+
+
+@database_sync_to_async
+def _load_meeting_checkpoint(meeting_access_code: str) -> LiveMeetingState | None:
+    """
+    Rebuilds the live state of a running meeting from its last checkpoint.
+    """
+    meeting_checkpoint: tuple[int, int, datetime, int] | None = (
+        MeetingSession.objects.filter(meeting__access_code=meeting_access_code)
+        .values_list(
+            "current_duration",
+            "current_question_index",
+            "updated_at",
+            "meeting__duration",
+        )
+        .first()
+    )
+    if not meeting_checkpoint:
+        return None
+    current_duration, current_question_index, updated_at, duration = meeting_checkpoint
+    started_at: float = updated_at.timestamp() - current_duration
+    return LiveMeetingState(
+        started_at=started_at,
+        ends_at=started_at + duration * 60,
+        questions_presented=current_question_index + 1,
+        current_question={"question_index": current_question_index},
+    )
+
+
+@database_sync_to_async
+def _save_meeting_checkpoints(meeting_sessions: list[MeetingSession]) -> None:
+    """
+    Upserts the checkpoints of several meetings with a single query.
+    """
+    MeetingSession.objects.bulk_create(
+        meeting_sessions,
+        update_conflicts=True,
+        unique_fields=["meeting"],
+        update_fields=["current_duration", "current_question_index", "updated_at"],
+    )
+
+
+@database_sync_to_async
+def _delete_meeting_checkpoint(meeting_access_code: str) -> None:
+    MeetingSession.objects.filter(meeting__access_code=meeting_access_code).delete()
+
+
+async def start_meeting(
+    meeting_access_code: str,
+    duration_seconds: int,
+    current_question: dict[str, Any] | None = None,
+    meeting_id: uuid.UUID | None = None,
+) -> bool:
+    """
+    Records the start of a meeting and registers its deadline.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+        duration_seconds: Seconds until the meeting is ended automatically
+        current_question: Reference of the first question presented
+        meeting_id: The UUID of the Meeting; its live state is checkpointed if set
+
+    Returns:
+        True if the meeting was started; False if it was already running
+    """
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    state_key: str = get_meeting_state_key(meeting_access_code)
+    started_at: float = time.time()
+
+    # NOTE: A reconnecting host must not restart the clock of a running meeting
+    # NOTE: redis-py types hash commands as returning either a value or an awaitable
+    if not await redis_client.hsetnx(  # type: ignore[misc]
+        state_key, "started_at", str(started_at)
+    ):
+        return False
+
+    ends_at: float = started_at + duration_seconds
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.hset(state_key, mapping={"questions_presented": 1, "ends_at": ends_at})
+        if meeting_id:
+            pipe.hset(state_key, "meeting_id", str(meeting_id))
+        if current_question:
+            pipe.hset(state_key, "current_question", codec.encode(current_question))
+        pipe.expire(state_key, MEETING_KEY_TIMEOUT_SECONDS)
+        await pipe.execute()
+    # NOTE: The deadline set may live on another shard than the meeting
+    await store.get_redis_client().zadd(
+        MEETING_DEADLINES_KEY, {meeting_access_code: ends_at}
+    )
+
+    if meeting_id:
+        meeting_checkpointer.track(meeting_access_code)
+
+    meeting_deadlines.schedule(
+        key=meeting_access_code,
+        delay_seconds=duration_seconds,
+        callback=lambda: end_meeting_if_claimed(meeting_access_code),
+    )
+    return True
+
+
+async def is_meeting_started(meeting_access_code: str) -> bool:
+    """
+    Returns whether the meeting is currently running.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+    """
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    return bool(
+        await redis_client.hexists(  # type: ignore[misc]
+            get_meeting_state_key(meeting_access_code), "started_at"
+        )
+    )
+
+
+async def record_question_presented(
+    meeting_access_code: str, current_question: dict[str, Any] | None = None
+) -> None:
+    """
+    Counts a question presented by the host.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+        current_question: Reference of the question, replayed to reconnecting
+            participants
+    """
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    state_key: str = get_meeting_state_key(meeting_access_code)
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.hincrby(state_key, "questions_presented", 1)
+        if current_question:
+            pipe.hset(state_key, "current_question", codec.encode(current_question))
+        pipe.expire(state_key, MEETING_KEY_TIMEOUT_SECONDS)
+        await pipe.execute()
+
+
+async def record_response(meeting_access_code: str) -> None:
+    """
+    Counts an answer accepted from a participant.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+    """
+    await _increment_statistic(meeting_access_code, "responses_count")
+
+
+async def _increment_statistic(meeting_access_code: str, field: str) -> None:
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    state_key: str = get_meeting_state_key(meeting_access_code)
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.hincrby(state_key, field, 1)
+        pipe.expire(state_key, MEETING_KEY_TIMEOUT_SECONDS)
+        await pipe.execute()
+
+
+async def claim_meeting_end(meeting_access_code: str) -> bool:
+    """
+    Claims the right to end a running meeting.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+
+    Returns:
+        True if the caller must end the meeting; False if another caller did
+    """
+    meeting_deadlines.cancel(meeting_access_code)
+    redis_client: Redis = store.get_redis_client()
+    return bool(await redis_client.zrem(MEETING_DEADLINES_KEY, meeting_access_code))
+
+
+async def end_meeting(meeting_access_code: str) -> None:
+    """
+    Persists the meeting statistics, notifies every consumer and cleans up.
+
+    A running meeting must be claimed with `claim_meeting_end` first.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+    """
+    # NOTE: Persist answers buffered by this worker before the meeting is finalized
+    await response_queue.flush()
+    forget_meeting_context(meeting_access_code)
+    await meeting_checkpointer.discard(meeting_access_code)
+
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    meeting_state: dict[str, str] = await redis_client.hgetall(  # type: ignore[misc]
+        get_meeting_state_key(meeting_access_code)
+    )
+    started_at: str | None = meeting_state.get("started_at")
+
+    # NOTE: Every participant that joined counts, including those who left
+    total_participant_count: int = await presence.get_total_joined_count(
+        meeting_access_code
+    )
+    await utils.finalize_meeting(
+        meeting_access_code=meeting_access_code,
+        statistics=utils.MeetingStatistics(
+            duration_seconds=int(time.time() - float(started_at)) if started_at else 0,
+            participant_count=total_participant_count,
+            questions_presented_count=int(meeting_state.get("questions_presented", 1)),
+            responses_count=int(meeting_state.get("responses_count", 0)),
+        ),
+    )
+
+    # NOTE: Participants and hosts may be connected to any worker
+    channel_layer: BaseChannelLayer = utils.get_meeting_channel_layer()
+    await channel_layer.group_send(
+        f"{GroupPrefixes.PARTICIPANT}{meeting_access_code}",
+        {"type": MessageTypes.END_MEETING},
+    )
+    await channel_layer.group_send(
+        f"{GroupPrefixes.HOST}{meeting_access_code}",
+        {"type": MessageTypes.END_MEETING},
+    )
+
+    # NOTE: Clean up all meeting-related cache entries (the lock included)
+    await registry.close_registry(meeting_access_code)
+    await presence.clear_presence(meeting_access_code)
+    aggregation.answer_insights.discard(meeting_access_code)
+    await aggregation.clear_answer_insights(meeting_access_code)
+    await redis_client.delete(get_meeting_state_key(meeting_access_code))
+
+
+async def end_meeting_if_claimed(meeting_access_code: str) -> bool:
+    """
+    Ends a running meeting unless another caller already claimed it.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+
+    Returns:
+        True if this call ended the meeting
+    """
+    if not await claim_meeting_end(meeting_access_code):
+        return False
+    await end_meeting(meeting_access_code)
+    return True
+
+
+async def end_expired_meetings() -> list[str]:
+    """
+    Ends every meeting whose deadline has passed.
+
+    Returns:
+        The access codes of the meetings ended by this call
+    """
+    redis_client: Redis = store.get_redis_client()
+    expired_access_codes: list[str] = await redis_client.zrangebyscore(
+        MEETING_DEADLINES_KEY,
+        "-inf",
+        time.time(),
+        start=0,
+        num=EXPIRED_MEETINGS_BATCH_SIZE,
+    )
+    ended_access_codes: list[str] = []
+    for meeting_access_code in expired_access_codes:
+        if await end_meeting_if_claimed(meeting_access_code):
+            ended_access_codes.append(meeting_access_code)
+    return ended_access_codes
+
+
+class MeetingEndPoller:
+    """
+    Periodically ends the expired meetings of every worker.
+
+    A single background task per process polls the shared deadline set;
+    meetings whose worker is alive are normally ended on time by that
+    worker's own scheduler before the poller sees them.
+    """
+
+    def __init__(self, interval: float = DEADLINE_POLL_INTERVAL_SECONDS):
+        self.interval: float = interval
+        self._poller_task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Starts polling in the running event loop if not already polling"""
+        if (
+            self._poller_task
+            and not self._poller_task.done()
+            and self._poller_task.get_loop() is asyncio.get_running_loop()
+        ):
+            return
+        self._poller_task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await end_expired_meetings()
+            except Exception:
+                # NOTE: Keep polling; unclaimed deadlines are retried on the next poll
+                logger.exception("Ending expired meetings failed")
+
+
+# NOTE: Shared by every consumer in this process
+meeting_end_poller = MeetingEndPoller()
+
+
+class MeetingStateCheckpointer:
+    """
+    Periodically checkpoints the live state of running meetings to `MeetingSession`.
+
+    Each worker checkpoints the meetings whose host it serves, all of them
+    with one HGETALL pipeline and one upsert per interval, so a lost state
+    hash costs at most `MEETING_CHECKPOINT_INTERVAL_SECONDS` of progress.
+    """
+
+    def __init__(self, interval: float = MEETING_CHECKPOINT_INTERVAL_SECONDS):
+        self.interval: float = interval
+        self._tracked_access_codes: set[str] = set()
+        # NOTE: Keeps a checkpoint in flight from recreating a discarded one
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._checkpoint_task: asyncio.Task[None] | None = None
+
+    def track(self, meeting_access_code: str) -> None:
+        """Checkpoints the meeting until it ends"""
+        self._tracked_access_codes.add(meeting_access_code)
+        self.start()
+
+    async def discard(self, meeting_access_code: str) -> None:
+        """Stops checkpointing an ended meeting and removes its checkpoint"""
+        async with self._lock:
+            self._tracked_access_codes.discard(meeting_access_code)
+            await _delete_meeting_checkpoint(meeting_access_code)
+
+    def start(self) -> None:
+        """Starts checkpointing in the running event loop if not already running"""
+        if (
+            self._checkpoint_task
+            and not self._checkpoint_task.done()
+            and self._checkpoint_task.get_loop() is asyncio.get_running_loop()
+        ):
+            return
+        self._checkpoint_task = asyncio.create_task(self._run())
+
+    async def checkpoint(self) -> int:
+        """
+        Writes the live state of every tracked meeting.
+
+        Returns:
+            Number of meetings checkpointed
+        """
+        async with self._lock:
+            meeting_states: dict[str, dict[str, str]] = {}
+            # NOTE: One pipeline per shard
+            for redis_client, access_codes in store.group_by_client(
+                sorted(self._tracked_access_codes)
+            ).items():
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    for meeting_access_code in access_codes:
+                        pipe.hgetall(get_meeting_state_key(meeting_access_code))
+                    meeting_states.update(zip(access_codes, await pipe.execute()))
+
+            meeting_sessions: list[MeetingSession] = []
+            for meeting_access_code, meeting_state in meeting_states.items():
+                live_state: LiveMeetingState | None = parse_meeting_state(meeting_state)
+                if not live_state or not meeting_state.get("meeting_id"):
+                    # NOTE: Ended by another worker
+                    self._tracked_access_codes.discard(meeting_access_code)
+                    continue
+                meeting_sessions.append(
+                    MeetingSession(
+                        meeting_id=meeting_state["meeting_id"],
+                        current_duration=min(
+                            live_state.get_elapsed_seconds(),
+                            MAX_MEETING_DURATION_SECONDS,
+                        ),
+                        current_question_index=live_state.current_question_index,
+                    )
+                )
+            if meeting_sessions:
+                await _save_meeting_checkpoints(meeting_sessions)
+            return len(meeting_sessions)
+
+    async def _run(self) -> None:
+        while self._tracked_access_codes:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.checkpoint()
+            except Exception:
+                # NOTE: Keep checkpointing; Redis still holds the live state
+                logger.exception("Checkpointing meeting states failed")
+
+
+# NOTE: Shared by every consumer in this process
+meeting_checkpointer = MeetingStateCheckpointer()
@@ -0,0 +1,4 @@
+"""
+This package will handle
+all commands of the meeting app
+"""
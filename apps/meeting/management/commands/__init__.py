@@ -0,0 +1,3 @@
+"""
+Read the other __init__.py file
+"""
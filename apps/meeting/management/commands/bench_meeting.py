@@ -0,0 +1,155 @@
+import asyncio
+import multiprocessing
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connections
+from django.test.utils import override_settings
+
+from apps.meeting import store
+from apps.meeting.benchmark import (
+    BenchmarkReport,
+    MeetingBenchmark,
+    WorkerScalingReport,
+)
+from apps.meeting.constants import MessageTypes
+
+
+def run_benchmark(benchmark_options: dict[str, Any]) -> BenchmarkReport:
+    """
+    Runs one meeting in the current process.
+
+    Args:
+        benchmark_options: The `participants`, `questions`, `answers_per_question`,
+            `binary` and `fake_redis` command options
+
+    Returns:
+        The report of the meeting
+    """
+    benchmark = MeetingBenchmark(
+        participant_count=benchmark_options["participants"],
+        question_count=benchmark_options["questions"],
+        answers_per_question=benchmark_options["answers_per_question"],
+        binary_protocol=benchmark_options["binary"],
+    )
+
+    # NOTE: Consumers of a single worker share one in-memory channel layer
+    overridden_settings: dict[str, Any] = {
+        "CHANNEL_LAYERS": {
+            "default": {
+                "BACKEND": "channels.layers.InMemoryChannelLayer",
+                "CONFIG": {"capacity": 100_000},
+            }
+        }
+    }
+    if benchmark_options["fake_redis"]:
+        try:
+            import fakeredis
+        except ImportError as error:
+            raise CommandError("--fake-redis requires the fakeredis package") from error
+        fake_redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        store.get_redis_client = lambda meeting_access_code=None: fake_redis_client
+        overridden_settings["CACHES"] = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+        }
+
+    with override_settings(**overridden_settings):
+        return asyncio.run(benchmark.run())
+
+
+# Usage: python manage.py bench_meeting --participants 500 --fake-redis
+#        python manage.py bench_meeting --participants 200 --workers 1 2 4
+class Command(BaseCommand):
+    help = "Benchmark the meeting consumers with one host and N participants"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--participants", type=int, default=100)
+        parser.add_argument("--questions", type=int, default=5)
+        parser.add_argument("--answers-per-question", type=int, default=1)
+        parser.add_argument(
+            "--binary",
+            action="store_true",
+            help="Connect participants with the binary MessagePack subprotocol",
+        )
+        parser.add_argument(
+            "--fake-redis",
+            action="store_true",
+            help="Use an in-memory Redis stand-in instead of the configured server",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            nargs="+",
+            help="Run one meeting per worker process for each worker count",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        benchmark_options: dict[str, Any] = {
+            option_name: options[option_name]
+            for option_name in (
+                "participants",
+                "questions",
+                "answers_per_question",
+                "binary",
+                "fake_redis",
+            )
+        }
+        if not options["workers"]:
+            self.print_report(run_benchmark(benchmark_options))
+            return
+        if min(options["workers"]) < 1:
+            raise CommandError("--workers must be at least 1")
+
+        scaling_reports: list[WorkerScalingReport] = []
+        for worker_count in options["workers"]:
+            # NOTE: Forked workers must not share the parent's database connections
+            connections.close_all()
+            with multiprocessing.get_context("fork").Pool(worker_count) as pool:
+                scaling_reports.append(
+                    WorkerScalingReport(
+                        reports=pool.map(
+                            run_benchmark, [benchmark_options] * worker_count
+                        )
+                    )
+                )
+        self.print_scaling_reports(scaling_reports)
+
+    def print_report(self, report: BenchmarkReport) -> None:
+        """
+        Prints the latency table and the throughput of the run
+        """
+        self.stdout.write(f"Participants: {report.participant_count}")
+        self.stdout.write(
+            f"{'Message type':<20}{'Samples':>10}{'p50 (ms)':>12}{'p99 (ms)':>12}"
+        )
+        for latency in report.latencies:
+            self.stdout.write(
+                f"{latency.message_type:<20}{latency.samples:>10}"
+                f"{latency.p50_ms:>12.2f}{latency.p99_ms:>12.2f}"
+            )
+        self.stdout.write(f"Frames/sec: {report.frames_per_second:.0f}")
+        self.stdout.write(f"Bytes/frame: {report.bytes_per_frame:.1f}")
+        self.stdout.write(f"DB queries per answer: {report.queries_per_answer:.3f}")
+
+    def print_scaling_reports(self, scaling_reports: list[WorkerScalingReport]) -> None:
+        """
+        Prints the aggregate throughput of each worker count, relative to the first
+        """
+        self.stdout.write(
+            f"{'Workers':<10}{'Participants':>14}{'Frames/sec':>12}"
+            f"{'Speedup':>10}{'Answer p99 (ms)':>18}"
+        )
+        baseline_frames_per_second: float = scaling_reports[0].frames_per_second
+        for scaling_report in scaling_reports:
+            speedup: float = (
+                scaling_report.frames_per_second / baseline_frames_per_second
+                if baseline_frames_per_second
+                else 0
+            )
+            self.stdout.write(
+                f"{scaling_report.worker_count:<10}"
+                f"{scaling_report.participant_count:>14}"
+                f"{scaling_report.frames_per_second:>12.0f}"
+                f"{speedup:>9.2f}x"
+                f"{scaling_report.get_p99_ms(MessageTypes.SUBMIT_ANSWER):>18.2f}"
+            )
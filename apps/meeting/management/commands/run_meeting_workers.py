@@ -0,0 +1,50 @@
+import os
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from apps.meeting import workers
+from apps.meeting.workers import WorkerSupervisor
+
+
+# Usage: python manage.py run_meeting_workers --workers 4 --port 8001
+class Command(BaseCommand):
+    help = "Run N daphne workers on consecutive ports and restart those that exit"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Number of worker processes (defaults to the number of cores)",
+        )
+        parser.add_argument("--bind", default="127.0.0.1")
+        parser.add_argument(
+            "--port",
+            type=int,
+            default=8001,
+            help="Port of the first worker; worker N listens on port + N",
+        )
+        parser.add_argument("--application", default="collaboard.asgi:application")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        worker_count: int = options["workers"]
+        if worker_count < 1:
+            raise CommandError("--workers must be at least 1")
+        # NOTE: A single worker may keep everything in memory (e.g. development)
+        shared_state_errors: list[str] = workers.get_shared_state_errors()
+        if worker_count > 1 and shared_state_errors:
+            raise CommandError(
+                "Workers cannot share meeting state: " + "; ".join(shared_state_errors)
+            )
+
+        supervisor = WorkerSupervisor(
+            [
+                workers.build_worker_command(
+                    options["application"], options["bind"], options["port"] + index
+                )
+                for index in range(worker_count)
+            ],
+            stdout=self.stdout,
+        )
+        supervisor.run()
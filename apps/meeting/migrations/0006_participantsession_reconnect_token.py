@@ -0,0 +1,31 @@
+# Generated by Django 5.2.3 on 2026-10-18 02:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("meeting", "0005_participantsession_total_responses"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="participantsession",
+            name="id",
+            field=models.BigAutoField(primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name="participantsession",
+            name="name",
+            field=models.CharField(max_length=40),
+        ),
+        migrations.AlterField(
+            model_name="participantsession",
+            name="sessiontoken",
+            field=models.CharField(
+                help_text="Used to identify previous meeting Session by the user",
+                max_length=66,
+                unique=True,
+            ),
+        ),
+    ]
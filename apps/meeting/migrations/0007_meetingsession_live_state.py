@@ -0,0 +1,29 @@
+# Generated by Django 5.2.3 on 2026-10-18 02:22
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("meeting", "0006_participantsession_reconnect_token"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="meetingsession",
+            name="current_duration",
+            field=models.IntegerField(
+                help_text="Seconds elapsed since the meeting started",
+                validators=[
+                    django.core.validators.MinValueValidator(0),
+                    django.core.validators.MaxValueValidator(3600),
+                ],
+            ),
+        ),
+        migrations.AlterField(
+            model_name="meetingsession",
+            name="id",
+            field=models.BigAutoField(primary_key=True, serialize=False),
+        ),
+    ]
@@ -6,16 +6,17 @@ from django.db import models
 from apps.director.models import Meeting, Question
 
 
-# ! MeetingSession and ParticipantSession Are Not Yet In Use
+# NOTE: MeetingSession checkpoints the live state of running meetings (see `lifecycle.py`)
+# NOTE: ParticipantSession backs participant reconnect tokens (see `reconnect.py`)
 # Create your models here.
 class MeetingSession(models.Model):
-    id = models.IntegerField(primary_key=True)
+    id = models.BigAutoField(primary_key=True)
     meeting = models.OneToOneField(to=Meeting, on_delete=models.CASCADE)
     current_duration = models.IntegerField(
         null=False,
         blank=False,
         validators=[MinValueValidator(0), MaxValueValidator(3600)],
-        help_text="Duration in seconds",
+        help_text="Seconds elapsed since the meeting started",
     )
     current_question_index = models.IntegerField(
         null=False,
@@ -27,15 +28,17 @@ class MeetingSession(models.Model):
 
 
 class ParticipantSession(models.Model):
-    id = models.IntegerField(primary_key=True)
+    id = models.BigAutoField(primary_key=True)
     meeting = models.ForeignKey(to=Meeting, on_delete=models.CASCADE)
-    name = models.CharField(null=False, max_length=30, unique=True)
+    # NOTE: Display names are unique per meeting (in Redis), suffixes included
+    name = models.CharField(null=False, max_length=40)
     total_responses = models.IntegerField(
         null=False, default=0, validators=[MinValueValidator(0)]
     )
     sessiontoken = models.CharField(
         null=False,
         max_length=66,
+        unique=True,
         help_text="Used to identify previous meeting Session by the user",
     )
     created_at = models.DateTimeField(auto_now_add=True)
@@ -0,0 +1,236 @@
+"""
+Participant Presence Module
+
+This module tracks which participants are connected to a meeting.
+
+Presence lives in Redis so it survives host reconnects and is shared
+by every daphne worker:
+- `meeting:{access_code}:presence` is a sorted set of display names
+  scored by the time of their last heartbeat
+- `meeting:{access_code}:joined` counts every participant that ever joined
+
+Each worker refreshes the heartbeats of its own participants in a single
+background task. Entries that are not refreshed within `PRESENCE_TTL_SECONDS`
+(e.g. the worker crashed) are pruned before counting, so the live count
+never includes ghosts.
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from apps.meeting import store
+from apps.meeting.constants import MEETING_KEY_TIMEOUT_SECONDS
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+PRESENCE_TTL_SECONDS: int = 45  # Entries older than this are considered gone
+HEARTBEAT_INTERVAL_SECONDS: int = 15  # How often each worker refreshes its entries
+
+
+def get_presence_key(meeting_access_code: str) -> str:
+    """Key of the sorted set of connected participants"""
+    return f"meeting:{meeting_access_code}:presence"
+
+
+def get_joined_count_key(meeting_access_code: str) -> str:
+    """Key of the counter of participants that ever joined"""
+    return f"meeting:{meeting_access_code}:joined"
+
+
+async def mark_present(meeting_access_code: str, display_name: str) -> int:
+    """
+    Records a newly connected participant.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+        display_name: The participant's unique display name
+
+    Returns:
+        The live participant count after the join
+    """
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    presence_key: str = get_presence_key(meeting_access_code)
+    joined_count_key: str = get_joined_count_key(meeting_access_code)
+    now: float = time.time()
+
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.zadd(presence_key, {display_name: now})
+        pipe.incr(joined_count_key)
+        pipe.expire(presence_key, MEETING_KEY_TIMEOUT_SECONDS)
+        pipe.expire(joined_count_key, MEETING_KEY_TIMEOUT_SECONDS)
+        pipe.zremrangebyscore(presence_key, "-inf", now - PRESENCE_TTL_SECONDS)
+        pipe.zcard(presence_key)
+        results = await pipe.execute()
+    return int(results[-1])
+
+
+async def mark_returned(meeting_access_code: str, display_name: str) -> None:
+    """
+    Refreshes a participant that reconnected within its grace window.
+
+    Unlike `mark_present`, the participant is not counted as a new join.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+        display_name: The participant's unique display name
+    """
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    await redis_client.zadd(
+        get_presence_key(meeting_access_code), {display_name: time.time()}
+    )
+
+
+async def mark_absent(meeting_access_code: str, display_name: str) -> int:
+    """
+    Removes a disconnected participant.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+        display_name: The participant's unique display name
+
+    Returns:
+        The live participant count after the departure
+    """
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    presence_key: str = get_presence_key(meeting_access_code)
+
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.zrem(presence_key, display_name)
+        pipe.zremrangebyscore(presence_key, "-inf", time.time() - PRESENCE_TTL_SECONDS)
+        pipe.zcard(presence_key)
+        results = await pipe.execute()
+    return int(results[-1])
+
+
+async def get_live_count(meeting_access_code: str) -> int:
+    """
+    Returns how many participants are currently connected.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+    """
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    presence_key: str = get_presence_key(meeting_access_code)
+
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.zremrangebyscore(presence_key, "-inf", time.time() - PRESENCE_TTL_SECONDS)
+        pipe.zcard(presence_key)
+        _, live_count = await pipe.execute()
+    return int(live_count)
+
+
+async def get_roster(meeting_access_code: str) -> list[str]:
+    """
+    Returns the display names of connected participants in join order.
+
+    Used by a (re)connecting host to rebuild its participant list.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+    """
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    presence_key: str = get_presence_key(meeting_access_code)
+
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.zremrangebyscore(presence_key, "-inf", time.time() - PRESENCE_TTL_SECONDS)
+        pipe.zrange(presence_key, 0, -1)
+        _, display_names = await pipe.execute()
+    return list(display_names)
+
+
+async def get_total_joined_count(meeting_access_code: str) -> int:
+    """
+    Returns how many participants joined the meeting, including those who left.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+    """
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    joined_count: str | None = await redis_client.get(
+        get_joined_count_key(meeting_access_code)
+    )
+    return int(joined_count or 0)
+
+
+async def clear_presence(meeting_access_code: str) -> None:
+    """
+    Deletes every presence key of the meeting.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+    """
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    await redis_client.delete(
+        get_presence_key(meeting_access_code),
+        get_joined_count_key(meeting_access_code),
+    )
+
+
+class PresenceHeartbeat:
+    """
+    Refreshes the presence entries of every participant connected to this process.
+
+    A single background task serves all local participants; each beat is
+    one pipelined ZADD per meeting instead of one timer per connection.
+    """
+
+    def __init__(self, interval: float = HEARTBEAT_INTERVAL_SECONDS):
+        self.interval: float = interval
+        self._local_participants: defaultdict[str, set[str]] = defaultdict(set)
+        self._heartbeat_task: asyncio.Task[None] | None = None
+
+    def track(self, meeting_access_code: str, display_name: str) -> None:
+        """Starts refreshing a participant connected to this process"""
+        self._local_participants[meeting_access_code].add(display_name)
+        if self._heartbeat_task is None or self._heartbeat_task.done():
+            self._heartbeat_task = asyncio.create_task(self._run())
+
+    def untrack(self, meeting_access_code: str, display_name: str) -> None:
+        """Stops refreshing a participant that disconnected"""
+        meeting_participants = self._local_participants.get(meeting_access_code)
+        if meeting_participants is None:
+            return
+        meeting_participants.discard(display_name)
+        if not meeting_participants:
+            del self._local_participants[meeting_access_code]
+
+    async def beat(self) -> None:
+        """Refreshes every tracked participant in one round trip"""
+        # NOTE: Participants may leave while a shard's pipeline is awaited
+        local_participants: dict[str, tuple[str, ...]] = {
+            meeting_access_code: tuple(display_names)
+            for meeting_access_code, display_names in self._local_participants.items()
+            if display_names
+        }
+        if not local_participants:
+            return
+        now: float = time.time()
+        # NOTE: One pipeline per shard
+        for redis_client, access_codes in store.group_by_client(
+            local_participants
+        ).items():
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for meeting_access_code in access_codes:
+                    pipe.zadd(
+                        get_presence_key(meeting_access_code),
+                        dict.fromkeys(local_participants[meeting_access_code], now),
+                        xx=True,  # NOTE: Never resurrect participants removed elsewhere
+                    )
+                await pipe.execute()
+
+    async def _run(self) -> None:
+        while self._local_participants:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.beat()
+            except RedisError:
+                logger.exception("Presence heartbeat failed")
+
+
+# NOTE: Shared by every participant consumer in this process
+presence_heartbeat = PresenceHeartbeat()
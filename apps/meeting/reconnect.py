@@ -0,0 +1,265 @@
+"""
+Participant Reconnect Module
+
+This module lets participants resume their place after a dropped connection.
+
+Every participant that joins gets a reconnect token, persisted as a
+`ParticipantSession` row and kept hot in Redis:
+- `meeting:{access_code}:participant:{token}` is a hash of the participant's
+  display name, `ParticipantSession` id and current connection (channel name)
+
+When a participant disconnects, its departure is deferred by
+`RECONNECT_GRACE_SECONDS`. A participant reconnecting with its token within
+that window gets its display name, the current question and the time left
+back with one Redis round trip; it is neither registered again nor announced to the host.
+Once the window passes without a reconnect, the participant leaves the
+meeting as if it had disconnected for good.
+
+A reconnect takes over the session by replacing its channel name, so a
+departure deferred by any worker only completes if the channel name of
+the dropped connection is still the current one.
+"""
+
+import secrets
+import uuid
+from typing import Any, NamedTuple
+
+from channels.layers import BaseChannelLayer
+from redis.asyncio import Redis
+from redis.exceptions import WatchError
+
+from apps.meeting import lifecycle, presence, registry, store, utils
+from apps.meeting.coalescer import host_updates
+from apps.meeting.constants import (
+    MEETING_KEY_TIMEOUT_SECONDS,
+    GroupPrefixes,
+    MessageTypes,
+)
+from apps.meeting.models import ParticipantSession
+from apps.meeting.timers import meeting_deadlines
+
+RECONNECT_GRACE_SECONDS: int = 30  # Below `presence.PRESENCE_TTL_SECONDS`
+
+
+class ResumedParticipant(NamedTuple):
+    """
+    State handed back to a reconnecting participant.
+
+    Attributes:
+        display_name: The display name assigned when the participant first joined
+        participant_session_id: Primary key of the participant's `ParticipantSession`
+        current_question: Reference of the question being presented, if any
+        remaining_seconds: Seconds until the meeting ends; None if not started
+    """
+
+    display_name: str
+    participant_session_id: int
+    current_question: dict[str, Any] | None
+    remaining_seconds: int | None = None
+
+
+def get_participant_session_key(meeting_access_code: str, token: str) -> str:
+    """Key of the hash storing the hot copy of a participant session"""
+    return f"meeting:{meeting_access_code}:participant:{token}"
+
+
+def get_departure_deadline_key(token: str) -> str:
+    """Key of the deferred departure of a participant in `meeting_deadlines`"""
+    return f"departure:{token}"
+
+
+async def create_participant_session(
+    meeting_access_code: str,
+    meeting_id: uuid.UUID,
+    display_name: str,
+    channel_name: str,
+) -> tuple[str, int]:
+    """
+    Issues a reconnect token to a participant that just joined.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+        meeting_id: The UUID of the Meeting
+        display_name: The display name assigned by `registry.register_participant`
+        channel_name: Channel name of the participant's connection
+
+    Returns:
+        The reconnect token and the id of its `ParticipantSession`
+    """
+    token: str = secrets.token_urlsafe(32)
+    participant_session: ParticipantSession = await ParticipantSession.objects.acreate(
+        meeting_id=meeting_id, name=display_name, sessiontoken=token
+    )
+    participant_session_id: int = participant_session.id
+
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    session_key: str = get_participant_session_key(meeting_access_code, token)
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.hset(
+            session_key,
+            mapping={
+                "display_name": display_name,
+                "participant_session_id": participant_session_id,
+                "channel_name": channel_name,
+            },
+        )
+        pipe.expire(session_key, MEETING_KEY_TIMEOUT_SECONDS)
+        await pipe.execute()
+    return token, participant_session_id
+
+
+async def find_participant_session(
+    meeting_access_code: str, token: str
+) -> ResumedParticipant | None:
+    """
+    Looks up a reconnect token and the live state of the meeting.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+        token: The reconnect token sent by the participant
+
+    Returns:
+        The participant's state; None if the token is unknown or has left
+    """
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    # NOTE: A single round trip for the session and the meeting's live state
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.hgetall(get_participant_session_key(meeting_access_code, token))
+        pipe.hgetall(lifecycle.get_meeting_state_key(meeting_access_code))
+        participant_session, meeting_state = await pipe.execute()
+    if not participant_session:
+        return None
+    live_state: lifecycle.LiveMeetingState | None = lifecycle.parse_meeting_state(
+        meeting_state
+    )
+    return ResumedParticipant(
+        display_name=participant_session["display_name"],
+        participant_session_id=int(participant_session["participant_session_id"]),
+        current_question=live_state.current_question if live_state else None,
+        remaining_seconds=live_state.get_remaining_seconds() if live_state else None,
+    )
+
+
+async def resume_participant_session(
+    meeting_access_code: str, token: str, channel_name: str
+) -> bool:
+    """
+    Hands a participant session over to a new connection.
+
+    The deferred departure of the previous connection will no longer complete.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+        token: The participant's reconnect token
+        channel_name: Channel name of the new connection
+
+    Returns:
+        True if the session was taken over; False if the participant already
+        left, in which case it must join again
+    """
+    meeting_deadlines.cancel(get_departure_deadline_key(token))
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    session_key: str = get_participant_session_key(meeting_access_code, token)
+    async with redis_client.pipeline(transaction=True) as pipe:
+        while True:
+            try:
+                # NOTE: WATCH fails the takeover if a departure deletes the session
+                await pipe.watch(session_key)
+                if not await pipe.exists(session_key):
+                    return False
+                pipe.multi()
+                pipe.hset(session_key, "channel_name", channel_name)
+                pipe.expire(session_key, MEETING_KEY_TIMEOUT_SECONDS)
+                await pipe.execute()
+                return True
+            except WatchError:
+                continue
+
+
+def defer_departure(
+    meeting_access_code: str, token: str, display_name: str, channel_name: str
+) -> None:
+    """
+    Gives a disconnected participant `RECONNECT_GRACE_SECONDS` to come back.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+        token: The participant's reconnect token
+        display_name: The participant's display name
+        channel_name: Channel name of the dropped connection
+    """
+    meeting_deadlines.schedule(
+        key=get_departure_deadline_key(token),
+        delay_seconds=RECONNECT_GRACE_SECONDS,
+        callback=lambda: complete_departure(
+            meeting_access_code, token, display_name, channel_name
+        ),
+    )
+
+
+async def complete_departure(
+    meeting_access_code: str, token: str, display_name: str, channel_name: str
+) -> bool:
+    """
+    Removes a participant that did not reconnect within the grace window.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+        token: The participant's reconnect token
+        display_name: The participant's display name
+        channel_name: Channel name of the dropped connection
+
+    Returns:
+        True if the participant left; False if it reconnected in the meantime
+    """
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    session_key: str = get_participant_session_key(meeting_access_code, token)
+    async with redis_client.pipeline(transaction=True) as pipe:
+        try:
+            # NOTE: WATCH fails the DEL if a reconnect takes the session over
+            await pipe.watch(session_key)
+            # NOTE: redis-py types hash commands as a value or an awaitable
+            owner_channel_name: str | None = await pipe.hget(  # type: ignore[misc]
+                session_key, "channel_name"
+            )
+            if owner_channel_name != channel_name:
+                return False
+            pipe.multi()
+            pipe.delete(session_key)
+            await pipe.execute()
+        except WatchError:
+            return False
+    await leave_meeting(meeting_access_code, display_name)
+    return True
+
+
+async def leave_meeting(meeting_access_code: str, display_name: str) -> None:
+    """
+    Releases a participant's presence and name, and notifies the host.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+        display_name: The participant's display name
+    """
+    live_participant_count: int = await presence.mark_absent(
+        meeting_access_code=meeting_access_code, display_name=display_name
+    )
+    if host_updates.is_enabled():
+        host_updates.add_leave(
+            meeting_access_code=meeting_access_code,
+            display_name=display_name,
+            participant_count=live_participant_count,
+        )
+    else:
+        channel_layer: BaseChannelLayer = utils.get_meeting_channel_layer()
+        await channel_layer.group_send(
+            f"{GroupPrefixes.HOST}{meeting_access_code}",
+            {
+                "type": MessageTypes.PARTICIPANT_LEFT,
+                "name": display_name,
+                "participant_count": live_participant_count,
+            },
+        )
+    await registry.unregister_participant(
+        meeting_access_code=meeting_access_code, display_name=display_name
+    )
@@ -0,0 +1,166 @@
+"""
+Participant Registry Module
+
+This module assigns unique display names to participants joining a meeting.
+
+The registry lives in Redis so that joins are O(1) and atomic across
+daphne workers:
+- `meeting:{access_code}:open` marks a meeting whose host is ready
+- `meeting:{access_code}:name_counts` is a hash of per-base-name counters (HINCRBY)
+- `meeting:{access_code}:names` is the set of display names currently in use
+- `meeting_locked_{access_code}` marks a started meeting that new participants
+  can no longer join
+
+The first "Bob" keeps his name, the next ones become "Bob(1)", "Bob(2)", ...
+Names are claimed with SADD, so two participants can never end up
+with the same display name, even under a join storm.
+"""
+
+from redis.asyncio import Redis
+
+from apps.meeting import store
+from apps.meeting.constants import MEETING_KEY_TIMEOUT_SECONDS, GroupPrefixes
+from apps.meeting.utils import get_username_cache_key
+
+
+def get_registry_open_key(meeting_access_code: str) -> str:
+    """Key marking that the host has opened the meeting for joins"""
+    return f"meeting:{meeting_access_code}:open"
+
+
+def get_name_counts_key(meeting_access_code: str) -> str:
+    """Key of the hash storing how many times each base name was requested"""
+    return f"meeting:{meeting_access_code}:name_counts"
+
+
+def get_meeting_locked_key(meeting_access_code: str) -> str:
+    """Key marking that the meeting started and is closed to new participants"""
+    return f"{GroupPrefixes.MEETING_LOCKED}{meeting_access_code}"
+
+
+async def open_registry(meeting_access_code: str) -> None:
+    """
+    Allows participants to register for the meeting.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+    """
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    await redis_client.set(
+        get_registry_open_key(meeting_access_code), 1, ex=MEETING_KEY_TIMEOUT_SECONDS
+    )
+
+
+async def lock_registry(meeting_access_code: str) -> None:
+    """
+    Prevents new participants from joining a started meeting.
+
+    Participants resuming their session with a reconnect token are still let in.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+    """
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    await redis_client.set(
+        get_meeting_locked_key(meeting_access_code), 1, ex=MEETING_KEY_TIMEOUT_SECONDS
+    )
+
+
+async def is_registry_locked(meeting_access_code: str) -> bool:
+    """
+    Returns whether the meeting is closed to new participants.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+    """
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    return bool(await redis_client.exists(get_meeting_locked_key(meeting_access_code)))
+
+
+async def register_participant(
+    meeting_access_code: str, requested_name: str
+) -> str | None:
+    """
+    Claims a unique display name for a joining participant.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+        requested_name: The name typed in by the participant
+
+    Returns:
+        The display name assigned to the participant;
+        None if the host has not opened the meeting yet
+    """
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    names_key: str = get_username_cache_key(meeting_access_code)
+    name_counts_key: str = get_name_counts_key(meeting_access_code)
+
+    while True:
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.exists(get_registry_open_key(meeting_access_code))
+            pipe.hincrby(name_counts_key, requested_name, 1)
+            pipe.expire(name_counts_key, MEETING_KEY_TIMEOUT_SECONDS)
+            is_registry_open, requested_name_count, _ = await pipe.execute()
+        if not is_registry_open:
+            return None
+
+        display_name: str = (
+            requested_name
+            if requested_name_count == 1
+            else f"{requested_name}({requested_name_count - 1})"
+        )
+
+        # NOTE: SADD is atomic - retry if a participant literally typed "Bob(1)"
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.sadd(names_key, display_name)
+            pipe.expire(names_key, MEETING_KEY_TIMEOUT_SECONDS)
+            was_name_added, _ = await pipe.execute()
+        if was_name_added:
+            return display_name
+
+
+async def unregister_participant(meeting_access_code: str, display_name: str) -> None:
+    """
+    Releases a display name when its participant leaves.
+
+    Counters are never decremented, so a released name is not handed out again.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+        display_name: The display name assigned by `register_participant`
+    """
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    # NOTE: redis-py types set commands as returning either a value or an awaitable
+    await redis_client.srem(  # type: ignore[misc]
+        get_username_cache_key(meeting_access_code), display_name
+    )
+
+
+async def get_participant_names(meeting_access_code: str) -> set[str]:
+    """
+    Returns the display names currently registered in the meeting.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+    """
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    participant_names: set[str] = await redis_client.smembers(  # type: ignore[misc]
+        get_username_cache_key(meeting_access_code)
+    )
+    return participant_names
+
+
+async def close_registry(meeting_access_code: str) -> None:
+    """
+    Deletes every registry key of the meeting.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+    """
+    redis_client: Redis = store.get_redis_client(meeting_access_code)
+    await redis_client.delete(
+        get_registry_open_key(meeting_access_code),
+        get_name_counts_key(meeting_access_code),
+        get_username_cache_key(meeting_access_code),
+        get_meeting_locked_key(meeting_access_code),
+    )
@@ -0,0 +1,99 @@
+"""
+Meeting Sharding Module
+
+This module maps meetings to Redis shards by access code.
+
+A single Redis node holds the channel layer groups and the meeting store
+of every meeting, so it caps the number of concurrent meetings. With
+`MEETING_REDIS_SHARDS` set, each meeting is hashed to one of several nodes
+and everything it touches stays there:
+- its channel layer groups (`GroupPrefixes` and the broadcast fan-out group)
+  through `MeetingShardedChannelLayer`
+- its store keys (state, presence, registry, lock...) through
+  `store.get_redis_client(meeting_access_code)`
+
+Shards are picked with a jump consistent hash, so adding a node only moves
+about 1/N of the meetings to it. Keys shared by every meeting (the deadline
+set) stay on the first shard.
+
+! Only groups are pinned. Messages sent straight to a channel (a worker's
+! broadcast channel, the host answering a participant) use the default
+! channel hashing, because channel names are created before the consumer
+! knows its meeting. They are still delivered, but a meeting's direct
+! messages are spread over every shard.
+"""
+
+import hashlib
+
+from channels_redis.core import RedisChannelLayer
+
+from apps.meeting.broadcast import FANOUT_GROUP_PREFIX
+from apps.meeting.constants import GroupPrefixes
+
+# NOTE: Longest first - `meeting_host_` and `meeting_fanout_` start with `meeting_`
+MEETING_GROUP_PREFIXES: tuple[str, ...] = tuple(
+    sorted(
+        (GroupPrefixes.HOST, GroupPrefixes.PARTICIPANT, FANOUT_GROUP_PREFIX),
+        key=len,
+        reverse=True,
+    )
+)
+
+
+def get_shard_index(meeting_access_code: str, shard_count: int) -> int:
+    """
+    Picks the shard of a meeting with a jump consistent hash.
+
+    Args:
+        meeting_access_code: The unique access code of the meeting
+        shard_count: Number of configured shards
+
+    Returns:
+        The index of the meeting's shard, in `range(shard_count)`
+    """
+    if shard_count <= 1:
+        return 0
+    key: int = int.from_bytes(
+        hashlib.blake2b(meeting_access_code.encode(), digest_size=8).digest(), "big"
+    )
+    # NOTE: Lamping & Veach, "A Fast, Minimal Memory, Consistent Hash Algorithm"
+    shard_index, next_shard_index = -1, 0
+    while next_shard_index < shard_count:
+        shard_index = next_shard_index
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        next_shard_index = int((shard_index + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return shard_index
+
+
+def get_group_access_code(group_name: str) -> str | None:
+    """
+    Extracts the access code of a meeting's channel layer group.
+
+    Args:
+        group_name: Name of a channel layer group
+
+    Returns:
+        The meeting's access code; None for groups that belong to no meeting
+    """
+    for group_prefix in MEETING_GROUP_PREFIXES:
+        if group_name.startswith(group_prefix):
+            return group_name[len(group_prefix) :] or None
+    return None
+
+
+# NOTE: channels_redis ships without type hints
+class MeetingShardedChannelLayer(RedisChannelLayer):  # type: ignore[no-any-unimported]
+    """
+    Redis channel layer placing every group of a meeting on the meeting's shard.
+
+    `hosts` must list the same nodes, in the same order, as
+    `MEETING_REDIS_SHARD_URLS`. Channels and other groups keep the default
+    hashing of `RedisChannelLayer`, so direct sends are not meeting-pinned.
+    """
+
+    def consistent_hash(self, value: str) -> int:
+        meeting_access_code: str | None = get_group_access_code(value)
+        if meeting_access_code is None:
+            default_index: int = super().consistent_hash(value)
+            return default_index
+        return get_shard_index(meeting_access_code, self.ring_size)
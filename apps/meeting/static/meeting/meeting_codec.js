@@ -0,0 +1,248 @@
+/*
+Frame codec shared by the meeting pages.
+
+Sockets opened with `MeetingCodec.PROTOCOLS` let the server pick the
+binary `collaboard.msgpack.v1` protocol: frames are MessagePack maps whose
+`type` is a small integer code. Servers that only speak JSON keep sending
+text frames, so `decode`/`encode` handle both.
+*/
+const MeetingCodec = (function () {
+  const MSGPACK_PROTOCOL = "collaboard.msgpack.v1";
+  const JSON_PROTOCOL = "collaboard.json.v1";
+
+  // Must match `BINARY_MESSAGE_TYPE_CODES` in apps/meeting/codec.py
+  const MessageTypeCodes = Object.freeze({
+    start_meeting: 1,
+    end_meeting: 2,
+    next_question: 3,
+    participant_joined: 4,
+    participant_left: 5,
+    roster: 6,
+    host_update: 7,
+    questions: 8,
+    submit_answer: 9,
+    answer_submitted: 10,
+    submit_error: 11,
+    invalid_answer: 12,
+    update_name: 13,
+    authenticate: 14,
+    session_token: 15,
+    answer_insights: 16,
+  });
+  const MessageTypeNames = Object.freeze(
+    Object.fromEntries(
+      Object.entries(MessageTypeCodes).map(([name, code]) => [code, name])
+    )
+  );
+
+  const textEncoder = new TextEncoder();
+  const textDecoder = new TextDecoder();
+
+  // Minimal MessagePack encoder for the values used by meeting frames
+  function packValue(value, bytes) {
+    if (value === null || value === undefined) {
+      bytes.push(0xc0);
+    } else if (value === false || value === true) {
+      bytes.push(value ? 0xc3 : 0xc2);
+    } else if (typeof value === "number") {
+      packNumber(value, bytes);
+    } else if (typeof value === "string") {
+      const encoded = textEncoder.encode(value);
+      packLength(encoded.length, 0xa0, 31, 0xd9, bytes);
+      for (const byte of encoded) bytes.push(byte);
+    } else if (Array.isArray(value)) {
+      packLength(value.length, 0x90, 15, null, bytes);
+      for (const item of value) packValue(item, bytes);
+    } else {
+      const entries = Object.entries(value).filter(([, v]) => v !== undefined);
+      packLength(entries.length, 0x80, 15, null, bytes);
+      for (const [key, item] of entries) {
+        packValue(key, bytes);
+        packValue(item, bytes);
+      }
+    }
+  }
+
+  // fix* header when short, otherwise the 8 (strings only), 16 or 32-bit form
+  function packLength(length, fixPrefix, fixMax, prefix8, bytes) {
+    if (length <= fixMax) {
+      bytes.push(fixPrefix | length);
+    } else if (prefix8 !== null && length < 0x100) {
+      bytes.push(prefix8, length);
+    } else if (length < 0x10000) {
+      bytes.push(fixPrefix === 0x80 ? 0xde : fixPrefix === 0x90 ? 0xdc : 0xda);
+      bytes.push(length >> 8, length & 0xff);
+    } else {
+      bytes.push(fixPrefix === 0x80 ? 0xdf : fixPrefix === 0x90 ? 0xdd : 0xdb);
+      pushUint32(length, bytes);
+    }
+  }
+
+  function packNumber(value, bytes) {
+    if (Number.isInteger(value) && value >= 0 && value < 0x100000000) {
+      if (value < 0x80) bytes.push(value);
+      else if (value < 0x100) bytes.push(0xcc, value);
+      else if (value < 0x10000) bytes.push(0xcd, value >> 8, value & 0xff);
+      else {
+        bytes.push(0xce);
+        pushUint32(value, bytes);
+      }
+    } else if (Number.isInteger(value) && value < 0 && value >= -0x80000000) {
+      if (value >= -32) bytes.push(value & 0xff);
+      else {
+        bytes.push(0xd2);
+        pushUint32(value >>> 0, bytes);
+      }
+    } else {
+      const view = new DataView(new ArrayBuffer(8));
+      view.setFloat64(0, value);
+      bytes.push(0xcb);
+      for (let index = 0; index < 8; index++) bytes.push(view.getUint8(index));
+    }
+  }
+
+  function pushUint32(value, bytes) {
+    bytes.push(
+      (value >>> 24) & 0xff,
+      (value >>> 16) & 0xff,
+      (value >>> 8) & 0xff,
+      value & 0xff
+    );
+  }
+
+  // Minimal MessagePack decoder; throws on types meeting frames never use
+  function unpack(buffer) {
+    const view = new DataView(buffer);
+    let offset = 0;
+
+    function readString(length) {
+      const value = textDecoder.decode(
+        new Uint8Array(buffer, offset, length)
+      );
+      offset += length;
+      return value;
+    }
+
+    function readArray(length) {
+      const items = [];
+      for (let index = 0; index < length; index++) items.push(readValue());
+      return items;
+    }
+
+    function readMap(length) {
+      const map = {};
+      for (let index = 0; index < length; index++) {
+        const key = readValue();
+        map[key] = readValue();
+      }
+      return map;
+    }
+
+    function readValue() {
+      const prefix = view.getUint8(offset++);
+      if (prefix < 0x80) return prefix;
+      if (prefix >= 0xe0) return prefix - 0x100;
+      if ((prefix & 0xe0) === 0xa0) return readString(prefix & 0x1f);
+      if ((prefix & 0xf0) === 0x90) return readArray(prefix & 0x0f);
+      if ((prefix & 0xf0) === 0x80) return readMap(prefix & 0x0f);
+
+      let value;
+      switch (prefix) {
+        case 0xc0:
+          return null;
+        case 0xc2:
+          return false;
+        case 0xc3:
+          return true;
+        case 0xcb:
+          value = view.getFloat64(offset);
+          offset += 8;
+          return value;
+        case 0xcc:
+          return view.getUint8(offset++);
+        case 0xcd:
+          value = view.getUint16(offset);
+          offset += 2;
+          return value;
+        case 0xce:
+          value = view.getUint32(offset);
+          offset += 4;
+          return value;
+        case 0xd0:
+          return view.getInt8(offset++);
+        case 0xd1:
+          value = view.getInt16(offset);
+          offset += 2;
+          return value;
+        case 0xd2:
+          value = view.getInt32(offset);
+          offset += 4;
+          return value;
+        case 0xd9:
+          return readString(view.getUint8(offset++));
+        case 0xda:
+          value = view.getUint16(offset);
+          offset += 2;
+          return readString(value);
+        case 0xdb:
+          value = view.getUint32(offset);
+          offset += 4;
+          return readString(value);
+        case 0xdc:
+          value = view.getUint16(offset);
+          offset += 2;
+          return readArray(value);
+        case 0xdd:
+          value = view.getUint32(offset);
+          offset += 4;
+          return readArray(value);
+        case 0xde:
+          value = view.getUint16(offset);
+          offset += 2;
+          return readMap(value);
+        case 0xdf:
+          value = view.getUint32(offset);
+          offset += 4;
+          return readMap(value);
+        default:
+          throw new Error(`Unsupported MessagePack type 0x${prefix.toString(16)}`);
+      }
+    }
+
+    return readValue();
+  }
+
+  return Object.freeze({
+    PROTOCOLS: [MSGPACK_PROTOCOL, JSON_PROTOCOL],
+
+    // Opens a socket that receives binary frames as ArrayBuffers
+    connect(url) {
+      const ws = new WebSocket(url, [MSGPACK_PROTOCOL, JSON_PROTOCOL]);
+      ws.binaryType = "arraybuffer";
+      return ws;
+    },
+
+    decode(data) {
+      if (typeof data === "string") {
+        return JSON.parse(data);
+      }
+      const message = unpack(data);
+      if (Number.isInteger(message.type)) {
+        message.type = MessageTypeNames[message.type];
+      }
+      return message;
+    },
+
+    encode(ws, message) {
+      if (ws.protocol !== MSGPACK_PROTOCOL) {
+        return JSON.stringify(message);
+      }
+      const bytes = [];
+      packValue(
+        { ...message, type: MessageTypeCodes[message.type] ?? message.type },
+        bytes
+      );
+      return new Uint8Array(bytes);
+    },
+  });
+})();
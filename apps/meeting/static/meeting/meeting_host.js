@@ -8,8 +8,11 @@ const MessageTypes = Object.freeze({
   SUBMIT_ANSWER: "submit_answer",
   PARTICIPANT_JOINED: "participant_joined",
   PARTICIPANT_LEFT: "participant_left",
+  ROSTER: "roster",
+  HOST_UPDATE: "host_update",
   ANSWER_SUBMITTED: "answer_submitted",
   AUTHENTICATE: "authenticate",
+  ANSWER_INSIGHTS: "answer_insights",
 });
 
 const COOKIE_NAME = "sessionid";
@@ -34,6 +37,8 @@ let countdownInterval;
 
 // Handles tracking answer submission
 let totalSubmissions = 0;
+// Live aggregates of each answered question, keyed by question index
+const answerInsights = new Map();
 
 // WebSocket event handlers
 ws.onopen = function (event) {
@@ -76,6 +81,9 @@ function handleMessage(data) {
     case MessageTypes.START_MEETING:
       handleInitialMeetingData(data);
       break;
+    case MessageTypes.ROSTER:
+      handleRoster(data);
+      break;
     case MessageTypes.PARTICIPANT_JOINED:
       handleParticipantJoined(data);
       break;
@@ -85,6 +93,12 @@ function handleMessage(data) {
     case MessageTypes.ANSWER_SUBMITTED:
       handleAnswerSubmitted(data);
       break;
+    case MessageTypes.HOST_UPDATE:
+      handleHostUpdate(data);
+      break;
+    case MessageTypes.ANSWER_INSIGHTS:
+      handleAnswerInsights(data);
+      break;
     case MessageTypes.END_MEETING:
       handleMeetingEnd(data);
       break;
@@ -103,14 +117,40 @@ function handleInitialMeetingData(data) {
       `Loaded ${totalMeetingQuestions} questions for meeting ${accessCode}`
     );
 
-    initializeMeetingUI();
+    // Sent when the meeting is already running (e.g. after a page reload)
+    if (Number.isInteger(data.current_question_index)) {
+      resumeMeeting(data);
+    } else {
+      initializeMeetingUI();
+    }
+  }
+}
+
+function resumeMeeting(data) {
+  meetingStarted = true;
+  currentQuestionIndex = data.current_question_index;
+  durationInSeconds = data.remaining_seconds;
+
+  updateMeetingUI();
+  if (currentQuestionIndex >= totalMeetingQuestions - 1) {
+    disableButton("next-btn", true);
+  }
+  updateStatus("Meeting in progress");
+}
+
+// Sent on every (re)connect - the server's presence store is the source of truth
+function handleRoster(data) {
+  if (Array.isArray(data.participants)) {
+    participants = [...data.participants];
+    updateParticipantDisplay(data.participant_count);
+    updateSubmissionTracker();
   }
 }
 
 function handleParticipantJoined(data) {
   if (data.participant) {
     participants.push(data.participant);
-    updateParticipantDisplay();
+    updateParticipantDisplay(data.participant_count);
     updateSubmissionTracker(); // Update tracker when participants change
     console.log("Participant joined:", data.participant.id);
   }
@@ -124,14 +164,8 @@ function handleParticipantLeft(data) {
       participant.status = "Disconnected";
     }
 
-    // Update participant count to only count connected participants
-    const connectedCount = participants.filter(
-      (p) => p.status !== "Disconnected"
-    ).length;
-    document.getElementById("participant-count").textContent = connectedCount;
-
     // Update the display to show all participants with their current status
-    updateParticipantDisplay();
+    updateParticipantDisplay(data.participant_count);
     updateSubmissionTracker(); // Update tracker when participants change
     console.log("Participant disconnected:", data.name);
   }
@@ -143,6 +177,37 @@ function handleAnswerSubmitted(data) {
   console.log(`Answer submitted. Total: ${totalSubmissions}`);
 }
 
+// Answers, joins and leaves batched by the server - rendered once per delta
+function handleHostUpdate(data) {
+  if (Array.isArray(data.joined)) {
+    participants.push(...data.joined);
+  }
+  if (Array.isArray(data.left)) {
+    const leftNames = new Set(data.left);
+    participants.forEach((p) => {
+      if (leftNames.has(p.name)) {
+        p.status = "Disconnected";
+      }
+    });
+  }
+  totalSubmissions += data.answers || 0;
+
+  if (data.joined?.length || data.left?.length) {
+    updateParticipantDisplay(data.participant_count);
+  }
+  updateSubmissionTracker();
+}
+
+// Throttled snapshots of the answers of each question
+function handleAnswerInsights(data) {
+  if (Array.isArray(data.questions)) {
+    data.questions.forEach((insight) => {
+      answerInsights.set(insight.question_index, insight);
+    });
+    updateAnswerInsights();
+  }
+}
+
 // Button event listeners
 document.getElementById("start-btn").addEventListener("click", function () {
   if (!meetingStarted && meetingQuestions.length > 0) {
@@ -171,9 +236,10 @@ function startMeeting() {
   currentQuestionIndex = 0;
   totalSubmissions = 0; // Reset submissions for new meeting
 
+  // Participants receive the question list on join, so only the index is sent
   const message = {
     type: MessageTypes.START_MEETING,
-    question: meetingQuestions[0],
+    question_index: currentQuestionIndex,
     access_code: accessCode,
   };
 
@@ -189,13 +255,13 @@ function nextQuestion() {
   const message = {
     type: MessageTypes.NEXT_QUESTION,
     access_code: accessCode,
-    question: meetingQuestions[currentQuestionIndex],
-    question_number: currentQuestionIndex + 1,
+    question_index: currentQuestionIndex,
   };
 
   sendMessage(message);
   updateQuestionDisplay();
   updateSubmissionTracker(); // Update tracker for new question
+  updateAnswerInsights();
 
   // Disable next button if this is the last question
   if (currentQuestionIndex >= totalMeetingQuestions - 1) {
@@ -230,6 +296,7 @@ function initializeMeetingUI() {
 function updateMeetingUI() {
   updateQuestionDisplay();
   updateSubmissionTracker();
+  updateAnswerInsights();
   disableButton("start-btn", true);
   disableButton("next-btn", false);
   disableButton("end-btn", false);
@@ -268,11 +335,41 @@ function updateSubmissionTracker() {
   }
 }
 
-function updateParticipantDisplay() {
-  // Count only connected participants for the main counter
-  const connectedCount = participants.filter(
-    (p) => p.status !== "Disconnected"
-  ).length;
+// Answers are rendered as text, never as HTML
+function updateAnswerInsights() {
+  const insight = answerInsights.get(currentQuestionIndex);
+  const termsElement = document.getElementById("insight-terms");
+  const answersElement = document.getElementById("insight-answers");
+  if (!termsElement || !answersElement) {
+    return;
+  }
+  termsElement.replaceChildren();
+  answersElement.replaceChildren();
+  document.getElementById("insight-count").textContent = insight
+    ? insight.answer_count
+    : 0;
+  if (!insight) {
+    return;
+  }
+
+  insight.top_terms.forEach(([term, count]) => {
+    const termElement = document.createElement("span");
+    termElement.className = "insight-term";
+    termElement.textContent = `${term} (${count})`;
+    termsElement.appendChild(termElement);
+  });
+  insight.recent_answers.forEach((answer) => {
+    const answerElement = document.createElement("li");
+    answerElement.textContent = answer;
+    answersElement.appendChild(answerElement);
+  });
+}
+
+function updateParticipantDisplay(liveCount) {
+  // Prefer the server's live count; fall back to counting connected participants
+  const connectedCount = Number.isInteger(liveCount)
+    ? liveCount
+    : participants.filter((p) => p.status !== "Disconnected").length;
   document.getElementById("participant-count").textContent = connectedCount;
 
   const listElement = document.getElementById("participants-list");
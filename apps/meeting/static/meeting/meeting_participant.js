@@ -5,20 +5,28 @@ const MessageTypes = Object.freeze({
   START_MEETING: "start_meeting",
   END_MEETING: "end_meeting",
   PARTICIPANT_JOINED: "participant_joined",
+  QUESTIONS: "questions",
   NEXT_QUESTION: "next_question",
   SUBMIT_ANSWER: "submit_answer",
   SUBMIT_ERROR: "submit_error",
   INVALID_ANSWER: "invalid_answer",
   UPDATE_NAME: "update_name",
+  SESSION_TOKEN: "session_token",
 });
 // Used when connection is rejected
 let isRedirecting = false;
+let hasMeetingEnded = false;
+
+// Reconnect tokens survive page reloads within the tab
+const RECONNECT_DELAY_MS = 2000;
+const MAX_RECONNECT_ATTEMPTS = 15; // Covers the server's 30 second grace window
+let reconnectAttempts = 0;
 
 // Get access code from URL and establish WebSocket connection
 const access_code = getAccessCode();
-const ws = new WebSocket(
-  `wss://collaboard.site/ws/meeting/${access_code}/participant/`
-);
+const reconnectTokenKey = `collaboard:reconnect-token:${access_code}`;
+let ws;
+connectWebSocket();
 
 // Timer state
 let duration = parseInt(document.getElementById("duration").textContent);
@@ -26,57 +34,87 @@ let durationInSeconds = duration * 60;
 let countdownInterval;
 
 // Keeps track of current question
+// Questions are received once on join and later referenced by index
+let meetingQuestions = [];
+let currentQuestionIndex = null;
 currentQuestion = null;
 
 participantName = document.getElementById("participant-name").dataset.name;
 
+// Opens the socket; the join frame resumes the previous session if a token is stored
+function connectWebSocket() {
+  const url = `wss://collaboard.site/ws/meeting/${access_code}/participant/`;
+  // Compact binary frames when the server supports them (see meeting_codec.js)
+  ws = MeetingCodec.connect(url);
+  ws.onopen = handleOpen;
+  ws.onmessage = handleSocketMessage;
+  ws.onclose = handleClose;
+  ws.onerror = handleError;
+}
+
 // WebSocket event handlers
-ws.onopen = function (event) {
+function handleOpen(event) {
   console.log("Participant WebSocket connected");
+  reconnectAttempts = 0;
   updateStatus("Connected - Waiting for meeting to start...");
   const message = {
     type: MessageTypes.PARTICIPANT_JOINED,
     name: participantName,
   };
+  // Sent in the frame rather than the URL so it never shows up in access logs
+  const reconnectToken = sessionStorage.getItem(reconnectTokenKey);
+  if (reconnectToken) {
+    message.token = reconnectToken;
+  }
   sendMessage(message);
-};
+}
 
-ws.onmessage = function (event) {
+function handleSocketMessage(event) {
   try {
-    const data = JSON.parse(event.data);
+    const data = MeetingCodec.decode(event.data);
     console.log("Participant received:", data);
 
     handleMessage(data);
   } catch (error) {
     console.error("Error parsing message:", error);
   }
-};
+}
 
-ws.onclose = function (event) {
+function handleClose(event) {
   console.log("Close event fired!");
   console.log("Close code:", event.code);
   console.log("Close reason:", event.reason);
 
   if (event.code === 4401 && !isRedirecting) {
     isRedirecting = true;
+    sessionStorage.removeItem(reconnectTokenKey);
     const redirect_url = "/meeting/locked";
     console.log("Redirecting to:", redirect_url);
     window.location.replace(redirect_url);
   } else if (event.code !== 4401) {
     console.log("Participant WebSocket disconnected");
-    updateStatus("Disconnected");
     pauseCountdown();
+    if (!hasMeetingEnded && reconnectAttempts < MAX_RECONNECT_ATTEMPTS) {
+      reconnectAttempts++;
+      updateStatus("Reconnecting...");
+      setTimeout(connectWebSocket, RECONNECT_DELAY_MS);
+    } else {
+      updateStatus("Disconnected");
+    }
   }
-};
+}
 
-ws.onerror = function (error) {
+function handleError(error) {
   console.error("Participant WebSocket error:", error);
   updateStatus("Connection error");
-};
+}
 
 // Message handling
 function handleMessage(data) {
   switch (data.type) {
+    case MessageTypes.QUESTIONS:
+      handleQuestions(data);
+      break;
     case MessageTypes.START_MEETING:
       handleMeetingStart(data);
       break;
@@ -95,25 +133,54 @@ function handleMessage(data) {
     case MessageTypes.END_MEETING:
       handleMeetingEnd(data);
       break;
+    case MessageTypes.SESSION_TOKEN:
+      sessionStorage.setItem(reconnectTokenKey, data.token);
+      break;
     default:
       console.log("Unknown message type:", data.type);
   }
 }
 
-function handleMeetingStart(data) {
+function handleQuestions(data) {
+  if (Array.isArray(data.questions)) {
+    meetingQuestions = [...data.questions];
+  }
+}
+
+// Resolves a question reference (index or legacy full text) sent by the server
+function setCurrentQuestion(data) {
+  if (
+    Number.isInteger(data.question_index) &&
+    data.question_index < meetingQuestions.length
+  ) {
+    currentQuestionIndex = data.question_index;
+    currentQuestion = meetingQuestions[data.question_index];
+    return true;
+  }
   if (data.question) {
+    currentQuestionIndex = null;
     currentQuestion = data.question;
+    return true;
+  }
+  return false;
+}
+
+function handleMeetingStart(data) {
+  if (setCurrentQuestion(data)) {
+    // Sent when resuming a running meeting, so the countdown stays in sync
+    if (Number.isInteger(data.remaining_seconds)) {
+      durationInSeconds = data.remaining_seconds;
+    }
     updateStatus("Meeting in progress");
-    updateQuestion(data.question);
+    updateQuestion(currentQuestion);
     enableAnswerForm();
     startCountdown();
   }
 }
 
 function handleNextQuestion(data) {
-  if (data.question) {
-    currentQuestion = data.question;
-    updateQuestion(data.question);
+  if (setCurrentQuestion(data)) {
+    updateQuestion(currentQuestion);
     enableAnswerForm();
     resetSubmitButton();
   }
@@ -135,6 +202,8 @@ function handleQuestionSubmissionError() {
 }
 
 function handleMeetingEnd(data) {
+  hasMeetingEnded = true;
+  sessionStorage.removeItem(reconnectTokenKey);
   url = data.url;
   console.log("Meeting ended");
   console.log("Redirecting to:", url);
@@ -158,8 +227,12 @@ function submitAnswer(answer) {
   const message = {
     type: MessageTypes.SUBMIT_ANSWER,
     answer: answer,
-    question: currentQuestion,
   };
+  if (currentQuestionIndex !== null) {
+    message.question_index = currentQuestionIndex;
+  } else {
+    message.question = currentQuestion;
+  }
 
   sendMessage(message);
   handleAnswerSubmitted();
@@ -167,7 +240,7 @@ function submitAnswer(answer) {
 
 function sendMessage(message) {
   if (ws.readyState === WebSocket.OPEN) {
-    ws.send(JSON.stringify(message));
+    ws.send(MeetingCodec.encode(ws, message));
   } else {
     console.error("WebSocket is not open");
   }
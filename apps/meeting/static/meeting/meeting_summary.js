@@ -15,6 +15,10 @@ document.addEventListener("DOMContentLoaded", function () {
   const exportBtn = document.getElementById("export-btn");
   const container = document.querySelector(".container");
 
+  // Summaries are polled for up to 3 minutes
+  const SUMMARY_POLL_INTERVAL_MS = 2000;
+  const MAX_SUMMARY_POLLS = 90;
+
   // ======================
   // 2. UI COMPONENTS
   // ======================
@@ -106,6 +110,7 @@ document.addEventListener("DOMContentLoaded", function () {
 
   /**
    * Handle meeting summarization
+   * The summary is generated in the background; its status is polled until done
    */
   async function handleSummarize() {
     setLoadingState(true);
@@ -118,13 +123,28 @@ document.addEventListener("DOMContentLoaded", function () {
         },
       });
 
-      const data = await response.json();
+      let data = await response.json();
+      for (
+        let poll = 0;
+        data.type === "pending" && poll < MAX_SUMMARY_POLLS;
+        poll++
+      ) {
+        await new Promise((resolve) =>
+          setTimeout(resolve, SUMMARY_POLL_INTERVAL_MS)
+        );
+        const statusResponse = await fetch(
+          `/api/${meetingId}/summarize/status/`
+        );
+        data = await statusResponse.json();
+      }
 
-      if (data.type === "error") {
-        showPopup("Error summarizing meeting", true);
-      } else {
+      if (data.type === "success") {
         showPopup("Meeting successfully summarized, ready to be exported");
         exportBtn.disabled = false;
+      } else if (data.type === "pending") {
+        showPopup("Summary is still being generated - try again shortly", true);
+      } else {
+        showPopup("Error summarizing meeting", true);
       }
     } catch (error) {
       showPopup("Network error - please try again", true);
@@ -0,0 +1,81 @@
+"""
+Meeting Redis Store Module
+
+This module provides the asyncio Redis clients used for meeting state
+that needs native Redis data structures (sets, hashes, counters),
+which the Django cache API does not expose.
+
+Keys are stored in the database configured by `MEETING_REDIS_URL`, or,
+in a sharded deployment, on the `MEETING_REDIS_SHARD_URLS` node picked for
+each meeting by `sharding.get_shard_index`.
+"""
+
+import asyncio
+import weakref
+from collections.abc import Iterable
+
+from django.conf import settings
+from redis.asyncio import Redis
+
+from apps.meeting import sharding
+
+# NOTE: Redis connections are bound to the event loop that created them
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[int, Redis]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_redis_urls() -> list[str]:
+    """Returns the URL of every shard; a single URL when sharding is disabled"""
+    return getattr(settings, "MEETING_REDIS_SHARD_URLS", None) or [
+        settings.MEETING_REDIS_URL
+    ]
+
+
+def get_redis_client(meeting_access_code: str | None = None) -> Redis:
+    """
+    Returns the Redis client for the running event loop.
+
+    The client (and its connection pool) is created once per loop and
+    shard, and shared by every consumer running on it.
+
+    Args:
+        meeting_access_code: The meeting whose keys are accessed; None for
+            keys shared by every meeting (always on the first shard)
+
+    Returns:
+        Redis client decoding responses to `str`
+    """
+    redis_urls: list[str] = get_redis_urls()
+    shard_index: int = (
+        sharding.get_shard_index(meeting_access_code, len(redis_urls))
+        if meeting_access_code
+        else 0
+    )
+    running_loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    loop_clients: dict[int, Redis] | None = _clients.get(running_loop)
+    if loop_clients is None:
+        loop_clients = _clients[running_loop] = {}
+    redis_client: Redis | None = loop_clients.get(shard_index)
+    if redis_client is None:
+        redis_client = Redis.from_url(redis_urls[shard_index], decode_responses=True)
+        loop_clients[shard_index] = redis_client
+    return redis_client
+
+
+def group_by_client(meeting_access_codes: Iterable[str]) -> dict[Redis, list[str]]:
+    """
+    Groups meetings by the client of their shard, for one pipeline per shard.
+
+    Args:
+        meeting_access_codes: Access codes of the meetings to group
+
+    Returns:
+        The access codes of each shard's meetings, in their original order
+    """
+    meetings_by_client: dict[Redis, list[str]] = {}
+    for meeting_access_code in meeting_access_codes:
+        meetings_by_client.setdefault(get_redis_client(meeting_access_code), []).append(
+            meeting_access_code
+        )
+    return meetings_by_client
@@ -1,12 +1,50 @@
+import fakeredis
 import pytest
 from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
 
 from apps.base.models import CustomUser
 from apps.director.models import Meeting, Question
+from apps.meeting import context, store
+from apps.meeting.aggregation import answer_insights
+from apps.meeting.coalescer import host_updates
+from apps.meeting.ingestion import response_queue
 from apps.meeting.models import Response
 
 
 # ---------- Fixtures ----------
+@pytest.fixture(autouse=True)
+def clear_meeting_contexts() -> None:
+    """Process-wide meeting contexts must not leak between tests."""
+    context._meeting_contexts.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_process_buffers() -> None:
+    """Answers and host events buffered by an earlier test must not be flushed."""
+    response_queue._pending.clear()
+    host_updates._batches.clear()
+    answer_insights._pending.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> None:
+    """Cached users must not leak between tests."""
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def redis_client(monkeypatch: pytest.MonkeyPatch) -> fakeredis.FakeAsyncRedis:
+    """Isolated in-memory stand-in for the meeting Redis database."""
+    fake_redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(
+        store,
+        "get_redis_client",
+        lambda meeting_access_code=None: fake_redis_client,
+    )
+    return fake_redis_client
+
+
 @pytest.fixture
 def user(db: None) -> CustomUser:
     """Create a test user."""
@@ -0,0 +1,72 @@
+import pytest
+
+from apps.base.models import CustomUser
+from apps.meeting.benchmark import (
+    BenchmarkReport,
+    LatencySummary,
+    MeetingBenchmark,
+    WorkerScalingReport,
+    percentile,
+)
+from apps.meeting.constants import MessageTypes
+
+
+# ---------- Tests ----------
+def test_percentile_uses_nearest_rank() -> None:
+    samples: list[float] = [float(value) for value in range(1, 101)]
+    assert percentile(samples, 0.5) == 50
+    assert percentile(samples, 0.99) == 99
+    assert percentile([], 0.5) == 0
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("binary_protocol", [False, True])
+async def test_benchmark_runs_a_full_meeting(binary_protocol: bool) -> None:
+    """The harness should measure every phase and clean up its meeting."""
+    report = await MeetingBenchmark(
+        participant_count=3,
+        question_count=2,
+        answers_per_question=2,
+        binary_protocol=binary_protocol,
+    ).run()
+
+    samples_per_type: dict[str, int] = {
+        latency.message_type: latency.samples for latency in report.latencies
+    }
+    assert samples_per_type == {
+        MessageTypes.PARTICIPANT_JOINED: 3,
+        MessageTypes.START_MEETING: 3,
+        MessageTypes.SUBMIT_ANSWER: 12,
+        MessageTypes.NEXT_QUESTION: 3,
+        MessageTypes.END_MEETING: 3,
+    }
+    assert report.answer_count == 12
+    assert report.answer_query_count > 0
+    assert report.bytes_per_frame > 0
+    assert not await CustomUser.objects.aexists()
+
+
+def test_worker_scaling_report_aggregates_concurrent_meetings() -> None:
+    """Throughput should add up over workers, bounded by the slowest meeting."""
+
+    def build_report(elapsed_seconds: float, p99_ms: float) -> BenchmarkReport:
+        return BenchmarkReport(
+            participant_count=10,
+            latencies=[
+                LatencySummary(MessageTypes.SUBMIT_ANSWER, 10, p99_ms / 2, p99_ms)
+            ],
+            frame_count=1000,
+            byte_count=50_000,
+            elapsed_seconds=elapsed_seconds,
+            answer_count=10,
+            answer_query_count=2,
+        )
+
+    scaling_report = WorkerScalingReport(
+        reports=[build_report(2, 40), build_report(4, 60)]
+    )
+    assert scaling_report.worker_count == 2
+    assert scaling_report.participant_count == 20
+    assert scaling_report.frames_per_second == 500
+    assert scaling_report.get_p99_ms(MessageTypes.SUBMIT_ANSWER) == 60
+    assert WorkerScalingReport(reports=[]).frames_per_second == 0
@@ -0,0 +1,400 @@
+from typing import Any
+
+import fakeredis
+import msgpack
+import pytest
+from asgiref.sync import sync_to_async
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
+from django.contrib.sessions.backends.db import SessionStore
+
+from apps.base.models import CustomUser
+from apps.director.models import Meeting, Question
+from apps.meeting import codec, lifecycle, reconnect
+from apps.meeting.constants import MessageTypes
+from apps.meeting.models import Response
+from apps.meeting.routing import websocket_urlpatterns
+
+# NOTE: channels-stubs only accept channels' own URL pattern types
+application = URLRouter(websocket_urlpatterns)  # type: ignore[arg-type]
+
+
+# ---------- Helpers ----------
+def create_session_key(user: CustomUser) -> str:
+    session = SessionStore()
+    session["_auth_user_id"] = str(user.pk)
+    session.create()
+    return str(session.session_key)
+
+
+async def receive_until(
+    communicator: WebsocketCommunicator, message_type: str
+) -> dict[str, Any]:
+    """Skips unrelated frames until a message of the given type arrives."""
+    while True:
+        message: dict[str, Any] = await communicator.receive_json_from(timeout=2)
+        if message["type"] == message_type:
+            return message
+
+
+async def receive_binary_until(
+    communicator: WebsocketCommunicator, message_type: str
+) -> dict[str, Any]:
+    """Skips unrelated binary frames until a message of the given type arrives."""
+    while True:
+        message: dict[str, Any] = msgpack.unpackb(
+            await communicator.receive_from(timeout=2)
+        )
+        if message["type"] == codec.BINARY_MESSAGE_TYPE_CODES[message_type]:
+            return message
+
+
+async def receive_joins(host: WebsocketCommunicator, *names: str) -> None:
+    """Waits until the host saw the participants join, i.e. they joined the groups."""
+    pending_names: set[str] = set(names)
+    while pending_names:
+        host_update = await receive_until(host, MessageTypes.HOST_UPDATE)
+        pending_names -= {participant["name"] for participant in host_update["joined"]}
+
+
+async def connect_host(meeting: Meeting, user: CustomUser) -> WebsocketCommunicator:
+    session_key: str = await sync_to_async(create_session_key)(user)
+    host = WebsocketCommunicator(application, f"/ws/meeting/{meeting.id}/host/")
+    connected, _ = await host.connect()
+    assert connected
+    await host.send_json_to(
+        {"type": MessageTypes.AUTHENTICATE, "session_id": session_key}
+    )
+    await receive_until(host, MessageTypes.START_MEETING)
+    return host
+
+
+async def connect_participant(meeting: Meeting, name: str) -> WebsocketCommunicator:
+    participant = WebsocketCommunicator(
+        application, f"/ws/meeting/{meeting.access_code}/participant/"
+    )
+    connected, _ = await participant.connect()
+    assert connected
+    await participant.send_json_to(
+        {"type": MessageTypes.PARTICIPANT_JOINED, "name": name}
+    )
+    return participant
+
+
+# ---------- Tests ----------
+@pytest.mark.django_db(transaction=True)
+async def test_meeting_flow_uses_question_indexes(
+    user: CustomUser, meeting: Meeting, question: Question
+) -> None:
+    """Questions are sent once on join and referenced by index afterwards."""
+    second_question = await Question.objects.acreate(
+        meeting=meeting, description="What should we change?", position=2
+    )
+    host = await connect_host(meeting, user)
+    participant = await connect_participant(meeting, "Alice")
+
+    questions_message = await receive_until(participant, MessageTypes.QUESTIONS)
+    assert questions_message["questions"] == [
+        question.description,
+        second_question.description,
+    ]
+    joined_update = await receive_until(host, MessageTypes.HOST_UPDATE)
+    assert joined_update["joined"] == [{"name": "Alice", "status": "Connected"}]
+
+    await host.send_json_to({"type": MessageTypes.START_MEETING, "question_index": 0})
+    start_message = await receive_until(participant, MessageTypes.START_MEETING)
+    assert start_message == {"type": MessageTypes.START_MEETING, "question_index": 0}
+
+    await host.send_json_to({"type": MessageTypes.NEXT_QUESTION, "question_index": 1})
+    next_message = await receive_until(participant, MessageTypes.NEXT_QUESTION)
+    assert "question" not in next_message
+    assert next_message["question_index"] == 1
+
+    await participant.send_json_to(
+        {
+            "type": MessageTypes.SUBMIT_ANSWER,
+            "answer": "Fewer meetings",
+            "question_index": 1,
+        }
+    )
+    answer_update = await receive_until(host, MessageTypes.HOST_UPDATE)
+    assert answer_update["answers"] == 1
+    answer_insights = await receive_until(host, MessageTypes.ANSWER_INSIGHTS)
+    (question_insight,) = answer_insights["questions"]
+    assert question_insight["question_index"] == 1
+    assert question_insight["answer_count"] == 1
+    assert sorted(question_insight["top_terms"]) == [["fewer", 1], ["meetings", 1]]
+    assert question_insight["recent_answers"] == ["Fewer meetings"]
+
+    await host.send_json_to({"type": MessageTypes.END_MEETING})
+    await receive_until(host, MessageTypes.END_MEETING)
+    await receive_until(participant, MessageTypes.END_MEETING)
+
+    saved_response = await Response.objects.aget(meeting=meeting)
+    assert saved_response.question_id == second_question.id
+    assert saved_response.response_text == "Fewer meetings"
+
+    await participant.disconnect()
+    await host.disconnect()
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_submit_with_out_of_range_index_is_rejected(
+    user: CustomUser, meeting: Meeting, question: Question
+) -> None:
+    """An index outside the meeting's question list should not be accepted."""
+    host = await connect_host(meeting, user)
+    participant = await connect_participant(meeting, "Bob")
+    await receive_until(participant, MessageTypes.QUESTIONS)
+
+    await participant.send_json_to(
+        {"type": MessageTypes.SUBMIT_ANSWER, "answer": "Hi", "question_index": 5}
+    )
+    await receive_until(participant, MessageTypes.SUBMIT_ERROR)
+
+    await participant.disconnect()
+    await host.disconnect()
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_reconnecting_host_rebuilds_roster_from_presence(
+    user: CustomUser,
+    meeting: Meeting,
+    question: Question,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A new host connection should receive the connected participants."""
+    monkeypatch.setattr(reconnect, "RECONNECT_GRACE_SECONDS", 0)
+    host = await connect_host(meeting, user)
+    participant = await connect_participant(meeting, "Alice")
+    joined_update = await receive_until(host, MessageTypes.HOST_UPDATE)
+    assert joined_update["participant_count"] == 1
+
+    reconnected_host = WebsocketCommunicator(
+        application, f"/ws/meeting/{meeting.id}/host/"
+    )
+    await reconnected_host.connect()
+    session_key: str = await sync_to_async(create_session_key)(user)
+    await reconnected_host.send_json_to(
+        {"type": MessageTypes.AUTHENTICATE, "session_id": session_key}
+    )
+    roster_message = await receive_until(reconnected_host, MessageTypes.ROSTER)
+    assert roster_message["participants"] == [{"name": "Alice", "status": "Connected"}]
+
+    await participant.disconnect()
+    left_update = await receive_until(host, MessageTypes.HOST_UPDATE)
+    assert left_update["left"] == ["Alice"]
+    assert left_update["participant_count"] == 0
+
+    await reconnected_host.disconnect()
+    await host.disconnect()
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_started_meeting_outlives_host_disconnect(
+    user: CustomUser,
+    meeting: Meeting,
+    question: Question,
+    redis_client: fakeredis.FakeAsyncRedis,
+) -> None:
+    """Participants stay in a started meeting until its deadline fires."""
+    host = await connect_host(meeting, user)
+    participant = await connect_participant(meeting, "Alice")
+    await receive_until(participant, MessageTypes.SESSION_TOKEN)
+    await receive_joins(host, "Alice")
+
+    await host.send_json_to({"type": MessageTypes.START_MEETING, "question_index": 0})
+    await receive_until(participant, MessageTypes.START_MEETING)
+    await host.disconnect()
+    assert await participant.receive_nothing(timeout=0.2)
+
+    await redis_client.zadd(lifecycle.MEETING_DEADLINES_KEY, {meeting.access_code: 0})
+    assert await lifecycle.end_expired_meetings() == [meeting.access_code]
+    await receive_until(participant, MessageTypes.END_MEETING)
+    await participant.disconnect()
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_reconnecting_host_resumes_running_meeting(
+    user: CustomUser, meeting: Meeting, question: Question
+) -> None:
+    """A host reloading mid-meeting should get the live state on connect."""
+    await Question.objects.acreate(meeting=meeting, description="Next?", position=2)
+    host = await connect_host(meeting, user)
+    await receive_until(host, MessageTypes.ROSTER)
+    await host.send_json_to({"type": MessageTypes.START_MEETING, "question_index": 0})
+    await host.send_json_to({"type": MessageTypes.NEXT_QUESTION, "question_index": 1})
+    await host.disconnect()
+
+    session_key: str = await sync_to_async(create_session_key)(user)
+    reconnected_host = WebsocketCommunicator(
+        application, f"/ws/meeting/{meeting.id}/host/"
+    )
+    connected, _ = await reconnected_host.connect()
+    assert connected
+    await reconnected_host.send_json_to(
+        {"type": MessageTypes.AUTHENTICATE, "session_id": session_key}
+    )
+    initial_data = await receive_until(reconnected_host, MessageTypes.START_MEETING)
+    assert initial_data["current_question_index"] == 1
+    assert 0 < initial_data["remaining_seconds"] <= meeting.duration * 60
+
+    await reconnected_host.send_json_to({"type": MessageTypes.END_MEETING})
+    await receive_until(reconnected_host, MessageTypes.END_MEETING)
+    await reconnected_host.disconnect()
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_host_events_are_sent_one_by_one_without_coalescing(
+    user: CustomUser,
+    meeting: Meeting,
+    question: Question,
+    settings: Any,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A zero interval keeps the per-event host notifications."""
+    monkeypatch.setattr(reconnect, "RECONNECT_GRACE_SECONDS", 0)
+    settings.MEETING_HOST_UPDATE_INTERVAL_SECONDS = 0
+    host = await connect_host(meeting, user)
+    participant = await connect_participant(meeting, "Alice")
+
+    joined_message = await receive_until(host, MessageTypes.PARTICIPANT_JOINED)
+    assert joined_message["participant"]["name"] == "Alice"
+
+    await participant.disconnect()
+    await receive_until(host, MessageTypes.PARTICIPANT_LEFT)
+    await host.disconnect()
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_binary_participants_share_broadcasts_with_json_participants(
+    user: CustomUser, meeting: Meeting, question: Question
+) -> None:
+    """Participants negotiating MessagePack should get binary frames."""
+    host = await connect_host(meeting, user)
+    json_participant = await connect_participant(meeting, "Alice")
+    binary_participant = WebsocketCommunicator(
+        application,
+        f"/ws/meeting/{meeting.access_code}/participant/",
+        subprotocols=[codec.MSGPACK_SUBPROTOCOL, codec.JSON_SUBPROTOCOL],
+    )
+    connected, subprotocol = await binary_participant.connect()
+    assert connected
+    assert subprotocol == codec.MSGPACK_SUBPROTOCOL
+    await binary_participant.send_to(
+        bytes_data=codec.encode_binary(
+            {"type": MessageTypes.PARTICIPANT_JOINED, "name": "Bob"}
+        )
+    )
+
+    questions_frame = await receive_binary_until(
+        binary_participant, MessageTypes.QUESTIONS
+    )
+    assert questions_frame == {
+        "type": codec.BINARY_MESSAGE_TYPE_CODES[MessageTypes.QUESTIONS],
+        "questions": [question.description],
+    }
+    await receive_until(json_participant, MessageTypes.QUESTIONS)
+    await receive_joins(host, "Alice", "Bob")
+
+    await host.send_json_to({"type": MessageTypes.START_MEETING, "question_index": 0})
+    start_message = await receive_until(json_participant, MessageTypes.START_MEETING)
+    assert start_message == {"type": MessageTypes.START_MEETING, "question_index": 0}
+    assert await receive_binary_until(
+        binary_participant, MessageTypes.START_MEETING
+    ) == {
+        "type": codec.BINARY_MESSAGE_TYPE_CODES[MessageTypes.START_MEETING],
+        "question_index": 0,
+    }
+
+    await binary_participant.send_to(
+        bytes_data=codec.encode_binary(
+            {"type": MessageTypes.SUBMIT_ANSWER, "answer": "Yes", "question_index": 0}
+        )
+    )
+    answer_update = await receive_until(host, MessageTypes.HOST_UPDATE)
+    assert answer_update["answers"] == 1
+
+    await binary_participant.disconnect()
+    await json_participant.disconnect()
+    await host.disconnect()
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_participant_resumes_session_with_reconnect_token(
+    user: CustomUser, meeting: Meeting, question: Question
+) -> None:
+    """A dropped participant should get its name and question back silently."""
+    host = await connect_host(meeting, user)
+    participant = await connect_participant(meeting, "Alice")
+    token_message = await receive_until(participant, MessageTypes.SESSION_TOKEN)
+    joined_update = await receive_until(host, MessageTypes.HOST_UPDATE)
+    assert joined_update["joined"] == [{"name": "Alice", "status": "Connected"}]
+
+    await host.send_json_to({"type": MessageTypes.START_MEETING, "question_index": 0})
+    await receive_until(participant, MessageTypes.START_MEETING)
+    await participant.disconnect()
+
+    # NOTE: The meeting is locked, but the token lets the participant back in
+    resumed_participant = WebsocketCommunicator(
+        application, f"/ws/meeting/{meeting.access_code}/participant/"
+    )
+    connected, _ = await resumed_participant.connect()
+    assert connected
+    await resumed_participant.send_json_to(
+        {
+            "type": MessageTypes.PARTICIPANT_JOINED,
+            "name": "Alice",
+            "token": token_message["token"],
+        }
+    )
+    await receive_until(resumed_participant, MessageTypes.QUESTIONS)
+    resumed_question = await receive_until(
+        resumed_participant, MessageTypes.START_MEETING
+    )
+    assert resumed_question["question_index"] == 0
+    assert 0 < resumed_question["remaining_seconds"] <= meeting.duration * 60
+
+    # NOTE: The host sees neither a departure nor a second join
+    assert await host.receive_nothing(timeout=0.5)
+
+    await resumed_participant.send_json_to(
+        {"type": MessageTypes.SUBMIT_ANSWER, "answer": "Back", "question_index": 0}
+    )
+    answer_update = await receive_until(host, MessageTypes.HOST_UPDATE)
+    assert answer_update["answers"] == 1
+
+    await host.send_json_to({"type": MessageTypes.END_MEETING})
+    await receive_until(resumed_participant, MessageTypes.END_MEETING)
+    saved_response = await Response.objects.select_related("participant_session").aget(
+        meeting=meeting
+    )
+    assert saved_response.participant_session is not None
+    assert saved_response.participant_session.name == "Alice"
+    assert saved_response.participant_session.total_responses == 1
+    await resumed_participant.disconnect()
+    await host.disconnect()
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_locked_meeting_rejects_unknown_reconnect_token(
+    user: CustomUser, meeting: Meeting, question: Question
+) -> None:
+    host = await connect_host(meeting, user)
+    await host.send_json_to({"type": MessageTypes.START_MEETING, "question_index": 0})
+    await host.receive_nothing(timeout=0.1)
+
+    participant = WebsocketCommunicator(
+        application, f"/ws/meeting/{meeting.access_code}/participant/"
+    )
+    await participant.connect()
+    await participant.send_json_to(
+        {"type": MessageTypes.PARTICIPANT_JOINED, "name": "Mallory", "token": "forged"}
+    )
+    close_output = await participant.receive_output(timeout=1)
+    assert close_output == {
+        "type": "websocket.close",
+        "code": 4401,
+        "reason": "meeting_locked",
+    }
+    await host.disconnect()
@@ -0,0 +1,32 @@
+import pytest
+from django.test import Client
+from django.urls import reverse
+
+from apps.base.models import CustomUser
+
+
+class TestMeetingMetrics:
+    """Test the per-process consumer metrics endpoint"""
+
+    @pytest.mark.django_db
+    def test_metrics_are_restricted_to_staff(
+        self, client: Client, user: CustomUser
+    ) -> None:
+        client.force_login(user)
+        response = client.get(reverse("meeting-metrics"))
+        assert response.status_code == 403
+
+    @pytest.mark.django_db
+    def test_metrics_are_rendered_for_staff(
+        self, client: Client, user: CustomUser
+    ) -> None:
+        user.is_staff = True
+        user.save()
+        client.force_login(user)
+
+        response = client.get(reverse("meeting-metrics"))
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain")
+        assert b"# TYPE collaboard_meeting_handler_seconds histogram" in (
+            response.content
+        )
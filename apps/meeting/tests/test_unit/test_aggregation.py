@@ -0,0 +1,61 @@
+from apps.meeting import aggregation, utils
+from apps.meeting.aggregation import AnswerAggregator
+from apps.meeting.constants import GroupPrefixes, MessageTypes
+
+
+# ---------- Tests ----------
+def test_extract_terms_skips_stop_words_and_short_words() -> None:
+    """Only distinct, meaningful words should be counted."""
+    assert aggregation.extract_terms("The pricing, the PRICING and UX in 2024!") == {
+        "pricing"
+    }
+
+
+async def test_flush_sends_one_snapshot_per_meeting() -> None:
+    """Buffered answers should reach the host as one aggregated snapshot."""
+    channel_layer = utils.get_meeting_channel_layer()
+    host_channel: str = await channel_layer.new_channel()
+    await channel_layer.group_add(f"{GroupPrefixes.HOST}ABC12345", host_channel)
+
+    aggregator = AnswerAggregator()
+    aggregator.add_answer("ABC12345", 0, "Pricing is unclear")
+    aggregator.add_answer("ABC12345", 0, "Better pricing docs")
+    aggregator.add_answer("ABC12345", 1, "Faster builds")
+    await aggregator.flush()
+
+    snapshot = await channel_layer.receive(host_channel)
+    assert snapshot["type"] == MessageTypes.ANSWER_INSIGHTS
+    first_question, second_question = snapshot["questions"]
+    assert first_question["question_index"] == 0
+    assert first_question["answer_count"] == 2
+    assert first_question["top_terms"][0] == ["pricing", 2]
+    assert first_question["recent_answers"] == [
+        "Better pricing docs",
+        "Pricing is unclear",
+    ]
+    assert second_question["answer_count"] == 1
+
+    # NOTE: Later windows add to the aggregates already in Redis
+    aggregator.add_answer("ABC12345", 0, "Pricing again")
+    await aggregator.flush()
+    snapshot = await channel_layer.receive(host_channel)
+    assert snapshot["questions"][0]["answer_count"] == 3
+    assert snapshot["questions"][0]["top_terms"][0] == ["pricing", 3]
+
+
+async def test_recent_answers_are_capped() -> None:
+    """Only the latest answers should be kept for the host."""
+    aggregator = AnswerAggregator()
+    for answer_number in range(aggregation.RECENT_ANSWERS_COUNT + 3):
+        aggregator.add_answer("ABC12345", 0, f"Answer {answer_number}")
+    await aggregator.flush()
+
+    (insight,) = await aggregation.get_answer_insights("ABC12345", [0, 1])
+    assert insight["answer_count"] == aggregation.RECENT_ANSWERS_COUNT + 3
+    assert len(insight["recent_answers"]) == aggregation.RECENT_ANSWERS_COUNT
+    assert insight["recent_answers"][0] == (
+        f"Answer {aggregation.RECENT_ANSWERS_COUNT + 2}"
+    )
+
+    await aggregation.clear_answer_insights("ABC12345")
+    assert await aggregation.get_answer_insights("ABC12345", [0]) == []
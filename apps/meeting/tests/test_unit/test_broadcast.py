@@ -0,0 +1,66 @@
+import asyncio
+
+from channels.generic.websocket import AsyncWebsocketConsumer
+
+from apps.meeting import utils
+from apps.meeting.broadcast import (
+    MeetingBroadcaster,
+    build_broadcast_message,
+    get_fanout_group_name,
+)
+
+
+class RecordingConsumer(AsyncWebsocketConsumer):
+    def __init__(self) -> None:
+        super().__init__()
+        self.frames: list[str] = []
+
+    async def send(  # type: ignore[override]
+        self,
+        text_data: str | None = None,
+        bytes_data: bytes | None = None,
+        close: bool | int = False,
+    ) -> None:
+        assert text_data is not None
+        self.frames.append(text_data)
+
+
+# ---------- Tests ----------
+async def test_broadcast_reaches_local_subscribers_once_encoded() -> None:
+    """One channel layer message should reach every local participant."""
+    broadcaster = MeetingBroadcaster()
+    first_consumer, second_consumer = RecordingConsumer(), RecordingConsumer()
+    other_meeting_consumer = RecordingConsumer()
+    await broadcaster.subscribe("ABC12345", first_consumer)
+    await broadcaster.subscribe("ABC12345", second_consumer)
+    await broadcaster.subscribe("XYZ98765", other_meeting_consumer)
+
+    message = build_broadcast_message(
+        "ABC12345", {"type": "next_question", "question_index": 1}
+    )
+    await utils.get_meeting_channel_layer().group_send(
+        get_fanout_group_name("ABC12345"), message
+    )
+    for _ in range(10):
+        await asyncio.sleep(0.01)
+        if second_consumer.frames:
+            break
+
+    assert first_consumer.frames == [message["text"]]
+    assert second_consumer.frames[0] is first_consumer.frames[0]
+    assert other_meeting_consumer.frames == []
+
+
+async def test_last_unsubscribe_leaves_the_fanout_group() -> None:
+    """A worker without participants of a meeting stops receiving its broadcasts."""
+    broadcaster = MeetingBroadcaster()
+    consumer = RecordingConsumer()
+    await broadcaster.subscribe("ABC12345", consumer)
+    await broadcaster.unsubscribe("ABC12345", consumer)
+
+    await utils.get_meeting_channel_layer().group_send(
+        get_fanout_group_name("ABC12345"),
+        build_broadcast_message("ABC12345", {"type": "start_meeting"}),
+    )
+    await asyncio.sleep(0.05)
+    assert consumer.frames == []
@@ -0,0 +1,65 @@
+from typing import Any
+
+import pytest
+
+from apps.meeting import utils
+from apps.meeting.coalescer import HostUpdateCoalescer
+from apps.meeting.constants import MessageTypes
+
+
+class RecordingChannelLayer:
+    def __init__(self) -> None:
+        self.sent: list[tuple[str, dict[str, Any]]] = []
+
+    async def group_send(self, group: str, message: dict[str, Any]) -> None:
+        self.sent.append((group, message))
+
+
+# ---------- Fixtures ----------
+@pytest.fixture
+def channel_layer(monkeypatch: pytest.MonkeyPatch) -> RecordingChannelLayer:
+    recording_channel_layer = RecordingChannelLayer()
+    monkeypatch.setattr(
+        utils, "get_meeting_channel_layer", lambda: recording_channel_layer
+    )
+    return recording_channel_layer
+
+
+# ---------- Tests ----------
+async def test_events_are_sent_as_one_delta_per_meeting(
+    channel_layer: RecordingChannelLayer,
+) -> None:
+    """A storm of answers and joins becomes a single group send per meeting."""
+    host_updates = HostUpdateCoalescer()
+    for number in range(3):
+        host_updates.add_join("ABC12345", f"Participant {number}", number + 1)
+    for _ in range(37):
+        host_updates.add_answer("ABC12345")
+    host_updates.add_answer("XYZ98765")
+    await host_updates.flush()
+
+    assert len(channel_layer.sent) == 2
+    group, message = channel_layer.sent[0]
+    assert group == "meeting_host_ABC12345"
+    assert message == {
+        "type": MessageTypes.HOST_UPDATE,
+        "answers": 37,
+        "joined": ["Participant 0", "Participant 1", "Participant 2"],
+        "left": [],
+        "participant_count": 3,
+    }
+
+
+async def test_join_and_leave_in_one_window_cancel_out(
+    channel_layer: RecordingChannelLayer,
+) -> None:
+    """The host never hears of a participant that came and went between deltas."""
+    host_updates = HostUpdateCoalescer()
+    host_updates.add_join("ABC12345", "Alice", 1)
+    host_updates.add_leave("ABC12345", "Alice", 0)
+    await host_updates.flush()
+
+    _, message = channel_layer.sent[0]
+    assert message["joined"] == []
+    assert message["left"] == []
+    assert message["participant_count"] == 0
@@ -0,0 +1,96 @@
+import msgpack
+import pytest
+
+from apps.meeting import codec
+from apps.meeting.constants import MessageTypes
+
+
+# ---------- Tests ----------
+def test_encode_round_trips_through_decode() -> None:
+    """Encoded frames should decode to the same data."""
+    frame = {"type": MessageTypes.QUESTIONS, "questions": ["Why?", "Café ☕"]}
+    assert codec.decode(codec.encode(frame)) == frame
+    assert codec.decode(codec.encode(frame).encode()) == frame
+
+
+def test_decode_raises_decode_error_on_invalid_json() -> None:
+    """Invalid JSON should surface as the codec's own error type."""
+    with pytest.raises(codec.DecodeError):
+        codec.decode("{not json")
+
+
+def test_decode_frame_accepts_valid_frames() -> None:
+    """A frame matching its schema should be returned as decoded."""
+    frame = codec.decode_frame(
+        '{"type": "submit_answer", "answer": "Yes", "question_index": 0}',
+        codec.PARTICIPANT_FRAMES,
+    )
+    assert frame == {"type": "submit_answer", "answer": "Yes", "question_index": 0}
+
+
+@pytest.mark.parametrize(
+    "raw_frame",
+    [
+        "[1, 2, 3]",
+        '{"answer": "Yes"}',
+        '{"type": 5}',
+        '{"type": "start_meeting"}',
+        '{"type": "submit_answer", "answer": 42}',
+        '{"type": "submit_answer", "answer": "Yes", "question_index": "0"}',
+        '{"type": "submit_answer", "answer": "Yes", "question_index": true}',
+        '{"type": "participant_joined", "name": ["Bob"]}',
+        codec.encode({"type": "participant_joined", "name": "B" * 31}),
+    ],
+)
+def test_decode_frame_rejects_malformed_frames(raw_frame: str) -> None:
+    """Frames of unknown types or with mistyped fields should be rejected."""
+    with pytest.raises(codec.DecodeError):
+        codec.decode_frame(raw_frame, codec.PARTICIPANT_FRAMES)
+
+
+def test_host_and_participant_frames_are_separate() -> None:
+    """Participants should not be able to send host-only frames."""
+    assert codec.decode_frame('{"type": "end_meeting"}', codec.HOST_FRAMES)
+    with pytest.raises(codec.DecodeError):
+        codec.decode_frame('{"type": "end_meeting"}', codec.PARTICIPANT_FRAMES)
+
+
+def test_binary_frames_use_integer_type_codes() -> None:
+    """Binary frames should carry the message type as its small integer code."""
+    frame = {"type": MessageTypes.NEXT_QUESTION, "question_index": 2}
+    encoded_frame = codec.encode_binary(frame)
+    assert len(encoded_frame) < len(codec.encode(frame))
+    assert msgpack.unpackb(encoded_frame) == {"type": 3, "question_index": 2}
+
+
+def test_decode_binary_frame_validates_like_json() -> None:
+    """Binary client frames should be held to the same schemas."""
+    encoded_frame = codec.encode_binary(
+        {"type": MessageTypes.SUBMIT_ANSWER, "answer": "Yes", "question_index": 0}
+    )
+    assert codec.decode_binary_frame(encoded_frame, codec.PARTICIPANT_FRAMES) == {
+        "type": MessageTypes.SUBMIT_ANSWER,
+        "answer": "Yes",
+        "question_index": 0,
+    }
+    for malformed_frame in (
+        b"\xc1",
+        msgpack.packb([1, 2]),
+        msgpack.packb({"type": 99}),
+        codec.encode_binary({"type": MessageTypes.SUBMIT_ANSWER, "answer": 1}),
+    ):
+        with pytest.raises(codec.DecodeError):
+            codec.decode_binary_frame(malformed_frame, codec.PARTICIPANT_FRAMES)
+
+
+def test_negotiate_subprotocol_prefers_the_clients_order() -> None:
+    assert codec.negotiate_subprotocol([]) is None
+    assert codec.negotiate_subprotocol(["chat"]) is None
+    assert (
+        codec.negotiate_subprotocol(["chat", codec.MSGPACK_SUBPROTOCOL])
+        == codec.MSGPACK_SUBPROTOCOL
+    )
+    assert (
+        codec.negotiate_subprotocol([codec.JSON_SUBPROTOCOL, codec.MSGPACK_SUBPROTOCOL])
+        == codec.JSON_SUBPROTOCOL
+    )
@@ -0,0 +1,50 @@
+from typing import Any
+
+import pytest
+
+from apps.director.models import Meeting, Question
+from apps.meeting import context
+from apps.meeting.context import forget_meeting_context, get_meeting_context
+
+
+# ---------- Tests ----------
+@pytest.mark.django_db(transaction=True)
+async def test_context_maps_descriptions_to_question_ids(
+    meeting: Meeting, question: Question
+) -> None:
+    """The context should resolve question descriptions without further queries."""
+    meeting_context = await get_meeting_context(meeting.access_code)
+    assert meeting_context is not None
+    assert meeting_context.meeting_id == meeting.id
+    assert meeting_context.question_ids == {question.description: question.id}
+    forget_meeting_context(meeting.access_code)
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_context_is_loaded_once_per_process(
+    meeting: Meeting, question: Question, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Consumers of the same meeting should share a single context load."""
+    load_calls: list[str] = []
+    original_loader = context.load_meeting_context
+
+    async def counting_loader(access_code: str) -> Any:
+        load_calls.append(access_code)
+        return await original_loader(access_code)
+
+    monkeypatch.setattr(context, "load_meeting_context", counting_loader)
+    first_context = await get_meeting_context(meeting.access_code)
+    second_context = await get_meeting_context(meeting.access_code)
+    assert first_context is second_context
+    assert load_calls == [meeting.access_code]
+
+    forget_meeting_context(meeting.access_code)
+    await get_meeting_context(meeting.access_code)
+    assert len(load_calls) == 2
+    forget_meeting_context(meeting.access_code)
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_context_is_none_for_unknown_meeting() -> None:
+    """Unknown access codes should not be cached."""
+    assert await get_meeting_context("NOPE0000") is None
@@ -0,0 +1,117 @@
+from typing import Any
+
+import pytest
+
+from apps.director.models import Meeting, Question
+from apps.meeting import ingestion
+from apps.meeting.ingestion import ResponseIngestionQueue
+from apps.meeting.instrumentation import InMemoryInstrumentation
+from apps.meeting.models import ParticipantSession, Response
+
+
+# ---------- Tests ----------
+def test_build_response_rejects_invalid_text() -> None:
+    """Blank and oversized answers should be rejected without a database hit."""
+    queue = ResponseIngestionQueue()
+    meeting_id = Meeting().id
+    assert queue.build_response(meeting_id, 1, "") is None
+    assert queue.build_response(meeting_id, 1, "x" * 501) is None
+    assert queue.build_response(meeting_id, 1, "Fine") is not None
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_flush_persists_batch_with_single_insert(
+    meeting: Meeting, question: Question, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Queued answers should be written together when the queue is flushed."""
+    insert_batches: list[int] = []
+    original_bulk_insert = ingestion._bulk_insert_responses
+
+    async def counting_bulk_insert(responses: list[Any]) -> None:
+        insert_batches.append(len(responses))
+        await original_bulk_insert(responses)
+
+    monkeypatch.setattr(ingestion, "_bulk_insert_responses", counting_bulk_insert)
+    queue = ResponseIngestionQueue(batch_size=50, flush_interval=60)
+    for answer_number in range(10):
+        assert queue.submit(meeting.id, question.id, f"Answer {answer_number}")
+    assert len(queue) == 10
+
+    written_count = await queue.flush()
+
+    assert written_count == 10
+    assert len(queue) == 0
+    assert insert_batches == [10]
+    assert await Response.objects.filter(meeting=meeting).acount() == 10
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_full_batch_flushes_without_waiting_for_interval(
+    meeting: Meeting, question: Question
+) -> None:
+    """Reaching the batch size should hand the batch to a background insert."""
+    queue = ResponseIngestionQueue(batch_size=3, flush_interval=60)
+    for answer_number in range(3):
+        queue.submit(meeting.id, question.id, f"Answer {answer_number}")
+    assert len(queue) == 0
+
+    await queue.flush()
+    assert await Response.objects.filter(question=question).acount() == 3
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_failed_batch_only_drops_the_invalid_answers(
+    meeting: Meeting, question: Question, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """One answer to a deleted question should not lose the rest of its batch."""
+    metrics = InMemoryInstrumentation()
+    monkeypatch.setattr(ingestion, "get_instrumentation", lambda: metrics)
+    deleted_question = await Question.objects.acreate(
+        meeting=meeting, description="Removed?", position=2
+    )
+    queue = ResponseIngestionQueue(batch_size=50, flush_interval=60)
+    queue.submit(meeting.id, question.id, "Kept")
+    queue.submit(meeting.id, deleted_question.id, "Dropped")
+    queue.submit(meeting.id, question.id, "Also kept")
+    await deleted_question.adelete()
+
+    assert await queue.flush() == 2
+    assert sorted(
+        [
+            response_text
+            async for response_text in Response.objects.filter(
+                meeting=meeting
+            ).values_list("response_text", flat=True)
+        ]
+    ) == ["Also kept", "Kept"]
+    assert "collaboard_meeting_responses_dropped_total 1" in metrics.render()
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_flush_counts_the_answers_of_each_participant(
+    meeting: Meeting, question: Question
+) -> None:
+    """Written answers should be added to their participant session's total."""
+    alice = await ParticipantSession.objects.acreate(
+        meeting=meeting, name="Alice", sessiontoken="alice-token"
+    )
+    bob = await ParticipantSession.objects.acreate(
+        meeting=meeting, name="Bob", sessiontoken="bob-token"
+    )
+    queue = ResponseIngestionQueue(batch_size=50, flush_interval=60)
+    queue.submit(meeting.id, question.id, "First", participant_session_id=alice.id)
+    queue.submit(meeting.id, question.id, "Second", participant_session_id=alice.id)
+    queue.submit(meeting.id, question.id, "Only", participant_session_id=bob.id)
+    queue.submit(meeting.id, question.id, "Anonymous")
+
+    assert await queue.flush() == 4
+    await alice.arefresh_from_db()
+    await bob.arefresh_from_db()
+    assert (alice.total_responses, bob.total_responses) == (2, 1)
+
+
+def test_submit_rejects_invalid_answer_without_queueing() -> None:
+    """Invalid answers should never reach the pending batch."""
+    queue = ResponseIngestionQueue()
+    assert not queue.submit(Meeting().id, 1, "")
+    assert len(queue) == 0
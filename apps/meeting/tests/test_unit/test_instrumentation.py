@@ -0,0 +1,97 @@
+import pytest
+
+from apps.meeting import base, instrumentation
+from apps.meeting.base import BaseMeetingConsumer
+from apps.meeting.instrumentation import InMemoryInstrumentation
+
+
+# ---------- Fixtures ----------
+@pytest.fixture
+def metrics(monkeypatch: pytest.MonkeyPatch) -> InMemoryInstrumentation:
+    """Fresh metrics backend, isolated from the process-wide one."""
+    fresh_metrics = InMemoryInstrumentation()
+    monkeypatch.setattr(instrumentation, "get_instrumentation", lambda: fresh_metrics)
+    return fresh_metrics
+
+
+# ---------- Tests ----------
+def test_histograms_are_rendered_cumulatively() -> None:
+    """Buckets follow the Prometheus convention of cumulative counts."""
+    metrics = InMemoryInstrumentation()
+    metrics.handler_finished("handle_submit_answer", "ABC12345", 0.003, False)
+    metrics.handler_finished("handle_submit_answer", "ABC12345", 0.2, True)
+
+    rendered: str = metrics.render()
+    assert (
+        'collaboard_meeting_handler_seconds_bucket{handler="handle_submit_answer",'
+        'le="0.005"} 1'
+    ) in rendered
+    assert (
+        'collaboard_meeting_handler_seconds_bucket{handler="handle_submit_answer",'
+        'le="+Inf"} 2'
+    ) in rendered
+    assert (
+        'collaboard_meeting_handler_errors_total{handler="handle_submit_answer"} 1'
+    ) in rendered
+    assert 'collaboard_meeting_message_count_total{meeting="ABC12345"} 2' in rendered
+
+
+def test_only_the_latest_meetings_are_tracked(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Per-meeting series must not grow without bound."""
+    monkeypatch.setattr(instrumentation, "MAX_TRACKED_MEETINGS", 2)
+    metrics = InMemoryInstrumentation()
+    for meeting_access_code in ("AAAA0000", "BBBB0000", "CCCC0000"):
+        metrics.group_send_finished(meeting_access_code, 0.001)
+
+    rendered: str = metrics.render()
+    assert 'meeting="AAAA0000"' not in rendered
+    assert 'meeting="CCCC0000"' in rendered
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_handlers_report_to_the_backend(
+    metrics: InMemoryInstrumentation,
+) -> None:
+    """Decorated handlers report their duration under their own name."""
+
+    class Consumer:
+        @instrumentation.instrumented
+        async def handle_next_question(self) -> None:
+            return None
+
+    token = instrumentation.current_meeting.set("ABC12345")
+    try:
+        await Consumer().handle_next_question()
+    finally:
+        instrumentation.current_meeting.reset(token)
+
+    assert "handle_next_question" in metrics._handler_histograms
+    assert metrics._meeting_totals["ABC12345"].message_count == 1
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_client_frames_are_reported_once(
+    metrics: InMemoryInstrumentation, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Frames reaching a decorated handler are not counted again by dispatch."""
+    monkeypatch.setattr(base, "get_instrumentation", lambda: metrics)
+
+    class Consumer(BaseMeetingConsumer):
+        meeting_access_code: str = "ABC12345"
+
+        async def receive(
+            self, text_data: str | None = None, bytes_data: bytes | None = None
+        ) -> None:
+            await self.handle_next_question()
+
+        @instrumentation.instrumented
+        async def handle_next_question(self) -> None:
+            return None
+
+    await Consumer().dispatch({"type": "websocket.receive", "text": "{}"})
+
+    assert "websocket.receive" not in metrics._handler_histograms
+    assert "handle_next_question" in metrics._handler_histograms
+    assert metrics._meeting_totals["ABC12345"].message_count == 1
@@ -0,0 +1,99 @@
+import asyncio
+
+import fakeredis
+import pytest
+
+from apps.base.models import CustomUser
+from apps.director.models import Meeting
+from apps.meeting import lifecycle, utils
+from apps.meeting.constants import GroupPrefixes, MessageTypes
+from apps.meeting.models import MeetingSession
+from apps.meeting.timers import meeting_deadlines
+
+
+# ---------- Tests ----------
+@pytest.mark.django_db(transaction=True)
+async def test_expired_meeting_is_ended_exactly_once(
+    user: CustomUser, meeting: Meeting, redis_client: fakeredis.FakeAsyncRedis
+) -> None:
+    """Workers racing for an expired deadline should finalize the meeting once."""
+    channel_layer = utils.get_meeting_channel_layer()
+    participant_channel: str = await channel_layer.new_channel()
+    await channel_layer.group_add(
+        f"{GroupPrefixes.PARTICIPANT}{meeting.access_code}", participant_channel
+    )
+
+    assert await lifecycle.start_meeting(meeting.access_code, duration_seconds=600)
+    assert not await lifecycle.start_meeting(meeting.access_code, duration_seconds=600)
+    await lifecycle.record_question_presented(meeting.access_code)
+    await lifecycle.record_response(meeting.access_code)
+
+    # NOTE: Simulate a deadline set by a worker that has since crashed
+    meeting_deadlines.cancel(meeting.access_code)
+    await redis_client.zadd(lifecycle.MEETING_DEADLINES_KEY, {meeting.access_code: 0})
+
+    first_poll, second_poll = await asyncio.gather(
+        lifecycle.end_expired_meetings(), lifecycle.end_expired_meetings()
+    )
+    assert sorted(first_poll + second_poll) == [meeting.access_code]
+
+    end_message = await channel_layer.receive(participant_channel)
+    assert end_message["type"] == MessageTypes.END_MEETING
+    assert not await lifecycle.is_meeting_started(meeting.access_code)
+
+    await meeting.arefresh_from_db()
+    assert meeting.total_questions_asked == 2
+    await user.arefresh_from_db()
+    assert user.meetings_created_count == 1
+    assert user.total_responses_count == 1
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_meeting_ends_on_its_local_deadline(meeting: Meeting) -> None:
+    """The starting worker should end the meeting without waiting for a poll."""
+    channel_layer = utils.get_meeting_channel_layer()
+    host_channel: str = await channel_layer.new_channel()
+    await channel_layer.group_add(
+        f"{GroupPrefixes.HOST}{meeting.access_code}", host_channel
+    )
+
+    await lifecycle.start_meeting(meeting.access_code, duration_seconds=0)
+    end_message = await asyncio.wait_for(channel_layer.receive(host_channel), 2)
+    assert end_message["type"] == MessageTypes.END_MEETING
+    assert not await lifecycle.claim_meeting_end(meeting.access_code)
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_live_state_is_checkpointed_until_the_meeting_ends(
+    meeting: Meeting, redis_client: fakeredis.FakeAsyncRedis
+) -> None:
+    """The checkpoint should stand in for a lost state hash and go away on end."""
+    await lifecycle.start_meeting(
+        meeting.access_code,
+        duration_seconds=600,
+        current_question={"question_index": 0},
+        meeting_id=meeting.id,
+    )
+    await lifecycle.record_question_presented(
+        meeting.access_code, current_question={"question_index": 1}
+    )
+    live_state = await lifecycle.get_live_state(meeting.access_code)
+    assert live_state is not None
+    assert live_state.current_question == {"question_index": 1}
+    assert 590 <= live_state.get_remaining_seconds() <= 600
+
+    assert await lifecycle.meeting_checkpointer.checkpoint() == 1
+    meeting_session = await MeetingSession.objects.aget(meeting=meeting)
+    assert meeting_session.current_question_index == 1
+
+    # NOTE: Simulate the loss of the Redis state hash
+    await redis_client.delete(lifecycle.get_meeting_state_key(meeting.access_code))
+    restored_state = await lifecycle.get_live_state(meeting.access_code)
+    assert restored_state is not None
+    assert restored_state.current_question_index == 1
+    assert restored_state.get_remaining_seconds() > 0
+
+    assert await lifecycle.end_meeting_if_claimed(meeting.access_code)
+    assert not await MeetingSession.objects.filter(meeting=meeting).aexists()
+    assert await lifecycle.get_live_state(meeting.access_code) is None
+    assert await lifecycle.meeting_checkpointer.checkpoint() == 0
@@ -0,0 +1,82 @@
+import time
+from collections.abc import Iterable
+
+import fakeredis
+import pytest
+from redis.asyncio import Redis
+
+from apps.meeting import presence, store
+from apps.meeting.presence import PresenceHeartbeat
+
+
+# ---------- Tests ----------
+async def test_live_count_tracks_joins_and_leaves() -> None:
+    """The live count should go down when participants leave."""
+    assert await presence.mark_present("ABC12345", "Alice") == 1
+    assert await presence.mark_present("ABC12345", "Bob") == 2
+    assert await presence.mark_absent("ABC12345", "Alice") == 1
+    assert await presence.get_live_count("ABC12345") == 1
+    assert await presence.get_total_joined_count("ABC12345") == 2
+
+
+async def test_stale_entries_are_pruned(
+    redis_client: fakeredis.FakeAsyncRedis,
+) -> None:
+    """Participants whose worker stopped sending heartbeats should not count."""
+    await presence.mark_present("ABC12345", "Alice")
+    await redis_client.zadd(
+        presence.get_presence_key("ABC12345"),
+        {"Ghost": time.time() - presence.PRESENCE_TTL_SECONDS - 1},
+    )
+    assert await presence.get_live_count("ABC12345") == 1
+    assert await presence.get_roster("ABC12345") == ["Alice"]
+
+
+async def test_heartbeat_refreshes_local_participants(
+    redis_client: fakeredis.FakeAsyncRedis,
+) -> None:
+    """A beat should refresh tracked participants but never resurrect others."""
+    presence_key = presence.get_presence_key("ABC12345")
+    await redis_client.zadd(presence_key, {"Alice": 1.0})
+    heartbeat = PresenceHeartbeat(interval=60)
+    heartbeat._local_participants["ABC12345"].update({"Alice", "Gone"})
+
+    await heartbeat.beat()
+
+    assert await redis_client.zscore(presence_key, "Alice") > 1.0
+    assert await redis_client.zscore(presence_key, "Gone") is None
+
+
+async def test_heartbeat_survives_participants_leaving_mid_beat(
+    redis_client: fakeredis.FakeAsyncRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A meeting emptied during a beat should not break the next beats."""
+    heartbeat = PresenceHeartbeat(interval=60)
+    heartbeat.track("ABC12345", "Alice")
+    heartbeat.track("XYZ98765", "Bob")
+    await presence.mark_present("XYZ98765", "Bob")
+    group_by_client = store.group_by_client
+
+    def group_by_client_then_leave(
+        meeting_access_codes: Iterable[str],
+    ) -> dict[Redis, list[str]]:
+        meetings_by_client = group_by_client(meeting_access_codes)
+        heartbeat.untrack("ABC12345", "Alice")
+        return meetings_by_client
+
+    monkeypatch.setattr(store, "group_by_client", group_by_client_then_leave)
+    await heartbeat.beat()
+    monkeypatch.setattr(store, "group_by_client", group_by_client)
+    await redis_client.zadd(presence.get_presence_key("XYZ98765"), {"Bob": 1.0})
+    await heartbeat.beat()
+
+    assert "ABC12345" not in heartbeat._local_participants
+    assert await redis_client.zscore(presence.get_presence_key("XYZ98765"), "Bob") > 1.0
+
+
+async def test_clear_presence_removes_meeting_keys() -> None:
+    """Clearing the meeting should reset both the roster and the join counter."""
+    await presence.mark_present("ABC12345", "Alice")
+    await presence.clear_presence("ABC12345")
+    assert await presence.get_roster("ABC12345") == []
+    assert await presence.get_total_joined_count("ABC12345") == 0
@@ -0,0 +1,64 @@
+import fakeredis
+import pytest
+
+from apps.director.models import Meeting
+from apps.meeting import presence, reconnect
+from apps.meeting.models import ParticipantSession
+
+
+# ---------- Tests ----------
+@pytest.mark.django_db(transaction=True)
+async def test_participant_session_round_trips_through_its_token(
+    meeting: Meeting,
+) -> None:
+    """A token should resolve to the display name and session it was issued for."""
+    token, participant_session_id = await reconnect.create_participant_session(
+        "ABC12345", meeting.id, "Alice", "channel-1"
+    )
+    participant_session = await ParticipantSession.objects.aget(sessiontoken=token)
+    assert participant_session.id == participant_session_id
+
+    resumed_participant = await reconnect.find_participant_session("ABC12345", token)
+    assert resumed_participant == reconnect.ResumedParticipant(
+        display_name="Alice",
+        participant_session_id=participant_session_id,
+        current_question=None,
+    )
+    assert await reconnect.find_participant_session("ABC12345", "unknown") is None
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_departure_is_cancelled_by_a_resume(meeting: Meeting) -> None:
+    """A departure deferred for a dropped connection should not remove a resumed one."""
+    token, _ = await reconnect.create_participant_session(
+        "ABC12345", meeting.id, "Alice", "channel-1"
+    )
+    await presence.mark_present("ABC12345", "Alice")
+    await reconnect.resume_participant_session("ABC12345", token, "channel-2")
+
+    assert not await reconnect.complete_departure(
+        "ABC12345", token, "Alice", "channel-1"
+    )
+    assert await presence.get_live_count("ABC12345") == 1
+
+    assert await reconnect.complete_departure("ABC12345", token, "Alice", "channel-2")
+    assert await presence.get_live_count("ABC12345") == 0
+    assert await reconnect.find_participant_session("ABC12345", token) is None
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_sessions_are_not_resumed_after_the_departure(
+    meeting: Meeting, redis_client: fakeredis.FakeAsyncRedis
+) -> None:
+    """A resume racing a completed departure should not recreate the session."""
+    token, _ = await reconnect.create_participant_session(
+        "ABC12345", meeting.id, "Alice", "channel-1"
+    )
+    assert await reconnect.complete_departure("ABC12345", token, "Alice", "channel-1")
+
+    assert not await reconnect.resume_participant_session(
+        "ABC12345", token, "channel-2"
+    )
+    assert not await redis_client.exists(
+        reconnect.get_participant_session_key("ABC12345", token)
+    )
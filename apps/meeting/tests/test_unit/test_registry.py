@@ -0,0 +1,47 @@
+import asyncio
+
+from apps.meeting import registry
+
+
+# ---------- Tests ----------
+async def test_register_requires_open_registry() -> None:
+    """Participants cannot join before the host has opened the meeting."""
+    assert await registry.register_participant("ABC12345", "Alice") is None
+
+
+async def test_duplicate_names_receive_suffixes() -> None:
+    """Repeated names should be numbered in join order."""
+    await registry.open_registry("ABC12345")
+    assert await registry.register_participant("ABC12345", "Bob") == "Bob"
+    assert await registry.register_participant("ABC12345", "Bob") == "Bob(1)"
+    assert await registry.register_participant("ABC12345", "Bob") == "Bob(2)"
+    assert await registry.register_participant("ABC12345", "Alice") == "Alice"
+
+
+async def test_literal_suffix_does_not_produce_duplicates() -> None:
+    """A typed-in "Bob(1)" must not collide with a generated suffix."""
+    await registry.open_registry("ABC12345")
+    assert await registry.register_participant("ABC12345", "Bob(1)") == "Bob(1)"
+    assert await registry.register_participant("ABC12345", "Bob") == "Bob"
+    assert await registry.register_participant("ABC12345", "Bob") == "Bob(2)"
+
+
+async def test_join_storm_never_loses_names() -> None:
+    """Concurrent joins with the same name should all get distinct names."""
+    await registry.open_registry("ABC12345")
+    assigned_names = await asyncio.gather(
+        *(registry.register_participant("ABC12345", "Sam") for _ in range(50))
+    )
+    assert len(set(assigned_names)) == 50
+    assert await registry.get_participant_names("ABC12345") == set(assigned_names)
+
+
+async def test_unregister_and_close_registry() -> None:
+    """Leaving releases the name; closing removes the meeting's keys."""
+    await registry.open_registry("ABC12345")
+    await registry.register_participant("ABC12345", "Alice")
+    await registry.unregister_participant("ABC12345", "Alice")
+    assert await registry.get_participant_names("ABC12345") == set()
+
+    await registry.close_registry("ABC12345")
+    assert await registry.register_participant("ABC12345", "Alice") is None
@@ -0,0 +1,98 @@
+import os
+
+import pytest
+from django.test import override_settings
+
+from apps.meeting import presence, registry, sharding, store
+from apps.meeting.broadcast import get_fanout_group_name
+from apps.meeting.constants import GroupPrefixes
+from apps.meeting.sharding import MeetingShardedChannelLayer
+from apps.meeting.store import get_redis_client
+
+# NOTE: e.g. "redis://127.0.0.1:6380,redis://127.0.0.1:6381" (local redis-server processes)
+TEST_SHARDS: list[str] = [
+    shard for shard in os.getenv("MEETING_REDIS_TEST_SHARDS", "").split(",") if shard
+]
+ACCESS_CODES: list[str] = [f"CODE{number:04d}" for number in range(1000)]
+
+
+# ---------- Tests ----------
+def test_shard_index_is_stable_and_in_range() -> None:
+    """A meeting should always be hashed to the same existing shard."""
+    for access_code in ACCESS_CODES[:50]:
+        shard_index = sharding.get_shard_index(access_code, 4)
+        assert 0 <= shard_index < 4
+        assert sharding.get_shard_index(access_code, 4) == shard_index
+        assert sharding.get_shard_index(access_code, 1) == 0
+
+
+def test_adding_a_shard_only_moves_meetings_to_it() -> None:
+    """Growing from 4 to 5 shards should move about a fifth of the meetings."""
+    moved_access_codes = [
+        access_code
+        for access_code in ACCESS_CODES
+        if sharding.get_shard_index(access_code, 4)
+        != sharding.get_shard_index(access_code, 5)
+    ]
+    assert all(
+        sharding.get_shard_index(access_code, 5) == 4
+        for access_code in moved_access_codes
+    )
+    assert 150 < len(moved_access_codes) < 250
+
+
+def test_every_group_of_a_meeting_shares_its_shard() -> None:
+    """Host, participant and fan-out groups should be hashed by access code."""
+    channel_layer = MeetingShardedChannelLayer(
+        hosts=["redis://127.0.0.1:6379", "redis://127.0.0.1:6380", "redis://h:6381"]
+    )
+    for access_code in ACCESS_CODES[:50]:
+        shard_index = sharding.get_shard_index(access_code, 3)
+        for group_name in (
+            f"{GroupPrefixes.HOST}{access_code}",
+            f"{GroupPrefixes.PARTICIPANT}{access_code}",
+            get_fanout_group_name(access_code),
+        ):
+            assert sharding.get_group_access_code(group_name) == access_code
+            assert channel_layer.consistent_hash(group_name) == shard_index
+    assert sharding.get_group_access_code("specific.abc!def") is None
+
+
+async def test_store_clients_follow_the_meeting_shard() -> None:
+    """Meeting keys should go to the meeting's shard, shared keys to the first."""
+    shard_urls = ["redis://127.0.0.1:6390/2", "redis://127.0.0.1:6391/2"]
+    with override_settings(MEETING_REDIS_SHARD_URLS=shard_urls):
+        assert get_redis_client().connection_pool.connection_kwargs["port"] == 6390
+        for access_code in ACCESS_CODES[:20]:
+            redis_client = get_redis_client(access_code)
+            expected_port = 6390 + sharding.get_shard_index(access_code, 2)
+            assert redis_client.connection_pool.connection_kwargs["port"] == (
+                expected_port
+            )
+            assert get_redis_client(access_code) is redis_client
+
+
+@pytest.mark.skipif(not TEST_SHARDS, reason="MEETING_REDIS_TEST_SHARDS is not set")
+async def test_meeting_keys_stay_on_one_redis_node(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Against real Redis nodes, each meeting's keys should live on its shard only."""
+    monkeypatch.setattr(store, "get_redis_client", get_redis_client)
+    shard_urls = [f"{shard}/2" for shard in TEST_SHARDS]
+    with override_settings(MEETING_REDIS_SHARD_URLS=shard_urls):
+        shard_clients = [get_redis_client(code) for code in ACCESS_CODES[:50]]
+        for access_code in ACCESS_CODES[:50]:
+            await registry.open_registry(access_code)
+            await presence.mark_present(access_code, "Alice")
+        for access_code, redis_client in zip(ACCESS_CODES[:50], shard_clients):
+            for other_client in set(shard_clients):
+                has_keys = bool(
+                    await other_client.exists(
+                        registry.get_registry_open_key(access_code),
+                        presence.get_presence_key(access_code),
+                    )
+                )
+                assert has_keys == (other_client is redis_client)
+        for access_code in ACCESS_CODES[:50]:
+            await registry.close_registry(access_code)
+            await presence.clear_presence(access_code)
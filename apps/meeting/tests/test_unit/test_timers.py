@@ -0,0 +1,42 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from apps.meeting.timers import DeadlineScheduler
+
+
+# ---------- Tests ----------
+async def test_scheduler_fires_deadlines_in_order() -> None:
+    """A single scheduler task should serve every meeting's deadline."""
+    scheduler = DeadlineScheduler()
+    fired: list[str] = []
+    all_fired = asyncio.Event()
+
+    def make_callback(key: str) -> Callable[[], Awaitable[None]]:
+        async def callback() -> None:
+            fired.append(key)
+            if len(fired) == 2:
+                all_fired.set()
+
+        return callback
+
+    scheduler.schedule("LATE", 0.05, make_callback("LATE"))
+    scheduler.schedule("EARLY", 0.01, make_callback("EARLY"))
+    await asyncio.wait_for(all_fired.wait(), timeout=1)
+    assert fired == ["EARLY", "LATE"]
+    assert not scheduler.is_scheduled("EARLY")
+
+
+async def test_cancelled_and_rescheduled_deadlines_do_not_fire() -> None:
+    """Only the latest deadline of a key fires, and cancelled ones never do."""
+    scheduler = DeadlineScheduler()
+    fired: list[str] = []
+
+    async def record(key: str) -> None:
+        fired.append(key)
+
+    scheduler.schedule("CANCELLED", 0.01, lambda: record("CANCELLED"))
+    scheduler.schedule("MOVED", 0.01, lambda: record("MOVED-EARLY"))
+    scheduler.schedule("MOVED", 0.03, lambda: record("MOVED"))
+    scheduler.cancel("CANCELLED")
+    await asyncio.sleep(0.1)
+    assert fired == ["MOVED"]
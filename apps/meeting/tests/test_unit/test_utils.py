@@ -0,0 +1,118 @@
+import asyncio
+from typing import cast
+
+import pytest
+from asgiref.sync import SyncToAsync
+from django.contrib.sessions.backends.cached_db import SessionStore
+from pytest_django import DjangoAssertNumQueries
+
+from apps.base.models import CustomUser
+from apps.director.models import Meeting
+from apps.meeting.utils import (
+    MeetingStatistics,
+    finalize_meeting,
+    get_user_from_session,
+)
+
+
+def get_user_from_session_sync(session_key: str) -> CustomUser | None:
+    """Runs `get_user_from_session` on the calling thread."""
+    wrapped = cast(SyncToAsync[[str], CustomUser | None], get_user_from_session)
+    return wrapped.func(session_key)
+
+
+# ---------- Tests ----------
+@pytest.mark.django_db(transaction=True)
+async def test_finalize_meeting_accumulates_director_counters(
+    user: CustomUser, meeting: Meeting
+) -> None:
+    """Meetings ending concurrently should both be added to the director."""
+    other_meeting = await Meeting.objects.acreate(
+        summarized_meeting={},
+        access_code="XYZ98765",
+        director=user,
+        title="Retro",
+        duration=15,
+    )
+    await asyncio.gather(
+        finalize_meeting(
+            meeting.access_code,
+            MeetingStatistics(
+                duration_seconds=600,
+                participant_count=4,
+                questions_presented_count=2,
+                responses_count=7,
+            ),
+        ),
+        finalize_meeting(
+            other_meeting.access_code,
+            MeetingStatistics(
+                duration_seconds=300,
+                participant_count=3,
+                questions_presented_count=1,
+                responses_count=5,
+            ),
+        ),
+    )
+
+    await meeting.arefresh_from_db()
+    assert meeting.duration_in_seconds == 600
+    assert meeting.participants == 4
+    assert meeting.total_questions_asked == 2
+
+    await user.arefresh_from_db()
+    assert user.meetings_created_count == 2
+    assert user.total_participants_count == 7
+    assert user.total_responses_count == 12
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_finalize_meeting_skips_out_of_range_statistics(
+    user: CustomUser, meeting: Meeting
+) -> None:
+    """Invalid statistics are not persisted, valid ones still are."""
+    finalized = await finalize_meeting(
+        meeting.access_code,
+        MeetingStatistics(
+            duration_seconds=7200,
+            participant_count=0,
+            questions_presented_count=3,
+            responses_count=0,
+        ),
+        update_director=False,
+    )
+    assert finalized
+
+    await meeting.arefresh_from_db()
+    assert meeting.duration_in_seconds == 1800
+    assert meeting.total_questions_asked == 3
+
+    await user.arefresh_from_db()
+    assert user.meetings_created_count == 0
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_finalize_unknown_meeting_returns_false() -> None:
+    """Finalizing a meeting that does not exist should be a no-op."""
+    assert not await finalize_meeting("NOPE0000", MeetingStatistics(0, 1, 0, 0))
+
+
+@pytest.mark.django_db
+def test_get_user_from_session_is_served_from_cache(
+    user: CustomUser, django_assert_num_queries: DjangoAssertNumQueries
+) -> None:
+    """Authenticating the same session again should not query the database."""
+    session = SessionStore()
+    session["_auth_user_id"] = str(user.pk)
+    session.create()
+    assert session.session_key is not None
+
+    # NOTE: Call the wrapped function to count queries on this thread
+    assert get_user_from_session_sync(session.session_key) == user
+    with django_assert_num_queries(0):
+        assert get_user_from_session_sync(session.session_key) == user
+
+
+@pytest.mark.django_db
+def test_get_user_from_session_rejects_unknown_sessions(user: CustomUser) -> None:
+    assert get_user_from_session_sync("doesnotexist12345") is None
@@ -0,0 +1,85 @@
+import io
+import sys
+
+from django.test import override_settings
+
+from apps.meeting import workers
+from apps.meeting.workers import WorkerSupervisor
+
+EXITING_COMMAND: list[str] = [sys.executable, "-c", "raise SystemExit(3)"]
+SLEEPING_COMMAND: list[str] = [sys.executable, "-c", "import time; time.sleep(60)"]
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now: float = 1000
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# ---------- Tests ----------
+def test_shared_state_errors_flag_process_local_backends() -> None:
+    """Workers should only scale out over a shared channel layer and cache."""
+    with override_settings(
+        CHANNEL_LAYERS={"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}},
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+        },
+    ):
+        assert len(workers.get_shared_state_errors()) == 2
+
+    with override_settings(
+        CHANNEL_LAYERS={
+            "default": {"BACKEND": "channels_redis.core.RedisChannelLayer"}
+        },
+        CACHES={"default": {"BACKEND": "django_redis.cache.RedisCache"}},
+    ):
+        assert workers.get_shared_state_errors() == []
+
+
+def test_workers_listen_on_consecutive_ports() -> None:
+    commands = [
+        workers.build_worker_command("collaboard.asgi:application", "127.0.0.1", port)
+        for port in (8001, 8002)
+    ]
+    assert [command[command.index("--port") + 1] for command in commands] == [
+        "8001",
+        "8002",
+    ]
+    assert all(command[-1] == "collaboard.asgi:application" for command in commands)
+
+
+def test_supervisor_restarts_exited_workers_with_backoff() -> None:
+    """A crash-looping worker should be restarted less and less often."""
+    clock = FakeClock()
+    output = io.StringIO()
+    supervisor = WorkerSupervisor(
+        [EXITING_COMMAND, SLEEPING_COMMAND], stdout=output, clock=clock
+    )
+    supervisor.start()
+    try:
+        crashing_worker, healthy_worker = supervisor.workers
+        assert crashing_worker.process is not None
+        assert healthy_worker.process is not None
+        healthy_pid: int = healthy_worker.process.pid
+        crashing_worker.process.wait()
+
+        # NOTE: Exited right away - waits for the restart delay
+        supervisor.poll()
+        first_process = crashing_worker.process
+        assert crashing_worker.process is first_process
+
+        clock.now += workers.RESTART_DELAY_SECONDS
+        supervisor.poll()
+        assert crashing_worker.process is not first_process
+        assert crashing_worker.restart_delay == workers.RESTART_DELAY_SECONDS * 2
+        assert healthy_worker.process.pid == healthy_pid
+        assert "Worker 0 exited with code 3" in output.getvalue()
+    finally:
+        supervisor.stop()
+
+    assert all(
+        worker.process is not None and worker.process.poll() is not None
+        for worker in supervisor.workers
+    )
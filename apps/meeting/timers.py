@@ -0,0 +1,126 @@
+"""
+Meeting Timers Module
+
+This module provides the process-wide scheduler of meeting deadlines.
+
+`DeadlineScheduler` owns the auto-end deadline of every meeting started in
+the process; a single task sleeps until the earliest deadline instead of
+one sleeping task (and one polling counter) per meeting. Durations are
+measured from the start recorded in Redis (see `lifecycle.py`).
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class DeadlineScheduler:
+    """
+    Runs a callback once its deadline is reached.
+
+    Deadlines are kept in a min-heap keyed by their monotonic due time.
+    Cancelled or rescheduled entries stay in the heap and are skipped
+    when popped, so `schedule` and `cancel` are O(log n) and O(1).
+    """
+
+    def __init__(self) -> None:
+        self._deadline_heap: list[tuple[float, int, str]] = []
+        self._scheduled: dict[str, tuple[int, Callable[[], Awaitable[object]]]] = {}
+        self._sequence = itertools.count()
+        self._scheduler_task: asyncio.Task[None] | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._running_callbacks: set[asyncio.Task[None]] = set()
+
+    def schedule(
+        self, key: str, delay_seconds: float, callback: Callable[[], Awaitable[object]]
+    ) -> None:
+        """
+        Schedules a callback, replacing any deadline already set for the key.
+
+        Args:
+            key: Identifies the deadline (e.g. the meeting access code)
+            delay_seconds: Seconds from now until the callback is run
+            callback: Coroutine function awaited once the deadline is reached;
+                its result is ignored
+        """
+        self._ensure_running()
+        sequence: int = next(self._sequence)
+        self._scheduled[key] = (sequence, callback)
+        heapq.heappush(
+            self._deadline_heap, (time.monotonic() + delay_seconds, sequence, key)
+        )
+        if self._wakeup:
+            self._wakeup.set()
+
+    def cancel(self, key: str) -> None:
+        """
+        Cancels the deadline of the key, if any.
+
+        Args:
+            key: Identifies the deadline (e.g. the meeting access code)
+        """
+        self._scheduled.pop(key, None)
+
+    def is_scheduled(self, key: str) -> bool:
+        """Returns whether the key has a pending deadline"""
+        return key in self._scheduled
+
+    def _ensure_running(self) -> None:
+        running_loop = asyncio.get_running_loop()
+        if (
+            self._scheduler_task
+            and not self._scheduler_task.done()
+            and self._scheduler_task.get_loop() is running_loop
+        ):
+            return
+        # NOTE: Leftovers are stale entries or deadlines of a closed event loop
+        self._deadline_heap.clear()
+        self._scheduled.clear()
+        self._wakeup = asyncio.Event()
+        self._scheduler_task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            self._fire_due_deadlines()
+            if not self._scheduled:
+                # NOTE: Idle workers keep no task around; `schedule` restarts it
+                return
+            timeout: float | None = None
+            if self._deadline_heap:
+                timeout = max(self._deadline_heap[0][0] - time.monotonic(), 0)
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except TimeoutError:
+                pass
+
+    def _fire_due_deadlines(self) -> None:
+        now: float = time.monotonic()
+        while self._deadline_heap and self._deadline_heap[0][0] <= now:
+            _, sequence, key = heapq.heappop(self._deadline_heap)
+            scheduled_entry = self._scheduled.get(key)
+            if scheduled_entry is None or scheduled_entry[0] != sequence:
+                # NOTE: Cancelled or rescheduled since it was pushed
+                continue
+            del self._scheduled[key]
+            # ? Callbacks run in their own task so a slow one never delays the others
+            callback_task = asyncio.create_task(self._run_callback(scheduled_entry[1]))
+            self._running_callbacks.add(callback_task)
+            callback_task.add_done_callback(self._running_callbacks.discard)
+
+    @staticmethod
+    async def _run_callback(callback: Callable[[], Awaitable[object]]) -> None:
+        try:
+            await callback()
+        except Exception:
+            logger.exception("Meeting deadline callback failed")
+
+
+# NOTE: Shared by every host consumer in this process
+meeting_deadlines = DeadlineScheduler()
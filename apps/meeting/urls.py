@@ -3,6 +3,7 @@ from django.urls import path
 from apps.meeting import views
 
 urlpatterns = [
+    path("metrics/", view=views.meeting_metrics, name="meeting-metrics"),
     path("<str:meeting_id>/host/", view=views.host_meeting, name="host-meeting"),
     path(
         "<str:access_code>/participant/",
@@ -8,22 +8,28 @@ and meeting lifecycle management functions.
 Functions are categorized as:
 - Database query operations (async database access)
 - Authentication and session management
-- Meeting statistics and duration tracking
+- Meeting statistics persistence
 - Cache key generation and management
 """
 
-import asyncio
 import uuid
-from typing import NamedTuple
+from importlib import import_module
+from typing import Any, NamedTuple
 
-from asgiref.sync import sync_to_async
 from channels.db import database_sync_to_async
-from django.contrib.sessions.models import Session
-from django.core.exceptions import ValidationError
+from channels.layers import BaseChannelLayer, get_channel_layer
+from django.conf import settings
+from django.contrib.sessions.backends.base import SessionBase
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
 
 from apps.base.models import CustomUser
 from apps.director.models import Meeting, Question
-from apps.meeting.models import Response
+
+SESSION_USER_CACHE_TIMEOUT_SECONDS: int = 60  # Account changes apply within a minute
 
 
 class MeetingData(NamedTuple):
@@ -192,148 +198,79 @@ def get_question_by_description_and_access_code(
         return None
 
 
-async def set_participant_count(
-    meeting_access_code: str, participant_count: int
-) -> bool:
+class MeetingStatistics(NamedTuple):
     """
-    Updates the participant count field for a meeting.
+    Final statistics of a meeting, persisted once when it ends.
 
-    Validates count is within acceptable range before updating.
+    Attributes:
+        duration_seconds: Actual meeting duration in seconds (0-3600)
+        participant_count: Number of participants that joined (1-1000)
+        questions_presented_count: Number of questions presented (0-20)
+        responses_count: Number of answers submitted during the meeting
+    """
 
-    Args:
-        meeting_access_code: The unique access code of the meeting
-        participant_count: The number of participants to set (1-1000)
+    duration_seconds: int
+    participant_count: int
+    questions_presented_count: int
+    responses_count: int
 
-    Returns:
-        True if update was successful; False if meeting not found or count invalid
 
-    Validation:
-        - Participant count must be between 1 and 1000 inclusive
-        - Meeting must exist in database
-    """
-    meeting_instance: Meeting | None = await get_meeting_by_access_code(
-        access_code=meeting_access_code
-    )
-    if not meeting_instance:
-        # ! This should never happen during normal meeting flow
-        return False
-
-    # NOTE: Validate participant count is within reasonable bounds
-    if 0 < participant_count <= 1000:
-        meeting_instance.participants = participant_count
-        await database_sync_to_async(meeting_instance.save)()
-        return True
-    else:
-        # ! Invalid participant count - consider logging this
-        return False
-
-
-async def set_meeting_duration_seconds_field(
-    meeting_access_code: str, duration_seconds: int
+@database_sync_to_async
+def finalize_meeting(
+    meeting_access_code: str,
+    statistics: MeetingStatistics,
+    update_director: bool = True,
 ) -> bool:
     """
-    Updates the actual meeting duration in seconds.
+    Persists the final meeting statistics and the director's counters atomically.
 
-    This records how long the meeting actually lasted, not the allocated time.
+    Both writes are targeted UPDATE statements, so ending a meeting costs two
+    queries and never overwrites unrelated columns. Director counters are
+    incremented with F() expressions, so two meetings ending concurrently
+    cannot lose each other's updates.
 
     Args:
         meeting_access_code: The unique access code of the meeting
-        duration_seconds: Actual meeting duration in seconds (0-3600)
+        statistics: The final statistics of the meeting
+        update_director: Whether to add the statistics to the director's counters
 
     Returns:
-        True if update was successful; False if meeting not found or duration invalid
+        True if the meeting was finalized; False if the meeting was not found
 
     Validation:
+        Out of range statistics are not persisted, the remaining fields still are:
         - Duration must be between 0 and 3600 seconds (1 hour max)
-        - Meeting must exist in database
-    """
-    meeting_instance: Meeting | None = await get_meeting_by_access_code(
-        access_code=meeting_access_code
-    )
-    if not meeting_instance:
-        # ! This should never happen during normal meeting flow
-        return False
-
-    # NOTE: Validate duration is within acceptable range (max 1 hour)
-    if 0 <= duration_seconds <= 3600:
-        meeting_instance.duration_in_seconds = duration_seconds
-        await database_sync_to_async(meeting_instance.save)()
-        return True
-    else:
-        # ! Invalid duration - consider logging this anomaly
-        return False
-
-
-async def set_total_questions_asked(
-    meeting_access_code: str, questions_presented_count: int
-) -> bool:
-    """
-    Updates the total number of questions presented during the meeting.
-
-    Args:
-        meeting_access_code: The unique access code of the meeting
-        questions_presented_count: Number of questions actually presented (0-20)
-
-    Returns:
-        True if update was successful; False if meeting not found or count invalid
-
-    Validation:
+        - Participant count must be between 1 and 1000 inclusive
         - Question count must be between 0 and 20 inclusive
-        - Meeting must exist in database
-    """
-    meeting_instance: Meeting | None = await get_meeting_by_access_code(
-        access_code=meeting_access_code
-    )
-    if not meeting_instance:
-        # ! This should never happen during normal meeting flow
-        return False
-
-    # NOTE: Validate question count is within system limits
-    if 0 <= questions_presented_count <= 20:
-        meeting_instance.total_questions_asked = questions_presented_count
-        await database_sync_to_async(meeting_instance.save)()
-        return True
-    else:
-        # ! Invalid question count - system allows max 20 questions
-        return False
-
-
-async def create_response_model(
-    meeting_instance: Meeting,
-    question_instance: Question,
-    participant_response_text: str,
-) -> Response | None:
     """
-    Creates and validates a new Response model instance.
-
-    Performs full model validation before returning the instance.
-    The response is not saved to database - caller must save it.
-
-    Args:
-        meeting_instance: The Meeting this response belongs to
-        question_instance: The Question being answered
-        participant_response_text: The participant's answer text
-
-    Returns:
-        Valid Response instance ready for saving; None if validation fails
-
-    Validation:
-        Uses Django's full_clean() to validate all model constraints
-        including custom validators, field constraints, and business rules.
-    """
-    new_response_instance = Response(
-        meeting=meeting_instance,
-        question=question_instance,
-        response_text=participant_response_text,
-    )
-
-    try:
-        # NOTE: Validate response according to model constraints
-        await sync_to_async(new_response_instance.full_clean)()
-        return new_response_instance
-    except ValidationError:
-        # NOTE: Response validation failed (e.g., text too long, invalid content)
-        return None
+    # NOTE: update() bypasses auto_now, so the timestamp is set explicitly
+    now = timezone.now()
+    meeting_fields: dict[str, Any] = {"updated_at": now}
+    if 0 <= statistics.duration_seconds <= 3600:
+        meeting_fields["duration_in_seconds"] = statistics.duration_seconds
+    if 0 < statistics.participant_count <= 1000:
+        meeting_fields["participants"] = statistics.participant_count
+    if 0 <= statistics.questions_presented_count <= 20:
+        meeting_fields["total_questions_asked"] = statistics.questions_presented_count
+
+    with transaction.atomic():
+        updated_meeting_count: int = Meeting.objects.filter(
+            access_code=meeting_access_code
+        ).update(**meeting_fields)
+        if not updated_meeting_count:
+            # ! This should never happen during normal meeting flow
+            return False
+
+        if update_director:
+            CustomUser.objects.filter(meeting__access_code=meeting_access_code).update(
+                meetings_created_count=F("meetings_created_count") + 1,
+                total_participants_count=F("total_participants_count")
+                + max(statistics.participant_count, 0),
+                total_responses_count=F("total_responses_count")
+                + max(statistics.responses_count, 0),
+                updated_at=now,
+            )
+    return True
 
 
 def get_username_cache_key(meeting_access_code: str) -> str:
@@ -375,58 +312,60 @@ def get_user_from_session(session_key: str) -> CustomUser | None:
         - Ensures user account still exists and is active
         - Returns None for any authentication failure
 
+    Performance:
+        - Sessions are read through `SESSION_ENGINE` (cache first with `cached_db`)
+        - Users are cached for `SESSION_USER_CACHE_TIMEOUT_SECONDS`, so a host
+          reconnecting or authenticating again costs no database query
+
     ! SECURITY WARNING: In production, session keys should not be passed
     via URL parameters. Use secure headers or WebSocket subprotocols instead.
     """
-    try:
-        # NOTE: Retrieve session from Django's session store
-        session_instance = Session.objects.get(session_key=session_key)
-
-        # NOTE: Decode session data to extract user ID
-        decoded_session_data = session_instance.get_decoded()
-        user_id = decoded_session_data.get("_auth_user_id")
-
-        if user_id:
-            return CustomUser.objects.get(pk=user_id)
+    # NOTE: Expired or unknown sessions load as empty
+    session_store: SessionBase = import_module(settings.SESSION_ENGINE).SessionStore(
+        session_key=session_key
+    )
+    user_id: str | None = session_store.get("_auth_user_id")
+    if not user_id:
+        return None
 
-    except (Session.DoesNotExist, CustomUser.DoesNotExist):
-        # NOTE: Session expired, invalid, or user no longer exists
-        pass
+    user_cache_key: str = get_session_user_cache_key(user_id)
+    cached_user: CustomUser | None = cache.get(user_cache_key)
+    if cached_user is not None:
+        return cached_user
 
-    return None
+    try:
+        user: CustomUser = CustomUser.objects.get(pk=user_id)
+    except CustomUser.DoesNotExist:
+        # NOTE: User no longer exists
+        return None
+    cache.set(user_cache_key, user, timeout=SESSION_USER_CACHE_TIMEOUT_SECONDS)
+    return user
 
 
-async def meeting_duration_counter() -> int:
+def get_session_user_cache_key(user_id: str | int) -> str:
     """
-    Tracks meeting elapsed time in seconds with cancellation support.
+    Generates the cache key of a user authenticated over WebSocket.
 
-    This is a background task that counts seconds until cancelled.
-    Used to track actual meeting duration regardless of allocated time.
+    Args:
+        user_id: Primary key of the user stored in the session
 
     Returns:
-        - Total elapsed seconds when task is cancelled
+        Formatted cache key string
 
-    ! CRITICAL: This task MUST be manually cancelled to prevent infinite loop.
-    The task runs indefinitely until cancelled via asyncio.CancelledError.
+    Format:
+        "session_user:{user_id}"
+    """
+    return f"session_user:{user_id}"
 
-    Usage:
-        ```python
-        duration_task = asyncio.create_task(meeting_duration_counter())
-        # ... meeting activities ...
-        duration_task.cancel()
-        try:
-            actual_duration = await duration_task
-        except asyncio.CancelledError:
-            # Task was cancelled as expected
-            pass
-        ```
+
+def get_meeting_channel_layer() -> BaseChannelLayer:
     """
-    elapsed_seconds_counter: int = 1
+    Returns the channel layer shared by every worker serving meetings.
 
-    try:
-        while True:
-            await asyncio.sleep(1)
-            elapsed_seconds_counter += 1
-    except asyncio.CancelledError:
-        # NOTE: Task cancelled - return elapsed time
-        return elapsed_seconds_counter
+    Raises:
+        ImproperlyConfigured: If `CHANNEL_LAYERS` is not configured
+    """
+    channel_layer: BaseChannelLayer | None = get_channel_layer()
+    if channel_layer is None:
+        raise ImproperlyConfigured("Meetings require a default channel layer")
+    return channel_layer
@@ -1,9 +1,12 @@
 from django.contrib.auth.decorators import login_not_required, login_required
+from django.core.exceptions import PermissionDenied
 from django.http import Http404, HttpRequest, HttpResponse
 from django.shortcuts import redirect, render
 from django.urls import reverse
 
 from apps.director.models import Meeting
+from apps.meeting.constants import MAX_PARTICIPANT_NAME_LENGTH
+from apps.meeting.instrumentation import Instrumentation, get_instrumentation
 
 
 @login_required
@@ -22,7 +25,7 @@ def host_meeting(request: HttpRequest, meeting_id: str) -> HttpResponse:
 @login_not_required
 def participant_meeting(request: HttpRequest, access_code: str) -> HttpResponse:
     participant_name: str | None = request.POST.get("participantName", None)
-    if not participant_name or len(participant_name) > 30:
+    if not participant_name or len(participant_name) > MAX_PARTICIPANT_NAME_LENGTH:
         raise Http404("Invalid Name")
     try:
         meeting: Meeting = Meeting.objects.get(access_code=access_code)
@@ -54,3 +57,16 @@ def meeting_locked(request: HttpRequest) -> HttpResponse:
 
 def post_meeting_participant(request: HttpRequest) -> HttpResponse:
     return render(request, template_name="meeting/post_meeting.html")
+
+
+@login_required
+def meeting_metrics(request: HttpRequest) -> HttpResponse:
+    # NOTE: Metrics of the worker serving this request, in Prometheus text format
+    if not request.user.is_staff:
+        raise PermissionDenied
+    instrumentation: Instrumentation | None = get_instrumentation()
+    if instrumentation is None:
+        raise Http404("Instrumentation is disabled")
+    return HttpResponse(
+        instrumentation.render(), content_type="text/plain; version=0.0.4"
+    )
@@ -0,0 +1,194 @@
+"""
+Meeting Workers Module
+
+This module runs the ASGI application in several daphne worker processes.
+
+A single daphne process serves every socket on one core. Meeting state lives
+in Redis (presence, registry, live state, deadlines, answer insights) and
+consumers only keep per-connection attributes, so any worker can serve any
+host or participant of a meeting as long as every worker shares:
+- a Redis channel layer, so groups and fan-out span workers
+- a shared cache, so sessions and rate limits are seen by every worker
+
+`WorkerSupervisor` starts N workers on consecutive ports, restarts the ones
+that exit and stops them all on SIGINT/SIGTERM (see `run_meeting_workers`).
+The reverse proxy spreads connections across the ports and keeps the
+participants of a meeting on one worker (see README), so each broadcast is
+fanned out by a single worker.
+"""
+
+import signal
+import subprocess
+import sys
+import time
+from io import TextIOBase
+from typing import Any, Callable, TextIO
+
+from django.conf import settings
+
+# NOTE: Backends that keep their data inside the process
+PROCESS_LOCAL_CHANNEL_LAYERS: frozenset[str] = frozenset(
+    {"channels.layers.InMemoryChannelLayer"}
+)
+PROCESS_LOCAL_CACHES: frozenset[str] = frozenset(
+    {
+        "django.core.cache.backends.locmem.LocMemCache",
+        "django.core.cache.backends.dummy.DummyCache",
+    }
+)
+
+RESTART_DELAY_SECONDS: float = 1  # Delay before restarting a worker that exited
+MAX_RESTART_DELAY_SECONDS: float = 30  # Cap of the delay for crash-looping workers
+MIN_UPTIME_SECONDS: float = 10  # Workers exiting sooner are crash-looping
+STOP_TIMEOUT_SECONDS: float = 10  # Grace period before workers are killed
+POLL_INTERVAL_SECONDS: float = 0.5
+
+
+def get_shared_state_errors() -> list[str]:
+    """
+    Lists the settings that prevent workers from sharing meeting state.
+
+    Returns:
+        One message per process-local backend; empty when workers can scale out
+    """
+    errors: list[str] = []
+    channel_layer_backend: str | None = (
+        getattr(settings, "CHANNEL_LAYERS", {}).get("default", {}).get("BACKEND")
+    )
+    if channel_layer_backend is None:
+        errors.append("No default channel layer is configured")
+    elif channel_layer_backend in PROCESS_LOCAL_CHANNEL_LAYERS:
+        errors.append(f"Channel layer {channel_layer_backend} is process-local")
+    cache_backend: str = str(settings.CACHES["default"]["BACKEND"])
+    if cache_backend in PROCESS_LOCAL_CACHES:
+        errors.append(f"Cache {cache_backend} is process-local")
+    return errors
+
+
+def build_worker_command(application: str, bind: str, port: int) -> list[str]:
+    """
+    Builds the command line of a daphne worker.
+
+    Args:
+        application: Dotted path of the ASGI application
+        bind: Interface the worker listens on
+        port: Port the worker listens on
+
+    Returns:
+        The arguments of the worker process
+    """
+    return [
+        sys.executable,
+        "-m",
+        "daphne",
+        "--bind",
+        bind,
+        "--port",
+        str(port),
+        # NOTE: Workers sit behind the reverse proxy
+        "--proxy-headers",
+        application,
+    ]
+
+
+class Worker:
+    """A supervised worker process and its restart bookkeeping"""
+
+    __slots__ = ("index", "command", "process", "started_at", "restart_delay")
+
+    def __init__(self, index: int, command: list[str]) -> None:
+        self.index: int = index
+        self.command: list[str] = command
+        self.process: subprocess.Popen[Any] | None = None
+        self.started_at: float = 0
+        self.restart_delay: float = RESTART_DELAY_SECONDS
+
+
+class WorkerSupervisor:
+    """
+    Starts N worker processes and keeps them running until stopped.
+
+    Args:
+        commands: Command line of each worker
+        stdout: Stream receiving the supervisor's status lines
+        clock: Monotonic clock, replaceable in tests
+    """
+
+    def __init__(
+        self,
+        commands: list[list[str]],
+        stdout: TextIO | TextIOBase = sys.stdout,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.workers: list[Worker] = [
+            Worker(index, command) for index, command in enumerate(commands)
+        ]
+        self.stdout: TextIO | TextIOBase = stdout
+        self.clock: Callable[[], float] = clock
+        self.is_stopping: bool = False
+
+    def start(self) -> None:
+        """Starts every worker"""
+        for worker in self.workers:
+            self._start_worker(worker)
+
+    def poll(self) -> None:
+        """Restarts the workers that exited, backing off when they crash-loop"""
+        now: float = self.clock()
+        for worker in self.workers:
+            if worker.process is None or worker.process.poll() is None:
+                continue
+            uptime: float = now - worker.started_at
+            if uptime >= MIN_UPTIME_SECONDS:
+                worker.restart_delay = RESTART_DELAY_SECONDS
+            elif uptime < worker.restart_delay:
+                # NOTE: Crash-looping workers start at most once per `restart_delay`
+                continue
+            else:
+                worker.restart_delay = min(
+                    worker.restart_delay * 2, MAX_RESTART_DELAY_SECONDS
+                )
+            self.stdout.write(
+                f"Worker {worker.index} exited with code "
+                f"{worker.process.returncode}, restarting\n"
+            )
+            self._start_worker(worker)
+
+    def stop(self) -> None:
+        """Terminates every worker, killing those that outlive the grace period"""
+        self.is_stopping = True
+        running_processes: list[subprocess.Popen[Any]] = [
+            worker.process
+            for worker in self.workers
+            if worker.process is not None and worker.process.poll() is None
+        ]
+        for process in running_processes:
+            process.terminate()
+        deadline: float = time.monotonic() + STOP_TIMEOUT_SECONDS
+        for process in running_processes:
+            try:
+                process.wait(timeout=max(deadline - time.monotonic(), 0))
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+    def run(self) -> None:
+        """Supervises the workers until SIGINT or SIGTERM"""
+
+        def request_stop(signal_number: int, frame: Any) -> None:
+            self.is_stopping = True
+
+        signal.signal(signal.SIGINT, request_stop)
+        signal.signal(signal.SIGTERM, request_stop)
+        self.start()
+        try:
+            while not self.is_stopping:
+                time.sleep(POLL_INTERVAL_SECONDS)
+                self.poll()
+        finally:
+            self.stop()
+
+    def _start_worker(self, worker: Worker) -> None:
+        worker.process = subprocess.Popen(worker.command)
+        worker.started_at = self.clock()
+        self.stdout.write(f"Worker {worker.index} started (pid {worker.process.pid})\n")
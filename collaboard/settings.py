@@ -67,6 +67,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
+    "apps.base.middleware.SessionRefreshMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
@@ -75,9 +76,12 @@ MIDDLEWARE = [
     "django_ratelimit.middleware.RatelimitMiddleware",
 ]
 # Session configuration for WebSocket compatibility
-SESSION_ENGINE = "django.contrib.sessions.backends.db"
+# Sessions are read from the Redis cache and only fall back to the database
+SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
 SESSION_COOKIE_AGE = 3600  # 1 hour
-SESSION_SAVE_EVERY_REQUEST = True
+# Sliding expiry is kept by `SessionRefreshMiddleware` instead of a save per request
+SESSION_SAVE_EVERY_REQUEST = False
+SESSION_REFRESH_INTERVAL_SECONDS = 300
 SESSION_COOKIE_HTTPONLY = False  # Allow WebSocket access
 SESSION_COOKIE_SAMESITE = "Lax"
 USE_X_FORWARDED_HOST = True
@@ -129,6 +133,21 @@ CACHES = {
     }
 }
 
+# Native Redis structures (sets, hashes, counters) used by the meeting consumers
+MEETING_REDIS_URL = "redis://127.0.0.1:6379/2"  # Database 2
+
+# Per-process consumer metrics exposed to staff at `meeting/metrics/` (None disables)
+MEETING_INSTRUMENTATION_BACKEND = "apps.meeting.instrumentation.InMemoryInstrumentation"
+# Answers, joins and leaves reach the host as one delta per window (0 disables)
+MEETING_HOST_UPDATE_INTERVAL_SECONDS = 0.25
+# Live per-question answer counts, top terms and latest answers sent to hosts (0 disables)
+MEETING_ANSWER_INSIGHTS_INTERVAL_SECONDS = 1.0
+
+# Meeting summaries are generated by `run_summary_worker` processes (see `apps/api/jobs.py`)
+SUMMARY_BACKEND = "apps.api.summarization.OpenAISummaryBackend"
+SUMMARY_JOB_TIMEOUT_SECONDS = 300  # Running jobs older than this are requeued
+SUMMARY_MAX_CONCURRENCY = 4  # Model calls a summary runs at once (one per question or chunk)
+
 RATELIMIT_VIEW = "apps.base.views.ratelimited"
 
 # TODO: UPDATE THIS FOR PROD
@@ -144,6 +163,24 @@ CHANNEL_LAYERS = {
     },
 }
 
+# Sharded deployment: comma-separated Redis nodes, e.g. "redis://10.0.0.1:6379,redis://10.0.0.2:6379"
+# Each meeting's channel groups (database 0) and store keys (database 2) live on the node
+# picked from its access code (see `apps/meeting/sharding.py`); keep the order stable
+# Messages sent straight to a channel (not a group) keep the default channel hashing
+MEETING_REDIS_SHARDS = [
+    shard.strip() for shard in os.getenv("MEETING_REDIS_SHARDS", "").split(",") if shard.strip()
+]
+if MEETING_REDIS_SHARDS:
+    MEETING_REDIS_SHARD_URLS = [f"{shard}/2" for shard in MEETING_REDIS_SHARDS]
+    CHANNEL_LAYERS = {
+        "default": {
+            "BACKEND": "apps.meeting.sharding.MeetingShardedChannelLayer",
+            "CONFIG": {
+                "hosts": [f"{shard}/0" for shard in MEETING_REDIS_SHARDS],
+            },
+        },
+    }
+
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases